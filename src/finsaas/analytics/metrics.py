@@ -18,14 +18,20 @@ def compute_all_metrics(
     initial_capital: Decimal,
 ) -> dict[str, Decimal]:
     """Compute all performance metrics from trade results and equity curve."""
+    # Each pass over the equity curve is done once and shared by the ratios
+    returns = _equity_returns(equity_curve)
+    mean_ret = _mean(returns) if returns else None
+    ret = total_return(equity_curve, initial_capital)
+    ret_pct = total_return_pct(equity_curve, initial_capital)
+    mdd, mdd_pct = _drawdowns(equity_curve)
     return {
-        "total_return": total_return(equity_curve, initial_capital),
-        "total_return_pct": total_return_pct(equity_curve, initial_capital),
-        "sharpe_ratio": sharpe_ratio(equity_curve, initial_capital),
-        "sortino_ratio": sortino_ratio(equity_curve, initial_capital),
-        "calmar_ratio": calmar_ratio(equity_curve, initial_capital),
-        "max_drawdown": max_drawdown(equity_curve),
-        "max_drawdown_pct": max_drawdown_pct(equity_curve),
+        "total_return": ret,
+        "total_return_pct": ret_pct,
+        "sharpe_ratio": _sharpe(returns, Decimal("0"), 252, mean_ret),
+        "sortino_ratio": _sortino(returns, Decimal("0"), 252, mean_ret),
+        "calmar_ratio": _ratio(ret_pct, mdd_pct),
+        "max_drawdown": mdd,
+        "max_drawdown_pct": mdd_pct,
         "win_rate": win_rate(trades),
         "profit_factor": profit_factor(trades),
         "total_trades": Decimal(str(len(trades))),
@@ -39,7 +45,7 @@ def compute_all_metrics(
         "avg_bars_held": avg_bars_held(trades),
         "total_commission": total_commission(trades),
         "expectancy": expectancy(trades),
-        "recovery_factor": recovery_factor(equity_curve, initial_capital),
+        "recovery_factor": _ratio(ret, mdd),
     }
 
 
@@ -64,14 +70,23 @@ def sharpe_ratio(
     periods_per_year: int = 252,
 ) -> Decimal:
     """Annualized Sharpe ratio from equity curve returns."""
-    returns = _equity_returns(equity_curve)
+    return _sharpe(_equity_returns(equity_curve), risk_free_rate, periods_per_year)
+
+
+def _sharpe(
+    returns: list[Decimal],
+    risk_free_rate: Decimal,
+    periods_per_year: int,
+    mean_ret: Decimal | None = None,
+) -> Decimal:
     if len(returns) < 2:
         return Decimal("0")
 
-    mean_ret = sum(returns) / Decimal(str(len(returns)))
+    if mean_ret is None:
+        mean_ret = _mean(returns)
     excess_ret = mean_ret - risk_free_rate / Decimal(str(periods_per_year))
 
-    std = _std(returns)
+    std = _std(returns, mean_ret)
     if std == 0:
         return Decimal("0")
 
@@ -85,11 +100,20 @@ def sortino_ratio(
     periods_per_year: int = 252,
 ) -> Decimal:
     """Annualized Sortino ratio (uses downside deviation)."""
-    returns = _equity_returns(equity_curve)
+    return _sortino(_equity_returns(equity_curve), risk_free_rate, periods_per_year)
+
+
+def _sortino(
+    returns: list[Decimal],
+    risk_free_rate: Decimal,
+    periods_per_year: int,
+    mean_ret: Decimal | None = None,
+) -> Decimal:
     if len(returns) < 2:
         return Decimal("0")
 
-    mean_ret = sum(returns) / Decimal(str(len(returns)))
+    if mean_ret is None:
+        mean_ret = _mean(returns)
     target = risk_free_rate / Decimal(str(periods_per_year))
     excess_ret = mean_ret - target
 
@@ -108,42 +132,40 @@ def calmar_ratio(
     equity_curve: list[EquityPoint], initial_capital: Decimal
 ) -> Decimal:
     """Calmar ratio = annualized return / max drawdown."""
-    ret = total_return_pct(equity_curve, initial_capital)
-    mdd = max_drawdown_pct(equity_curve)
-    if mdd == 0:
-        return Decimal("0")
-    return ret / mdd
+    return _ratio(total_return_pct(equity_curve, initial_capital), max_drawdown_pct(equity_curve))
 
 
 def max_drawdown(equity_curve: list[EquityPoint]) -> Decimal:
     """Maximum drawdown in absolute terms."""
-    if not equity_curve:
-        return Decimal("0")
-    peak = equity_curve[0].equity
-    max_dd = Decimal("0")
-    for point in equity_curve:
-        if point.equity > peak:
-            peak = point.equity
-        dd = peak - point.equity
-        if dd > max_dd:
-            max_dd = dd
-    return max_dd
+    return _drawdowns(equity_curve)[0]
 
 
 def max_drawdown_pct(equity_curve: list[EquityPoint]) -> Decimal:
     """Maximum drawdown as percentage."""
+    return _drawdowns(equity_curve)[1]
+
+
+def _drawdowns(equity_curve: list[EquityPoint]) -> tuple[Decimal, Decimal]:
+    """(absolute, percentage) maximum drawdown from one pass over the curve."""
+    max_dd = Decimal("0")
+    max_dd_pct = Decimal("0")
     if not equity_curve:
-        return Decimal("0")
+        return max_dd, max_dd_pct
     peak = equity_curve[0].equity
-    max_dd_pct = Decimal("0")
+    hundred = Decimal("100")
     for point in equity_curve:
-        if point.equity > peak:
-            peak = point.equity
-        if peak > 0:
-            dd_pct = ((peak - point.equity) / peak) * Decimal("100")
+        equity = point.equity
+        if equity > peak:
+            peak = equity
+            continue
+        dd = peak - equity
+        if dd > max_dd:
+            max_dd = dd
+        if dd > 0 and peak > 0:
+            dd_pct = (dd / peak) * hundred
             if dd_pct > max_dd_pct:
                 max_dd_pct = dd_pct
-    return max_dd_pct
+    return max_dd, max_dd_pct
 
 
 def win_rate(trades: list[TradeResult]) -> Decimal:
@@ -220,11 +242,14 @@ def recovery_factor(
     equity_curve: list[EquityPoint], initial_capital: Decimal
 ) -> Decimal:
     """Total return / max drawdown."""
-    ret = total_return(equity_curve, initial_capital)
-    mdd = max_drawdown(equity_curve)
-    if mdd == 0:
+    return _ratio(total_return(equity_curve, initial_capital), max_drawdown(equity_curve))
+
+
+def _ratio(ret: Decimal, drawdown: Decimal) -> Decimal:
+    """Return over drawdown, 0 when there was no drawdown."""
+    if drawdown == 0:
         return Decimal("0")
-    return ret / mdd
+    return ret / drawdown
 
 
 def _equity_returns(equity_curve: list[EquityPoint]) -> list[Decimal]:
@@ -242,10 +267,18 @@ def _equity_returns(equity_curve: list[EquityPoint]) -> list[Decimal]:
     return returns
 
 
-def _std(values: list[Decimal]) -> Decimal:
-    """Standard deviation of a list of Decimal values."""
+def _mean(values: list[Decimal]) -> Decimal:
+    return sum(values) / Decimal(str(len(values)))
+
+
+def _std(values: list[Decimal], mean: Decimal | None = None) -> Decimal:
+    """Standard deviation of a list of Decimal values.
+
+    Pass ``mean`` when the caller already has it to skip a summing pass.
+    """
     if len(values) < 2:
         return Decimal("0")
-    mean = sum(values) / Decimal(str(len(values)))
+    if mean is None:
+        mean = _mean(values)
     variance = sum((v - mean) ** 2 for v in values) / Decimal(str(len(values)))
     return decimal_sqrt(variance)
@@ -17,12 +17,15 @@ def run_optimization(
     strategy: str = typer.Option(..., "--strategy", "-s", help="Strategy name"),
     symbol: str = typer.Option(..., "--symbol", help="Symbol ticker"),
     timeframe: str = typer.Option("1h", "--timeframe", "-tf", help="Timeframe"),
-    method: str = typer.Option("grid", "--method", "-m", help="Optimization method: grid, genetic"),
+    method: str = typer.Option(
+        "grid", "--method", "-m", help="Optimization method: grid, genetic, bayesian"
+    ),
     objective: str = typer.Option("sharpe", "--objective", "-obj", help="Objective: sharpe, sortino, return, max_dd"),
     csv_file: str = typer.Option(None, "--csv", help="CSV data file"),
     capital: float = typer.Option(10000, "--capital", "-c", help="Initial capital"),
     generations: int = typer.Option(50, "--generations", "-g", help="Generations (genetic only)"),
     population: int = typer.Option(50, "--population", help="Population size (genetic only)"),
+    max_evals: int = typer.Option(100, "--max-evals", help="Backtest budget (bayesian only)"),
     workers: int = typer.Option(1, "--workers", "-w", help="Parallel workers"),
     top_n: int = typer.Option(10, "--top", help="Show top N results"),
 ) -> None:
@@ -56,6 +59,7 @@ def run_optimization(
             max_workers=workers,
             generations=generations,
             population_size=population,
+            max_evals=max_evals,
         )
 
     # Display results
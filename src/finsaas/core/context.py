@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from decimal import Decimal
+from itertools import islice
+from typing import Any
 
+import numpy as np
+
+from finsaas.core.errors import StrategyError
 from finsaas.core.series import Series
 from finsaas.core.types import OHLCV, BarState, SymbolInfo, Timeframe
 
+_PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+
 
 class BarContext:
     """Context object passed to strategy.on_bar() each iteration.
@@ -28,6 +36,11 @@ class BarContext:
         "time",
         "_current_bar",
         "_series_registry",
+        "_history_bars",
+        "_history_column",
+        "_history",
+        "_bar_columns",
+        "_precomputed",
     )
 
     def __init__(
@@ -60,6 +73,16 @@ class BarContext:
             self.time,
         ]
 
+        # Full bar history (set by the EventLoop before on_init) and series
+        # whose values were computed up front from it
+        self._history_bars: list[OHLCV] | None = None
+        self._history_column: Callable[[str], np.ndarray] | None = None
+        self._history: dict[str, np.ndarray] = {}
+        # (series, per-bar floats) for the price series, committed without
+        # converting each bar's Decimal again
+        self._bar_columns: list[tuple[Series, list[float]]] = []  # type: ignore[type-arg]
+        self._precomputed: list[tuple[Series, list[Any], np.ndarray]] = []  # type: ignore[type-arg]
+
     @property
     def bar_index(self) -> int:
         return self._bar_index
@@ -92,6 +115,58 @@ class BarContext:
         self.register_series(s)
         return s
 
+    def load_history(
+        self, bars: list[OHLCV], column: Callable[[str], np.ndarray] | None = None
+    ) -> None:
+        """Make the full bar list available for precomputed indicators.
+
+        `column`, when given, returns a field's float64 array directly (e.g. a
+        feed's cached ``DataFeed.column``) instead of converting every bar.
+        """
+        self._history_bars = bars
+        self._history_column = column
+        self._history.clear()
+        self._bar_columns = [
+            (getattr(self, field), self.history(field).tolist()) for field in _PRICE_FIELDS
+        ]
+
+    def history(self, field: str) -> np.ndarray:
+        """float64 array of an OHLCV field over every bar of the run."""
+        values = self._history.get(field)
+        if values is None:
+            if self._history_bars is None:
+                raise StrategyError("Bar history is not loaded; precompute from on_init()")
+            if field not in _PRICE_FIELDS:
+                raise StrategyError(f"Unknown OHLCV field '{field}'")
+            if self._history_column is not None:
+                values = self._history_column(field)
+            else:
+                values = np.array(
+                    [float(getattr(bar, field)) for bar in self._history_bars],
+                    dtype=np.float64,
+                )
+            self._history[field] = values
+        return values
+
+    def create_precomputed_series(
+        self, array: np.ndarray, values: list[Any], name: str = ""
+    ) -> Series[Decimal]:
+        """Create a series whose current value is set to values[bar_index] each bar.
+
+        `array` is the raw indicator output, kept for precomputing further
+        indicators from this series.
+        """
+        s = self.create_series(name=name)
+        self._precomputed.append((s, values, array))
+        return s
+
+    def precomputed_array(self, series: Series) -> np.ndarray:  # type: ignore[type-arg]
+        """Raw values behind a series created by create_precomputed_series()."""
+        for s, _, array in self._precomputed:
+            if s is series:
+                return array
+        raise StrategyError(f"Series '{series.name}' was not precomputed")
+
     def update(self, bar: OHLCV, bar_index: int) -> None:
         """Update context with new bar data.
 
@@ -109,10 +184,22 @@ class BarContext:
         self.volume.current = bar.volume
         self.time.current = int(bar.timestamp.timestamp())
 
+        for series, values, _ in self._precomputed:
+            series.current = values[bar_index]
+
     def commit_all(self) -> None:
         """Commit all registered series. Called at end of bar processing."""
-        for series in self._series_registry:
-            series.commit()
+        columns = self._bar_columns
+        if columns:
+            # The price series lead the registry
+            i = self._bar_index
+            for series, column in columns:
+                series.commit_float(column[i])
+            for series in islice(self._series_registry, len(columns), None):
+                series.commit()
+        else:
+            for series in self._series_registry:
+                series.commit()
         self._bar_state = BarState.CONFIRMED
 
     def rollback_all(self) -> None:
@@ -5,19 +5,39 @@ The Series class models Pine Script's series semantics:
 - Historical values are accessed via [] operator: close[1] = previous bar's close
 - Uses a deque-based ring buffer for bounded memory
 - Supports commit/rollback for transactional bar processing
+- Mirrors committed values into a float64 ring for vectorized indicator
+  math; the ring starts small and doubles up to max_bars_back
 """
 
 from __future__ import annotations
 
+import math
 from collections import deque
+from collections.abc import Iterable
 from decimal import Decimal
-from typing import Generic, TypeVar, overload
+from typing import Any, Generic, TypeVar, overload
+
+import numpy as np
 
 from finsaas.core.errors import InsufficientDataError, SeriesIndexError
 
 T = TypeVar("T")
 
 _SENTINEL = object()
+_D0 = Decimal(0)
+
+# Initial float ring size; most series never need max_bars_back slots
+_INITIAL_CAPACITY = 16
+
+
+def _as_float(value: Any) -> float:
+    """Convert a series value to float, mapping None/non-numeric values to NaN."""
+    if value is None:
+        return math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
 
 
 class Series(Generic[T]):
@@ -37,19 +57,48 @@ class Series(Generic[T]):
         assert s[1] == Decimal("100")  # previous
     """
 
-    __slots__ = ("_buffer", "_max_bars_back", "_current", "_committed", "_name")
+    __slots__ = (
+        "_buffer",
+        "_floats",
+        "_capacity",
+        "_head",
+        "_max_bars_back",
+        "_current",
+        "_name",
+        "_bar_count",
+        "_cache",
+    )
 
     def __init__(self, max_bars_back: int = 5000, name: str = "") -> None:
         self._buffer: deque[T] = deque(maxlen=max_bars_back)
+        self._capacity = min(_INITIAL_CAPACITY, max_bars_back)
+        self._floats = np.full(self._capacity, np.nan, dtype=np.float64)
+        self._head = 0
         self._max_bars_back = max_bars_back
         self._current: T | object = _SENTINEL
-        self._committed = False
         self._name = name
+        self._bar_count = 0
+        self._cache: dict[Any, Any] = {}
 
     @property
     def name(self) -> str:
         return self._name
 
+    @property
+    def has_current(self) -> bool:
+        """True if a value has been set for the current (uncommitted) bar."""
+        return self._current is not _SENTINEL
+
+    @property
+    def bar_count(self) -> int:
+        """Total number of commits, not capped by max_bars_back."""
+        return self._bar_count
+
+    @property
+    def cache(self) -> dict[Any, Any]:
+        """Per-series state for streaming indicators, keyed by (indicator, params)."""
+        return self._cache
+
     @property
     def current(self) -> T:
         """Get the current (uncommitted) value."""
@@ -65,7 +114,6 @@ class Series(Generic[T]):
     def current(self, value: T) -> None:
         """Set the current bar's value."""
         self._current = value
-        self._committed = False
 
     def commit(self) -> None:
         """Commit the current value to history buffer.
@@ -73,16 +121,79 @@ class Series(Generic[T]):
         Called at the end of each bar to finalize the value.
         If no current value was set, commits NaN/None depending on type.
         """
-        if self._current is _SENTINEL:
+        current = self._current
+        head = self._head
+        if current is _SENTINEL:
             # No value set this bar - propagate last value or None
-            if len(self._buffer) > 0:
+            if self._buffer:
                 self._buffer.appendleft(self._buffer[0])
+                value = self._floats[head - 1]
             else:
                 self._buffer.appendleft(None)  # type: ignore[arg-type]
+                value = math.nan
         else:
-            self._buffer.appendleft(self._current)  # type: ignore[arg-type]
+            self._buffer.appendleft(current)  # type: ignore[arg-type]
+            try:
+                value = float(current)  # type: ignore[arg-type]
+            except (TypeError, ValueError):
+                value = math.nan
+        self._floats[head] = value
+        head += 1
+        self._head = head if head < self._capacity else self._advance_ring(head)
+        self._bar_count += 1
         self._current = _SENTINEL
-        self._committed = True
+
+    def commit_float(self, value: float) -> None:
+        """commit() for a caller that already has the current value as a float.
+
+        Skips the float() conversion; a current value must be set.
+        """
+        self._buffer.appendleft(self._current)  # type: ignore[arg-type]
+        head = self._head
+        self._floats[head] = value
+        head += 1
+        self._head = head if head < self._capacity else self._advance_ring(head)
+        self._bar_count += 1
+        self._current = _SENTINEL
+
+    def extend(self, values: Iterable[T]) -> None:
+        """Commit `values` in order, oldest first, in one pass.
+
+        Same result as setting and committing each value in turn; a pending
+        current value is replaced by the first of them.
+        """
+        values = list(values)
+        n = len(values)
+        if n == 0:
+            return
+        if self._head + n >= self._capacity < self._max_bars_back:
+            self._grow(self._head + n + 1)
+        size = self._capacity
+        self._buffer.extendleft(values)
+        floats = np.array([_as_float(v) for v in values[-size:]], dtype=np.float64)
+        # Only the last `size` values survive; write them with wraparound
+        start = (self._head + n - floats.size) % size
+        first = min(floats.size, size - start)
+        self._floats[start : start + first] = floats[:first]
+        self._floats[: floats.size - first] = floats[first:]
+        self._head = (self._head + n) % size
+        self._bar_count += n
+        self._current = _SENTINEL
+
+    def _advance_ring(self, head: int) -> int:
+        """Head position once the ring is full: grow it below max_bars_back, else wrap."""
+        if self._capacity < self._max_bars_back:
+            self._grow(head + 1)
+            return head
+        return 0
+
+    def _grow(self, needed: int) -> None:
+        """Enlarge the (not yet wrapped) float ring to hold at least `needed` values."""
+        capacity = min(self._max_bars_back, max(needed, 2 * self._capacity))
+        floats = np.full(capacity, np.nan, dtype=np.float64)
+        floats[: self._capacity] = self._floats
+        self._floats = floats
+        self._capacity = capacity
 
     def rollback(self) -> None:
         """Discard the current uncommitted value."""
@@ -96,6 +207,18 @@ class Series(Generic[T]):
 
     def __getitem__(self, index: int | slice) -> T | list[T]:
         """Access historical values. Index 0 = current/most recent committed."""
+        if index.__class__ is int:
+            # Fast path for the common close[0] / close[1] reads
+            current = self._current
+            if current is _SENTINEL:
+                if 0 <= index < len(self._buffer):
+                    return self._buffer[index]
+            elif index == 0:
+                return current  # type: ignore[return-value]
+            elif 0 < index <= len(self._buffer):
+                return self._buffer[index - 1]
+            return self._get_single(index)
+
         if isinstance(index, slice):
             start = index.start or 0
             stop = index.stop or len(self._buffer)
@@ -123,6 +246,35 @@ class Series(Generic[T]):
             )
         return self._buffer[buf_index]
 
+    def window(self, length: int) -> np.ndarray:
+        """Return the last `length` values as a float64 array, oldest first.
+
+        The last element is the value at index 0 (current if set, else the most
+        recent committed value). None/NaN values become NaN. The array is shorter
+        than `length` when not enough history is available.
+
+        Without a current value the result may be a read-only view of the
+        ring buffer; copy it before modifying.
+        """
+        if length <= 0:
+            return np.empty(0, dtype=np.float64)
+        if self._current is _SENTINEL:
+            return self._recent(min(length, len(self._buffer)))
+        hist = min(length - 1, len(self._buffer))
+        out = np.empty(hist + 1, dtype=np.float64)
+        out[:hist] = self._recent(hist)
+        out[hist] = _as_float(self._current)
+        return out
+
+    def _recent(self, count: int) -> np.ndarray:
+        """Last `count` committed floats, oldest first (a view unless the ring wraps)."""
+        start = self._head - count
+        if start >= 0:
+            view = self._floats[start : self._head]
+            view.flags.writeable = False
+            return view
+        return np.concatenate((self._floats[start:], self._floats[: self._head]))
+
     def __len__(self) -> int:
         """Number of committed values in the buffer."""
         return len(self._buffer)
@@ -157,10 +309,10 @@ def nz(value: T | None, replacement: T | None = None) -> T:
     """
     if na(value):
         if replacement is not None:
-            return replacement  # type: ignore[return-value]
+            return replacement
         if isinstance(value, Decimal) or value is None:
-            return Decimal("0")  # type: ignore[return-value]
-        return type(value)(0)  # type: ignore[return-value, call-arg]
+            return _D0  # type: ignore[return-value]
+        return type(value)(0)  # type: ignore[call-arg]
     return value  # type: ignore[return-value]
 
 
@@ -170,4 +322,4 @@ def fixnan(series: Series[T]) -> T:
         val = series[i]
         if not na(val):
             return val
-    return Decimal("0")  # type: ignore[return-value]
+    return _D0  # type: ignore[return-value]
@@ -81,6 +81,28 @@ class OHLCV(NamedTuple):
     close: Decimal
     volume: Decimal
 
+    @classmethod
+    def from_ints(
+        cls,
+        timestamp: datetime,
+        open: int,
+        high: int,
+        low: int,
+        close: int,
+        volume: int,
+        *,
+        decimals: int = 0,
+    ) -> OHLCV:
+        """Build a bar from integer values with `decimals` implied decimal places.
+
+        OHLCV.from_ints(ts, 10050, ...,  decimals=2) has open Decimal("100.50").
+        Avoids parsing a string per field.
+        """
+        values = (open, high, low, close, volume)
+        if decimals:
+            return cls(timestamp, *(Decimal(v).scaleb(-decimals) for v in values))
+        return cls(timestamp, *map(Decimal, values))
+
 
 @dataclass(frozen=True)
 class SymbolInfo:
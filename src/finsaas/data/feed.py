@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import abc
+import os
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import Iterator
 
+import numpy as np
+
 from finsaas.core.types import OHLCV
 
 
@@ -31,6 +35,10 @@ class DataFeed(abc.ABC):
     def timeframe(self) -> str:
         """Timeframe string."""
 
+    def column(self, field: str) -> np.ndarray:
+        """float64 array of one OHLCV field over every bar."""
+        return np.array([float(getattr(bar, field)) for bar in self], dtype=np.float64)
+
 
 class InMemoryFeed(DataFeed):
     """Data feed from a pre-loaded list of OHLCV bars."""
@@ -41,6 +49,7 @@ class InMemoryFeed(DataFeed):
         self._bars = sorted(bars, key=lambda b: b.timestamp)
         self._symbol = symbol
         self._timeframe = timeframe
+        self._columns: dict[str, np.ndarray] = {}
 
     def __iter__(self) -> Iterator[OHLCV]:
         return iter(self._bars)
@@ -48,6 +57,13 @@ class InMemoryFeed(DataFeed):
     def __len__(self) -> int:
         return len(self._bars)
 
+    def column(self, field: str) -> np.ndarray:
+        """float64 array of one OHLCV field, built once and shared by every run."""
+        values = self._columns.get(field)
+        if values is None:
+            values = self._columns[field] = super().column(field)
+        return values
+
     @property
     def symbol(self) -> str:
         return self._symbol
@@ -84,25 +100,16 @@ class CSVFeed(DataFeed):
         if self._bars is not None:
             return self._bars
 
-        import csv
-
-        bars: list[OHLCV] = []
-        with open(self._filepath, newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                bar = OHLCV(
-                    timestamp=datetime.strptime(
-                        row[self._timestamp_col], self._timestamp_format
-                    ),
-                    open=Decimal(row["open"]),
-                    high=Decimal(row["high"]),
-                    low=Decimal(row["low"]),
-                    close=Decimal(row["close"]),
-                    volume=Decimal(row.get("volume", "0")),
-                )
-                bars.append(bar)
-
-        self._bars = sorted(bars, key=lambda b: b.timestamp)
+        st = os.stat(self._filepath)
+        self._bars = list(
+            _read_csv_bars(
+                self._filepath,
+                st.st_mtime_ns,
+                st.st_size,
+                self._timestamp_col,
+                self._timestamp_format,
+            )
+        )
         return self._bars
 
     def __iter__(self) -> Iterator[OHLCV]:
@@ -120,6 +127,38 @@ class CSVFeed(DataFeed):
         return self._timeframe
 
 
+@lru_cache(maxsize=8)
+def _read_csv_bars(
+    filepath: str,
+    mtime_ns: int,
+    size: int,
+    timestamp_col: str,
+    timestamp_format: str,
+) -> tuple[OHLCV, ...]:
+    """Parse a CSV file into bars sorted by timestamp.
+
+    Cached by (path, mtime, size) so repeated backtests on an unchanged file
+    skip parsing; a modified file gets a new key.
+    """
+    import csv
+
+    bars: list[OHLCV] = []
+    with open(filepath, newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            bar = OHLCV(
+                timestamp=datetime.strptime(row[timestamp_col], timestamp_format),
+                open=Decimal(row["open"]),
+                high=Decimal(row["high"]),
+                low=Decimal(row["low"]),
+                close=Decimal(row["close"]),
+                volume=Decimal(row.get("volume", "0")),
+            )
+            bars.append(bar)
+
+    return tuple(sorted(bars, key=lambda b: b.timestamp))
+
+
 class DatabaseFeed(DataFeed):
     """Data feed that reads from the PostgreSQL database."""
 
@@ -0,0 +1,168 @@
+"""Shared-memory OHLCV storage for multi-process optimization.
+
+Bars are packed into one ``multiprocessing.shared_memory`` block so worker
+processes attach to the same pages instead of each unpickling a copy of the
+bar list. Prices are stored exactly as int64 Decimal coefficients plus int8
+exponents, so rebuilt bars compare (and print) identically to the originals.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from decimal import Decimal
+from multiprocessing import shared_memory
+from typing import Any
+
+import numpy as np
+
+from finsaas.core.types import OHLCV
+from finsaas.data.feed import DataFeed
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_US = timedelta(microseconds=1)
+_PRICE_FIELDS = ("open", "high", "low", "close", "volume")
+_INT64_MAX = 2**63 - 1
+
+
+def _views(buf: Any, n: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(timestamps, coefficients, exponents) arrays over a block holding `n` bars."""
+    fields = len(_PRICE_FIELDS)
+    timestamps = np.ndarray((n,), dtype=np.int64, buffer=buf)
+    coefficients = np.ndarray((fields, n), dtype=np.int64, buffer=buf, offset=8 * n)
+    exponents = np.ndarray(
+        (fields, n), dtype=np.int8, buffer=buf, offset=8 * n * (fields + 1)
+    )
+    return timestamps, coefficients, exponents
+
+
+def _block_size(n: int) -> int:
+    fields = len(_PRICE_FIELDS)
+    return max(1, 8 * n * (fields + 1) + n * fields)
+
+
+def _split(value: Decimal) -> tuple[int, int] | None:
+    """(coefficient, exponent) of a finite Decimal, or None if it does not fit."""
+    sign, digits, exponent = value.as_tuple()
+    if not isinstance(exponent, int) or not -128 <= exponent <= 127:
+        return None
+    coefficient = int("".join(map(str, digits)) or "0")
+    if coefficient > _INT64_MAX:
+        return None
+    return (-coefficient if sign else coefficient), exponent
+
+
+class SharedMemoryFeed(DataFeed):
+    """Data feed backed by bars packed into a shared memory block.
+
+    Pickling sends only the block name and bar count; the receiving process
+    attaches to the block and rebuilds the bar list on first use.
+    """
+
+    def __init__(self, name: str, size: int, symbol: str, timeframe: str) -> None:
+        self._name = name
+        self._size = size
+        self._symbol = symbol
+        self._timeframe = timeframe
+        self._bars: list[OHLCV] | None = None
+        self._columns: dict[str, np.ndarray] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_bars"] = None
+        state["_columns"] = {}
+        return state
+
+    def _load(self) -> list[OHLCV]:
+        if self._bars is not None:
+            return self._bars
+
+        shm = shared_memory.SharedMemory(name=self._name)
+        try:
+            timestamps, coefficients, exponents = _views(shm.buf, self._size)
+            columns = [
+                [
+                    Decimal(int(c)).scaleb(int(e))
+                    for c, e in zip(coefficients[i].tolist(), exponents[i].tolist())
+                ]
+                for i in range(len(_PRICE_FIELDS))
+            ]
+            self._bars = [
+                OHLCV(_EPOCH + ts * _ONE_US, *values)
+                for ts, *values in zip(timestamps.tolist(), *columns)
+            ]
+            del timestamps, coefficients, exponents
+        finally:
+            shm.close()
+        return self._bars
+
+    def __iter__(self) -> Iterator[OHLCV]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return self._size
+
+    def column(self, field: str) -> np.ndarray:
+        """float64 array of one OHLCV field, built once per process and reused by every trial."""
+        values = self._columns.get(field)
+        if values is None:
+            values = self._columns[field] = super().column(field)
+        return values
+
+    @property
+    def symbol(self) -> str:
+        return self._symbol
+
+    @property
+    def timeframe(self) -> str:
+        return self._timeframe
+
+
+def pack_bars(bars: list[OHLCV]) -> shared_memory.SharedMemory | None:
+    """Copy bars into a new shared memory block.
+
+    Returns None when a bar cannot be stored exactly (timezone-aware
+    timestamps, non-finite values or coefficients beyond int64).
+    """
+    n = len(bars)
+    timestamps = np.empty(n, dtype=np.int64)
+    coefficients = np.empty((len(_PRICE_FIELDS), n), dtype=np.int64)
+    exponents = np.empty((len(_PRICE_FIELDS), n), dtype=np.int8)
+    for j, bar in enumerate(bars):
+        if bar.timestamp.tzinfo is not None:
+            return None
+        timestamps[j] = (bar.timestamp - _EPOCH) // _ONE_US
+        for i, value in enumerate(bar[1:]):
+            parts = _split(value)
+            if parts is None:
+                return None
+            coefficients[i, j], exponents[i, j] = parts
+
+    shm = shared_memory.SharedMemory(create=True, size=_block_size(n))
+    views = _views(shm.buf, n)
+    views[0][:] = timestamps
+    views[1][:] = coefficients
+    views[2][:] = exponents
+    del views
+    return shm
+
+
+@contextmanager
+def shared_feed(feed: DataFeed) -> Iterator[DataFeed]:
+    """Yield a feed whose bars live in shared memory for the duration of the block.
+
+    Falls back to the original feed when its bars cannot be packed exactly.
+    The block is released on exit.
+    """
+    bars = list(feed)
+    shm = pack_bars(bars)
+    if shm is None:
+        yield feed
+        return
+    try:
+        yield SharedMemoryFeed(shm.name, len(bars), feed.symbol, feed.timeframe)
+    finally:
+        shm.close()
+        shm.unlink()
+
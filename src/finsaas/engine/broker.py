@@ -39,30 +39,41 @@ class SimulatedBroker:
     ) -> None:
         self._commission = commission_model or PercentageCommission()
         self._slippage = slippage_model or PercentageSlippage()
-        self._pending_orders: list[Order] = []
+        # Pending orders by id in submission order, plus the same orders
+        # grouped by tag so cancelling a tag only touches its own orders
+        self._by_id: dict[str, Order] = {}
+        self._by_tag: dict[str, dict[str, Order]] = {}
 
     @property
     def pending_orders(self) -> list[Order]:
-        return list(self._pending_orders)
+        return list(self._by_id.values())
 
     def submit_order(self, order: Order) -> None:
         """Submit a new order to the broker queue."""
-        self._pending_orders.append(order)
+        self._by_id[order.id] = order
+        self._by_tag.setdefault(order.tag, {})[order.id] = order
         logger.debug("order_submitted", order_id=order.id, side=order.side.value,
                      type=order.order_type.value, qty=str(order.quantity))
 
     def cancel_all(self, tag: str | None = None) -> int:
         """Cancel all pending orders, optionally filtered by tag."""
-        cancelled = 0
-        remaining: list[Order] = []
-        for order in self._pending_orders:
-            if tag is None or order.tag == tag:
-                order.cancel()
-                cancelled += 1
-            else:
-                remaining.append(order)
-        self._pending_orders = remaining
-        return cancelled
+        if tag is None:
+            orders = list(self._by_id.values())
+            self._by_id.clear()
+            self._by_tag.clear()
+        else:
+            bucket = self._by_tag.pop(tag, {})
+            orders = list(bucket.values())
+            for order_id in bucket:
+                del self._by_id[order_id]
+        for order in orders:
+            order.cancel()
+        return len(orders)
+
+    def reset(self) -> None:
+        """Drop all pending orders without cancelling them."""
+        self._by_id.clear()
+        self._by_tag.clear()
 
     def process_bar(self, bar: OHLCV, bar_index: int) -> list[Fill]:
         """Process all pending orders against the given bar.
@@ -73,9 +84,8 @@ class SimulatedBroker:
         Returns a list of fills.
         """
         fills: list[Fill] = []
-        remaining: list[Order] = []
 
-        for order in self._pending_orders:
+        for order in list(self._by_id.values()):
             fill = self._try_fill(order, bar, bar_index)
             if fill is not None:
                 fills.append(fill)
@@ -84,12 +94,18 @@ class SimulatedBroker:
                 order.fill_price = fill.price
                 order.commission = fill.commission
                 order.slippage = fill.slippage
-            else:
-                remaining.append(order)
+                self._remove(order)
 
-        self._pending_orders = remaining
         return fills
 
+    def _remove(self, order: Order) -> None:
+        """Drop a pending order from both indexes."""
+        del self._by_id[order.id]
+        bucket = self._by_tag[order.tag]
+        del bucket[order.id]
+        if not bucket:
+            del self._by_tag[order.tag]
+
     def _try_fill(self, order: Order, bar: OHLCV, bar_index: int) -> Fill | None:
         """Try to fill a single order against a bar."""
         fill_price: Decimal | None = None
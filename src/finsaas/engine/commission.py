@@ -5,6 +5,8 @@ from __future__ import annotations
 import abc
 from decimal import Decimal
 
+_D0 = Decimal(0)
+
 
 class CommissionModel(abc.ABC):
     """Base class for commission calculation."""
@@ -55,11 +57,11 @@ class TieredCommission(CommissionModel):
             if value >= threshold:
                 return value * rate
         # Below all thresholds - use first tier rate
-        return value * self._tiers[0][1] if self._tiers else Decimal("0")
+        return value * self._tiers[0][1] if self._tiers else _D0
 
 
 class ZeroCommission(CommissionModel):
     """No commission."""
 
     def calculate(self, price: Decimal, quantity: Decimal) -> Decimal:
-        return Decimal("0")
+        return _D0
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import structlog
 from decimal import Decimal
+from typing import Any
 
 from finsaas.core.context import BarContext
 from finsaas.core.types import OHLCV, OrderAction, SymbolInfo, Timeframe
@@ -84,12 +85,14 @@ class EventLoop:
 
         strat: Strategy = strategy  # type: ignore[assignment]
 
+        bars = list(self._feed)
+        total_bars = len(bars)
+        self._context.load_history(bars, self._feed.column)
+
         # Initialize strategy
         strat._bind(self)
         strat.on_init()
 
-        bars = list(self._feed)
-        total_bars = len(bars)
         logger.info("simulation_start", total_bars=total_bars, symbol=self._feed.symbol)
 
         for bar_index, bar in enumerate(bars):
@@ -110,12 +113,8 @@ class EventLoop:
             final_equity=str(self._portfolio.equity(bars[-1].close) if bars else "0"),
         )
 
-    def _process_bar(self, strategy: object, bar: OHLCV, bar_index: int) -> None:
-        """Process a single bar through the simulation pipeline."""
-        from finsaas.strategy.base import Strategy
-
-        strat: Strategy = strategy  # type: ignore[assignment]
-
+    def _process_bar(self, strat: Any, bar: OHLCV, bar_index: int) -> None:
+        """Process a single bar through the simulation pipeline (`strat` is bound by run())."""
         # Step 1: Commit all series from previous bar
         if bar_index > 0:
             self._context.commit_all()
@@ -9,6 +9,9 @@ from decimal import Decimal
 
 from finsaas.core.types import OrderAction, OrderStatus, OrderType, PositionStatus, Side
 
+_D0 = Decimal(0)
+_D100 = Decimal(100)
+
 
 @dataclass
 class Order:
@@ -139,9 +142,14 @@ class Position:
     @property
     def pnl_pct(self) -> Decimal | None:
         """Realized P&L percentage."""
-        if self.pnl is None:
+        pnl = self.pnl
+        if pnl is None:
             return None
+        return self.pnl_pct_of(pnl)
+
+    def pnl_pct_of(self, pnl: Decimal) -> Decimal:
+        """`pnl` as a percentage of the entry cost basis."""
         cost_basis = self.entry_price * self.quantity
         if cost_basis == 0:
-            return Decimal("0")
-        return (self.pnl / cost_basis) * Decimal("100")
+            return _D0
+        return (pnl / cost_basis) * _D100
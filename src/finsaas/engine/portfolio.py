@@ -12,8 +12,10 @@ from finsaas.engine.order import Fill, Position
 
 logger = structlog.get_logger()
 
+_D0 = Decimal(0)
 
-@dataclass
+
+@dataclass(slots=True)
 class EquityPoint:
     """A single point on the equity curve."""
 
@@ -80,12 +82,12 @@ class Portfolio:
 
     def equity(self, current_price: Decimal) -> Decimal:
         """Calculate total equity (cash + unrealized positions)."""
-        position_value = self._position_value(current_price)
+        position_value = self._position_value(current_price) if self._positions else _D0
         return self._cash + position_value
 
     def _position_value(self, current_price: Decimal) -> Decimal:
         """Calculate total value of open positions."""
-        total = Decimal("0")
+        total = _D0
         for pos in self._positions.values():
             if pos.is_long:
                 total += current_price * pos.quantity
@@ -176,8 +178,8 @@ class Portfolio:
             entry_price=position.entry_price,
             exit_price=price,
             quantity=position.quantity,
-            pnl=position.pnl or Decimal("0"),
-            pnl_pct=position.pnl_pct or Decimal("0"),
+            pnl=pnl,
+            pnl_pct=position.pnl_pct_of(pnl),
             commission=position.commission_entry + position.commission_exit,
             bars_held=position.bars_held or 0,
             entry_tag=tag,
@@ -188,16 +190,18 @@ class Portfolio:
 
     def record_equity(self, bar: OHLCV, bar_index: int) -> EquityPoint:
         """Record equity at the current bar."""
-        current_price = bar.close
-        pos_value = self._position_value(current_price)
+        pos_value = self._position_value(bar.close) if self._positions else _D0
         total_equity = self._cash + pos_value
 
-        if total_equity > self._peak_equity:
+        # At or above the running peak the drawdown is zero; skip the division
+        peak = self._peak_equity
+        if total_equity >= peak:
             self._peak_equity = total_equity
-
-        drawdown = Decimal("0")
-        if self._peak_equity > 0:
-            drawdown = (self._peak_equity - total_equity) / self._peak_equity
+            drawdown = _D0
+        elif peak > 0:
+            drawdown = (peak - total_equity) / peak
+        else:
+            drawdown = _D0
 
         point = EquityPoint(
             bar_index=bar_index,
@@ -212,6 +216,7 @@ class Portfolio:
 
     def close_all_positions(self, price: Decimal, timestamp: datetime, bar_index: int) -> None:
         """Close all open positions (used at end of backtest)."""
-        tags = list(self._positions.keys())
-        for tag in tags:
-            self._force_close(tag, price, timestamp, bar_index, Decimal("0"), "backtest_end")
+        if not self._positions:
+            return
+        for tag in list(self._positions):
+            self._force_close(tag, price, timestamp, bar_index, _D0, "backtest_end")
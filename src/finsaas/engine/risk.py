@@ -8,6 +8,9 @@ from decimal import Decimal
 from finsaas.core.errors import InsufficientCapitalError, RiskLimitError
 from finsaas.engine.order import Order
 
+_D0 = Decimal(0)
+_D100 = Decimal(100)
+
 
 class RiskCheck(abc.ABC):
     """Base class for risk checks applied before order execution."""
@@ -37,7 +40,7 @@ class MaxPositionSizeCheck(RiskCheck):
         current_price: Decimal,
     ) -> None:
         order_value = current_price * order.quantity
-        pct_of_equity = (order_value / equity * Decimal("100")) if equity > 0 else Decimal("0")
+        pct_of_equity = (order_value / equity * _D100) if equity > 0 else _D0
         if pct_of_equity > self._max_pct:
             raise RiskLimitError(
                 f"Order value ({pct_of_equity:.1f}% of equity) exceeds "
@@ -83,7 +86,7 @@ class MaxDrawdownCheck(RiskCheck):
             self._peak_equity = equity
 
         if self._peak_equity > 0:
-            dd_pct = ((self._peak_equity - equity) / self._peak_equity) * Decimal("100")
+            dd_pct = ((self._peak_equity - equity) / self._peak_equity) * _D100
             if dd_pct > self._max_dd_pct:
                 raise RiskLimitError(
                     f"Drawdown ({dd_pct:.1f}%) exceeds max ({self._max_dd_pct}%)"
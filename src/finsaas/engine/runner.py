@@ -61,15 +61,17 @@ class BacktestRunner:
         settings: Settings | None = None,
     ) -> None:
         self._feed = feed
-        self._settings = settings or get_settings()
 
+        # Settings are only needed for the defaults; optimizer trials always
+        # pass a config and skip re-reading the environment per trial
         if config is None:
+            settings = settings or get_settings()
             config = BacktestConfig(
                 symbol_info=SymbolInfo(ticker=feed.symbol),
                 timeframe=Timeframe(feed.timeframe),
-                initial_capital=self._settings.default_initial_capital,
-                commission_model=PercentageCommission(self._settings.default_commission_rate),
-                slippage_model=PercentageSlippage(self._settings.default_slippage_rate),
+                initial_capital=settings.default_initial_capital,
+                commission_model=PercentageCommission(settings.default_commission_rate),
+                slippage_model=PercentageSlippage(settings.default_slippage_rate),
             )
         self._config = config
 
@@ -100,11 +102,11 @@ class BacktestRunner:
 
         loop.run(strat)
 
-        # Get bars for final equity
-        bars = list(self._feed)
+        # The context still holds the last bar's close after the run
+        total_bars = len(self._feed)
         final_equity = Decimal("0")
-        if bars:
-            final_equity = loop.portfolio.equity(bars[-1].close)
+        if total_bars:
+            final_equity = loop.portfolio.equity(loop.context.close.current)
 
         # Compute metrics
         from finsaas.analytics.metrics import compute_all_metrics
@@ -123,7 +125,7 @@ class BacktestRunner:
             trades=loop.portfolio.trade_results,
             equity_curve=loop.portfolio.equity_curve,
             final_equity=final_equity,
-            total_bars=len(bars),
+            total_bars=total_bars,
             metrics=metrics,
         )
 
@@ -149,7 +151,7 @@ class BacktestRunner:
             self._feed.symbol,
             self._feed.timeframe,
             str(self._config.initial_capital),
-            str(len(list(self._feed))),
+            str(len(self._feed)),
         ]
         raw = "|".join(components)
         return hashlib.sha256(raw.encode()).hexdigest()
@@ -4,12 +4,18 @@ from __future__ import annotations
 
 import random
 import structlog
+from collections import deque
+from contextlib import ExitStack
 from decimal import Decimal
+from functools import partial
 from typing import Any
 
 from finsaas.data.feed import DataFeed
-from finsaas.engine.runner import BacktestConfig, BacktestRunner
+from finsaas.data.shared import shared_feed
+from finsaas.engine.runner import BacktestConfig
+from finsaas.optimization.grid import _run_trial
 from finsaas.optimization.objective import ObjectiveFunction
+from finsaas.optimization.parallel import TrialPool
 from finsaas.optimization.result import OptimizationResult, TrialResult
 from finsaas.optimization.space import ParameterSpace
 
@@ -20,6 +26,9 @@ class GeneticOptimizer:
     """Genetic algorithm-based optimizer using DEAP.
 
     Uses evolutionary strategies to efficiently search the parameter space.
+    Stops before `generations` once the best fitness has improved by less than
+    `rel_tol` (relative) over the last `patience` generations, or when every
+    individual has the same fitness; ``patience=0`` always runs every generation.
     """
 
     def __init__(
@@ -34,19 +43,31 @@ class GeneticOptimizer:
         crossover_prob: float = 0.7,
         mutation_prob: float = 0.2,
         seed: int | None = None,
+        max_workers: int = 1,
+        patience: int = 8,
+        rel_tol: float = 1e-3,
     ) -> None:
         self._strategy_cls = strategy_cls
         self._feed = feed
         self._config = config
         self._objective = objective
         self._space = space
+        # Genes are kept as plain lists in dimension order; these map them back
+        self._names = space.dimension_names
+        self._values = [r.values for r in space.ranges]
         self._pop_size = population_size
         self._generations = generations
         self._cx_prob = crossover_prob
         self._mut_prob = mutation_prob
         self._seed = seed
+        self._max_workers = max_workers
+        self._patience = patience
+        self._rel_tol = rel_tol
+        self._pool: TrialPool | None = None
         self._all_trials: list[TrialResult] = []
         self._trial_counter = 0
+        # Fitness by gene tuple; a genotype is backtested at most once per run
+        self._fitness_cache: dict[tuple[Any, ...], float] = {}
 
     def run(self) -> OptimizationResult:
         """Run the genetic optimization."""
@@ -71,17 +92,13 @@ class GeneticOptimizer:
 
         toolbox = base.Toolbox()
 
-        # Gene generators for each parameter
-        for i, r in enumerate(ranges):
-            toolbox.register(f"attr_{i}", random.choice, r.values)
+        values = self._values
 
         def create_individual() -> Any:
-            genes = [toolbox.__getattribute__(f"attr_{i}")() for i in range(len(ranges))]
-            return creator.Individual(genes)
+            return creator.Individual([random.choice(v) for v in values])
 
         toolbox.register("individual", create_individual)
         toolbox.register("population", tools.initRepeat, list, toolbox.individual)
-        toolbox.register("evaluate", self._evaluate_individual)
         toolbox.register("mate", self._crossover)
         toolbox.register("mutate", self._mutate)
         toolbox.register("select", tools.selTournament, tournsize=3)
@@ -91,42 +108,58 @@ class GeneticOptimizer:
         logger.info("genetic_start", population=self._pop_size,
                      generations=self._generations)
 
-        for gen in range(self._generations):
-            # Evaluate fitness for individuals without fitness
-            invalid = [ind for ind in pop if not ind.fitness.valid]
-            fitnesses = map(toolbox.evaluate, invalid)
-            for ind, fit in zip(invalid, fitnesses):
-                ind.fitness.values = fit
-
-            # Select next generation
-            offspring = toolbox.select(pop, len(pop))
-            offspring = list(map(toolbox.clone, offspring))
-
-            # Crossover
-            for child1, child2 in zip(offspring[::2], offspring[1::2]):
-                if random.random() < self._cx_prob:
-                    toolbox.mate(child1, child2)
-                    del child1.fitness.values
-                    del child2.fitness.values
-
-            # Mutation
-            for mutant in offspring:
-                if random.random() < self._mut_prob:
-                    toolbox.mutate(mutant)
-                    del mutant.fitness.values
-
-            pop = offspring
-
-            # Log progress
-            fits = [ind.fitness.values[0] for ind in pop if ind.fitness.valid]
-            if fits:
-                best_gen = max(fits) if self._objective.maximize else min(fits)
-                logger.debug("generation_complete", gen=gen, best=f"{best_gen:.4f}")
-
-        # Final evaluation
-        for ind in pop:
-            if not ind.fitness.valid:
-                ind.fitness.values = toolbox.evaluate(ind)
+        # Best fitness so far (sign-adjusted so higher is better) per generation
+        best_history: deque[float] = deque(maxlen=self._patience + 1)
+        generations_run = 0
+        stopped_early = False
+
+        with ExitStack() as stack:
+            if self._max_workers != 1:
+                # Workers stay up for every generation and attach to one
+                # shared copy of the bars
+                feed = stack.enter_context(shared_feed(self._feed))
+                trial_fn = partial(
+                    _run_trial, self._strategy_cls, feed, self._config, self._objective
+                )
+                self._pool = stack.enter_context(TrialPool(trial_fn, self._max_workers))
+                stack.callback(setattr, self, "_pool", None)
+
+            for gen in range(self._generations):
+                # Evaluate fitness for individuals without fitness
+                self._evaluate([ind for ind in pop if not ind.fitness.valid])
+                generations_run = gen + 1
+                if self._converged(pop, best_history):
+                    stopped_early = True
+                    logger.info("genetic_converged", gen=gen)
+                    break
+
+                # Select next generation
+                offspring = toolbox.select(pop, len(pop))
+                offspring = list(map(toolbox.clone, offspring))
+
+                # Crossover
+                for child1, child2 in zip(offspring[::2], offspring[1::2]):
+                    if random.random() < self._cx_prob:
+                        toolbox.mate(child1, child2)
+                        del child1.fitness.values
+                        del child2.fitness.values
+
+                # Mutation
+                for mutant in offspring:
+                    if random.random() < self._mut_prob:
+                        toolbox.mutate(mutant)
+                        del mutant.fitness.values
+
+                pop = offspring
+
+                # Log progress
+                fits = [ind.fitness.values[0] for ind in pop if ind.fitness.valid]
+                if fits:
+                    best_gen = max(fits) if self._objective.maximize else min(fits)
+                    logger.debug("generation_complete", gen=gen, best=f"{best_gen:.4f}")
+
+            # Final evaluation
+            self._evaluate([ind for ind in pop if not ind.fitness.valid])
 
         # Find best
         if self._objective.maximize:
@@ -147,35 +180,60 @@ class GeneticOptimizer:
             best_params=best_params,
             best_value=best_value,
             all_trials=self._all_trials,
+            generations_run=generations_run,
+            stopped_early=stopped_early,
         )
 
-    def _evaluate_individual(self, individual: list) -> tuple[float]:
-        """Evaluate a single individual (DEAP requires tuple return)."""
-        params = self._genes_to_params(individual)
-
-        strategy = self._strategy_cls()
-        strategy.set_parameters(params)
-
-        runner = BacktestRunner(self._feed, self._config)
-        result = runner.run(strategy)
-        obj_value = self._objective.evaluate(result)
-
-        trial = TrialResult(
-            trial_index=self._trial_counter,
-            parameters=params,
-            objective_value=obj_value,
-            metrics=result.metrics,
-            run_hash=result.run_hash,
-        )
-        self._all_trials.append(trial)
-        self._trial_counter += 1
-
-        return (float(obj_value),)
+    def _evaluate(self, individuals: list[Any]) -> None:
+        """Set the fitness (DEAP tuples) of a batch, backtesting unseen genotypes only."""
+        cache = self._fitness_cache
+        pending: dict[tuple[Any, ...], dict[str, Any]] = {}
+        for ind in individuals:
+            key = tuple(ind)
+            if key not in cache and key not in pending:
+                pending[key] = self._genes_to_params(ind)
+
+        if pending:
+            param_sets = list(pending.values())
+            if self._pool is not None:
+                trials = self._pool.map(param_sets, self._trial_counter)
+            else:
+                trials = [
+                    _run_trial(
+                        self._strategy_cls, self._feed, self._config, self._objective,
+                        params, self._trial_counter + i,
+                    )
+                    for i, params in enumerate(param_sets)
+                ]
+            for key, trial in zip(pending, trials):
+                cache[key] = float(trial.objective_value)
+            self._all_trials.extend(trials)
+            self._trial_counter += len(trials)
+
+        for ind in individuals:
+            ind.fitness.values = (cache[tuple(ind)],)
+
+    def _converged(self, pop: list[Any], best_history: deque[float]) -> bool:
+        """Record this generation's best fitness and check the stopping rules."""
+        sign = 1.0 if self._objective.maximize else -1.0
+        scores = [sign * ind.fitness.values[0] for ind in pop]
+        best = max(scores)
+        if best_history:
+            best = max(best, best_history[-1])
+        best_history.append(best)
+
+        if self._patience <= 0:
+            return False
+        if len(scores) > 1 and max(scores) == min(scores):
+            return True
+        if len(best_history) <= self._patience:
+            return False
+        gain = best_history[-1] - best_history[0]
+        return gain / max(abs(best_history[0]), 1e-12) < self._rel_tol
 
     def _genes_to_params(self, individual: list) -> dict[str, Any]:
         """Convert gene values to parameter dict."""
-        ranges = self._space.ranges
-        return {ranges[i].name: individual[i] for i in range(len(ranges))}
+        return dict(zip(self._names, individual))
 
     def _crossover(self, ind1: list, ind2: list) -> tuple[list, list]:
         """Uniform crossover."""
@@ -186,7 +244,6 @@ class GeneticOptimizer:
 
     def _mutate(self, individual: list) -> tuple[list]:
         """Mutate by randomly replacing a gene with a valid value."""
-        ranges = self._space.ranges
         idx = random.randrange(len(individual))
-        individual[idx] = random.choice(ranges[idx].values)
+        individual[idx] = random.choice(self._values[idx])
         return (individual,)
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import structlog
 from decimal import Decimal
+from functools import partial
 from typing import Any
 
 from finsaas.data.feed import DataFeed
+from finsaas.data.shared import shared_feed
 from finsaas.engine.runner import BacktestConfig, BacktestRunner
 from finsaas.optimization.objective import ObjectiveFunction
 from finsaas.optimization.parallel import run_parallel_trials
@@ -37,16 +39,22 @@ class GridSearchOptimizer:
 
     def run(self) -> OptimizationResult:
         """Run the grid search."""
-        param_sets = list(self._space.grid_iter())
+        param_sets = self._space.grid()
         total = len(param_sets)
         logger.info("grid_search_start", total_combinations=total)
 
-        def trial_fn(params: dict[str, Any], index: int) -> TrialResult:
-            return self._evaluate_trial(params, index)
-
-        results = run_parallel_trials(
-            trial_fn, param_sets, max_workers=self._max_workers
-        )
+        if self._max_workers == 1:
+            results = run_parallel_trials(self._evaluate_trial, param_sets)
+        else:
+            # Workers attach to one shared copy of the bars instead of each
+            # unpickling the full bar list
+            with shared_feed(self._feed) as feed:
+                trial_fn = partial(
+                    _run_trial, self._strategy_cls, feed, self._config, self._objective
+                )
+                results = run_parallel_trials(
+                    trial_fn, param_sets, max_workers=self._max_workers
+                )
 
         # Find best
         if self._objective.maximize:
@@ -70,18 +78,32 @@ class GridSearchOptimizer:
         self, params: dict[str, Any], trial_index: int
     ) -> TrialResult:
         """Run a single backtest with given parameters."""
-        strategy = self._strategy_cls()
-        strategy.set_parameters(params)
-
-        runner = BacktestRunner(self._feed, self._config)
-        result = runner.run(strategy)
+        return _run_trial(
+            self._strategy_cls, self._feed, self._config, self._objective, params, trial_index
+        )
 
-        obj_value = self._objective.evaluate(result)
 
-        return TrialResult(
-            trial_index=trial_index,
-            parameters=params,
-            objective_value=obj_value,
-            metrics=result.metrics,
-            run_hash=result.run_hash,
-        )
+def _run_trial(
+    strategy_cls: type,
+    feed: DataFeed,
+    config: BacktestConfig,
+    objective: ObjectiveFunction,
+    params: dict[str, Any],
+    trial_index: int,
+) -> TrialResult:
+    """Run a single backtest with given parameters (picklable for worker processes)."""
+    strategy = strategy_cls()
+    strategy.set_parameters(params)
+
+    runner = BacktestRunner(feed, config)
+    result = runner.run(strategy)
+
+    obj_value = objective.evaluate(result)
+
+    return TrialResult(
+        trial_index=trial_index,
+        parameters=params,
+        objective_value=obj_value,
+        metrics=result.metrics,
+        run_hash=result.run_hash,
+    )
@@ -7,6 +7,7 @@ from typing import Any
 
 from finsaas.data.feed import DataFeed
 from finsaas.engine.runner import BacktestConfig
+from finsaas.optimization.bayesian import BayesianOptimizer
 from finsaas.optimization.genetic import GeneticOptimizer
 from finsaas.optimization.grid import GridSearchOptimizer
 from finsaas.optimization.objective import get_objective
@@ -26,6 +27,7 @@ def run_optimization(
     generations: int = 50,
     population_size: int = 50,
     seed: int | None = None,
+    max_evals: int = 100,
     **kwargs: Any,
 ) -> OptimizationResult:
     """Run parameter optimization.
@@ -34,12 +36,13 @@ def run_optimization(
         strategy_cls: The Strategy class to optimize.
         feed: Data feed with OHLCV bars.
         config: Backtest configuration.
-        method: Optimization method ("grid" or "genetic").
+        method: Optimization method ("grid", "genetic" or "bayesian").
         objective: Objective function name.
-        max_workers: Number of parallel workers.
+        max_workers: Number of parallel workers (grid and genetic).
         generations: Number of generations (genetic only).
         population_size: Population size (genetic only).
-        seed: Random seed (genetic only, for reproducibility).
+        seed: Random seed (genetic and bayesian, for reproducibility).
+        max_evals: Maximum number of backtests (bayesian only).
 
     Returns:
         OptimizationResult with best parameters and all trial results.
@@ -74,6 +77,17 @@ def run_optimization(
             population_size=population_size,
             generations=generations,
             seed=seed,
+            max_workers=max_workers,
+        )
+    elif method == "bayesian":
+        optimizer = BayesianOptimizer(  # type: ignore[assignment]
+            strategy_cls=strategy_cls,
+            feed=feed,
+            config=config,
+            objective=obj_fn,
+            space=space,
+            max_evals=max_evals,
+            seed=seed,
         )
     else:
         raise ValueError(f"Unknown optimization method: {method}")
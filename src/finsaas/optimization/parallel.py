@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import multiprocessing
+import os
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from decimal import Decimal
 from typing import Any, Callable
@@ -13,6 +14,28 @@ from finsaas.optimization.result import TrialResult
 
 logger = structlog.get_logger()
 
+# Trial function installed once per worker process by _init_worker
+_worker_trial_fn: Callable[[dict[str, Any], int], TrialResult] | None = None
+
+
+def _init_worker(trial_fn: Callable[[dict[str, Any], int], TrialResult]) -> None:
+    global _worker_trial_fn
+    _worker_trial_fn = trial_fn
+
+
+def _run_worker_chunk(
+    chunk: list[tuple[int, dict[str, Any]]],
+) -> list[tuple[int, TrialResult | None, str]]:
+    """Run a batch of trials, returning (index, result or None, error) per trial."""
+    assert _worker_trial_fn is not None, "worker not initialized"
+    out: list[tuple[int, TrialResult | None, str]] = []
+    for index, params in chunk:
+        try:
+            out.append((index, _worker_trial_fn(params, index), ""))
+        except Exception as e:
+            out.append((index, None, str(e)))
+    return out
+
 
 def run_parallel_trials(
     trial_fn: Callable[[dict[str, Any], int], TrialResult],
@@ -23,12 +46,19 @@ def run_parallel_trials(
 
     Args:
         trial_fn: Function that takes (params, trial_index) and returns TrialResult.
+            Must be picklable (e.g. a module-level function or a bound method)
+            when running in parallel; it is sent to each worker once, so data it
+            references (feed bars, config) is loaded once per worker.
         param_sets: List of parameter combinations to evaluate.
-        max_workers: Number of parallel workers.
+        max_workers: Number of parallel workers; 0 or less uses every CPU core.
 
     Returns:
         List of TrialResults.
     """
+    if max_workers <= 0:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(param_sets))
+
     if max_workers <= 1:
         # Sequential execution (deterministic order)
         results: list[TrialResult] = []
@@ -39,26 +69,61 @@ def run_parallel_trials(
                 logger.info("trial_progress", completed=i + 1, total=len(param_sets))
         return results
 
-    # Parallel execution
-    results = []
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(trial_fn, params, i): i
-            for i, params in enumerate(param_sets)
-        }
+    with TrialPool(trial_fn, max_workers) as pool:
+        return pool.map(param_sets)
+
+
+class TrialPool:
+    """Worker processes that stay alive across several batches of trials.
+
+    Used by optimizers that evaluate trials in rounds (e.g. one batch per
+    genetic generation) so workers are started, and receive ``trial_fn``, once.
+    """
+
+    def __init__(
+        self,
+        trial_fn: Callable[[dict[str, Any], int], TrialResult],
+        max_workers: int,
+    ) -> None:
+        if max_workers <= 0:
+            max_workers = os.cpu_count() or 1
+        self._max_workers = max_workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers, initializer=_init_worker, initargs=(trial_fn,)
+        )
+
+    def __enter__(self) -> TrialPool:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def map(
+        self, param_sets: list[dict[str, Any]], start_index: int = 0
+    ) -> list[TrialResult]:
+        """Run one batch of trials, numbered from `start_index`, in index order."""
+        # A few chunks per worker so each round trip to a worker carries
+        # several trials while the load stays balanced
+        indexed = list(enumerate(param_sets, start_index))
+        chunksize = max(1, len(indexed) // (self._max_workers * 4))
+        chunks = [indexed[i : i + chunksize] for i in range(0, len(indexed), chunksize)]
+
+        results: list[TrialResult] = []
+        futures = [self._executor.submit(_run_worker_chunk, chunk) for chunk in chunks]
         for future in as_completed(futures):
-            idx = futures[future]
-            try:
-                result = future.result()
+            for idx, result, error in future.result():
+                if result is None:
+                    logger.error("trial_failed", trial_index=idx, error=error)
+                    result = TrialResult(
+                        trial_index=idx,
+                        parameters=param_sets[idx - start_index],
+                        objective_value=Decimal("-999"),
+                    )
                 results.append(result)
-            except Exception as e:
-                logger.error("trial_failed", trial_index=idx, error=str(e))
-                results.append(TrialResult(
-                    trial_index=idx,
-                    parameters=param_sets[idx],
-                    objective_value=Decimal("-999"),
-                ))
-
-    # Sort by trial index for deterministic ordering
-    results.sort(key=lambda r: r.trial_index)
-    return results
+
+        # Sort by trial index for deterministic ordering
+        results.sort(key=lambda r: r.trial_index)
+        return results
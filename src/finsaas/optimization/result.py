@@ -28,6 +28,9 @@ class OptimizationResult:
     best_params: dict[str, Any]
     best_value: Decimal
     all_trials: list[TrialResult] = field(default_factory=list)
+    # Genetic only: generations evaluated, and whether convergence ended the run
+    generations_run: int = 0
+    stopped_early: bool = False
 
     @property
     def top_trials(self) -> list[TrialResult]:
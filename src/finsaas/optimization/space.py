@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import hashlib
 import itertools
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any, Iterator
 
+import numpy as np
+
 from finsaas.strategy.parameters import (
     BoolParam,
     EnumParam,
@@ -15,6 +18,11 @@ from finsaas.strategy.parameters import (
     ParamDescriptor,
 )
 
+# Materialized grids keyed by a digest of the ordered names and values, so
+# repeated sweeps over the same space skip rebuilding the product
+_grid_cache: dict[bytes, list[dict[str, Any]]] = {}
+_GRID_CACHE_SIZE = 16
+
 
 @dataclass
 class ParameterRange:
@@ -39,7 +47,19 @@ class ParameterSpace:
 
     @classmethod
     def from_strategy(cls, strategy_cls: type) -> ParameterSpace:
-        """Extract parameter space from a Strategy class's descriptors."""
+        """Extract parameter space from a Strategy class's descriptors.
+
+        Built on first use and kept on the strategy class; the returned space
+        is shared and must not be mutated.
+        """
+        space = strategy_cls.__dict__.get("_param_space")
+        if space is None:
+            space = cls._extract(strategy_cls)
+            strategy_cls._param_space = space  # type: ignore[attr-defined]
+        return space
+
+    @classmethod
+    def _extract(cls, strategy_cls: type) -> ParameterSpace:
         ranges: list[ParameterRange] = []
 
         for name, desc in getattr(strategy_cls, "_param_descriptors", {}).items():
@@ -90,6 +110,33 @@ class ParameterSpace:
         for combo in itertools.product(*value_lists):
             yield dict(zip(names, combo))
 
+    def grid_indices(self) -> np.ndarray:
+        """All combinations as an (N, dims) int64 array of indexes into each range.
+
+        Rows are in grid_iter() order. Values stay in the ranges, so the
+        Python types passed to strategies (int, Decimal, str, bool) are kept.
+        """
+        sizes = [len(r) for r in self._ranges]
+        if not sizes:
+            return np.empty((1, 0), dtype=np.int64)
+        axes = [np.arange(n, dtype=np.int64) for n in sizes]
+        return np.stack(np.meshgrid(*axes, indexing="ij"), axis=-1).reshape(-1, len(sizes))
+
+    def grid(self) -> list[dict[str, Any]]:
+        """All combinations as a list, cached across calls with the same space.
+
+        The dicts are shared between callers and must not be mutated.
+        """
+        items = [(r.name, r.param_type, tuple(r.values)) for r in self._ranges]
+        key = hashlib.blake2b(repr(items).encode()).digest()
+        combos = _grid_cache.get(key)
+        if combos is None:
+            combos = list(self.grid_iter())
+            if len(_grid_cache) >= _GRID_CACHE_SIZE:
+                del _grid_cache[next(iter(_grid_cache))]
+            _grid_cache[key] = combos
+        return list(combos)
+
     def random_sample(self) -> dict[str, Any]:
         """Generate a random parameter combination."""
         import random
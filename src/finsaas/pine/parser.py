@@ -39,6 +39,10 @@ from finsaas.pine.ast_nodes import (
     IndicatorDecl,
 )
 
+# Patterns used per line/expression, compiled once at import
+_FOR_RE = re.compile(r"for\s+(\w+)\s*=\s*(.+?)\s+to\s+(.+?)(?:\s+by\s+(.+))?\s*$")
+_IDENTIFIER_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
 
 class PineParser:
     """Parse Pine Script v5 source code into an AST."""
@@ -248,9 +252,7 @@ class PineParser:
         """Parse a for loop."""
         line = lines[start].strip()
         # for i = 0 to 10 [by 1]
-        match = re.match(
-            r"for\s+(\w+)\s*=\s*(.+?)\s+to\s+(.+?)(?:\s+by\s+(.+))?\s*$", line
-        )
+        match = _FOR_RE.match(line)
         if not match:
             raise PineSyntaxError(f"Invalid for loop: {line}")
 
@@ -436,7 +438,7 @@ class PineParser:
             pass
 
         # Identifier
-        if re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*$", text):
+        if _IDENTIFIER_RE.match(text):
             return Identifier(name=text)
 
         # Fallback - try as identifier
@@ -45,6 +45,8 @@ class PineTranspiler:
 
     def transpile(self, script: Script) -> str:
         """Transpile a Script AST to Python source code."""
+        self._indent = 0
+        self._strategy_name = "PineStrategy"
         self._var_inits = []
         self._on_bar_lines = []
         self._params = []
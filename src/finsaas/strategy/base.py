@@ -3,19 +3,32 @@
 from __future__ import annotations
 
 import abc
+from collections.abc import Callable
 from decimal import Decimal
 from typing import Any
 
+import numpy as np
+
 from finsaas.core.context import BarContext
 from finsaas.core.series import Series
 from finsaas.core.types import OrderAction, OrderType, Side
 from finsaas.engine.order import Order
+from finsaas.strategy.builtins import ta as _ta
 from finsaas.strategy.parameters import ParamDescriptor
 from finsaas.strategy.registry import register_strategy
 
+_OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+_D0 = Decimal(0)
+_D99 = Decimal(99)
+_D100 = Decimal(100)
+
 
 class _SeriesAccessor:
-    """Descriptor that lazily accesses a named series from the strategy's context."""
+    """Descriptor that lazily accesses a named series from the strategy's context.
+
+    Non-data descriptor: once bound, the series are stored on the instance
+    and shadow it, so ``self.close`` in on_bar() is a plain dict lookup.
+    """
 
     def __init__(self, series_name: str) -> None:
         self._series_name = series_name
@@ -80,6 +93,7 @@ class Strategy(abc.ABC, metaclass=StrategyMeta):
     def __init__(self) -> None:
         self._loop: Any = None  # Set by _bind()
         self._context: BarContext | None = None
+        self._precomputed: dict[tuple[Any, ...], Series[Decimal]] = {}
 
     @property
     def name(self) -> str:
@@ -88,19 +102,17 @@ class Strategy(abc.ABC, metaclass=StrategyMeta):
     def _bind(self, loop: Any) -> None:
         """Bind the strategy to an EventLoop instance."""
         self._loop = loop
-        self._context = loop.context
+        ctx = self._context = loop.context
+        self.__dict__.update({field: getattr(ctx, field) for field in _OHLCV_FIELDS})
+        self._precomputed = {}
 
     @property
     def bar_index(self) -> int:
         assert self._context is not None
         return self._context.bar_index
 
-    @property
-    def ta(self) -> Any:
-        """Access technical analysis functions."""
-        from finsaas.strategy.builtins import ta
-
-        return ta
+    # Technical analysis functions (self.ta.sma(...))
+    ta = _ta
 
     # --- Series management ---
 
@@ -109,6 +121,55 @@ class Strategy(abc.ABC, metaclass=StrategyMeta):
         assert self._context is not None
         return self._context.create_series(name=name)
 
+    def precompute(
+        self,
+        func: Callable[..., Any],
+        *inputs: str | Series[Decimal],
+        name: str = "",
+        **params: Any,
+    ) -> Series[Decimal]:
+        """Create a series filled from an indicator computed once over all bars.
+
+        Call from on_init(). ``func`` takes one array per input - an OHLCV field
+        name or a series returned by an earlier precompute() - and returns one
+        value per bar (see ``finsaas.strategy.builtins.rolling``). The series
+        then holds that bar's value in on_bar():
+
+            self.fast_ma = self.precompute(rolling.sma, "close", length=10)
+            self.slow_ma = self.precompute(rolling.sma, "close", length=30)
+            self.cross_up = self.precompute(rolling.crossover, self.fast_ma, self.slow_ma)
+
+        Boolean results are stored as bool; numeric results as Decimal.
+        Repeating a call with the same function, inputs, name and parameters
+        in one run returns the series from the first call instead of
+        recomputing it.
+        """
+        from finsaas.strategy.builtins.ta import _from_float
+
+        ctx = self._context
+        assert ctx is not None
+        key: tuple[Any, ...] | None = (func, name, inputs, tuple(sorted(params.items())))
+        try:
+            cached = self._precomputed.get(key)  # type: ignore[arg-type]
+        except TypeError:  # unhashable parameter value
+            cached = key = None
+        if cached is not None:
+            return cached
+
+        arrays = [
+            ctx.history(item) if isinstance(item, str) else ctx.precomputed_array(item)
+            for item in inputs
+        ]
+        array = func(*arrays, **params)
+        if array.dtype == np.bool_:
+            values = array.tolist()
+        else:
+            values = [_from_float(v) for v in array.tolist()]
+        series = ctx.create_precomputed_series(array, values, name=name)
+        if key is not None:
+            self._precomputed[key] = series
+        return series
+
     # --- Order methods (Pine Script strategy.* equivalents) ---
 
     def entry(
@@ -133,9 +194,9 @@ class Strategy(abc.ABC, metaclass=StrategyMeta):
                 portfolio = self._loop.portfolio
                 qty = portfolio.cash / current_price
                 # Use 99% to leave room for commission
-                qty = (qty * Decimal("99")) / Decimal("100")
+                qty = (qty * _D99) / _D100
             else:
-                qty = Decimal("0")
+                qty = _D0
 
         order_type = OrderType.MARKET
         if limit is not None and stop is not None:
@@ -228,10 +289,19 @@ class Strategy(abc.ABC, metaclass=StrategyMeta):
         return params
 
     def set_parameters(self, params: dict[str, object]) -> None:
-        """Set parameter values from a dict."""
-        for param_name, value in params.items():
-            if param_name in self._param_descriptors:
-                setattr(self, param_name, value)
+        """Set parameter values from a dict, ignoring names that are not parameters.
+
+        Values are validated by their descriptors and written straight to the
+        instance dict, skipping the per-attribute descriptor ``__set__`` call.
+        """
+        descriptors = self._param_descriptors
+        self.__dict__.update(
+            {
+                f"_param_{param_name}": descriptors[param_name].validate(value)
+                for param_name, value in params.items()
+                if param_name in descriptors
+            }
+        )
 
     # --- Abstract methods ---
 
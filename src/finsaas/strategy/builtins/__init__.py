@@ -1,3 +1,3 @@
 """Built-in functions for the strategy DSL."""
 
-from finsaas.strategy.builtins import ta  # noqa: F401
+from finsaas.strategy.builtins import rolling, ta  # noqa: F401
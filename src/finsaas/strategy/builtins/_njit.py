@@ -0,0 +1,46 @@
+"""Optional Numba JIT support for numeric kernels.
+
+Kernels decorated with ``njit`` are compiled to machine code when Numba is
+installed (``pip install finsaas[performance]``) and run as plain Python
+otherwise. ``cache=True`` persists compiled code on disk, so only the first
+process on a machine pays the JIT cost.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import numpy as np
+
+try:
+    from numba import njit as _numba_njit  # type: ignore[import-not-found, unused-ignore]
+except ImportError:  # pragma: no cover - depends on the environment
+    _numba_njit = None
+
+NUMBA_AVAILABLE = _numba_njit is not None
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """``numba.njit`` when available, otherwise a no-op decorator.
+
+    Supports both ``@njit`` and ``@njit(cache=True, ...)`` forms.
+    """
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        return func
+
+    return decorator
+
+
+def kernel_input(values: np.ndarray) -> np.ndarray | Sequence[float]:
+    """Prepare a float64 array for a kernel.
+
+    Compiled kernels take the array as-is; the pure-Python fallback iterates a
+    list, which avoids boxing a NumPy scalar per element.
+    """
+    return values if NUMBA_AVAILABLE else values.tolist()
@@ -0,0 +1,133 @@
+"""Float64 kernels for serial indicator recurrences.
+
+These loops cannot be expressed as NumPy array operations, so they are
+written as plain loops and compiled with Numba when it is installed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from finsaas.strategy.builtins._njit import NUMBA_AVAILABLE, njit
+
+
+@njit(cache=True)
+def wilder_fold(samples, length, count, total, rma):  # type: ignore[no-untyped-def]
+    """Fold `samples` into a Wilder RMA state and return (count, total, rma).
+
+    The first `length` samples seed the average with their mean, after which
+    rma = (rma * (length - 1) + x) / length.
+    """
+    for x in samples:
+        count += 1
+        if count <= length:
+            total += x
+            if count == length:
+                rma = total / length
+        else:
+            rma = (rma * (length - 1) + x) / length
+    return count, total, rma
+
+
+@njit(cache=True)
+def wilder_series(samples, length, out):  # type: ignore[no-untyped-def]
+    """Write the Wilder RMA after each sample into `out` and return it.
+
+    Until `length` samples have been seen the running simple mean is written.
+    """
+    total = 0.0
+    rma = 0.0
+    for i in range(len(samples)):
+        x = samples[i]
+        if i < length:
+            total += x
+            rma = total / (i + 1)
+        else:
+            rma = (rma * (length - 1) + x) / length
+        out[i] = rma
+    return out
+
+
+@njit(cache=True)
+def ema_fold(samples, alpha, ema):  # type: ignore[no-untyped-def]
+    """Fold `samples` into ema = alpha * x + (1 - alpha) * ema and return it."""
+    beta = 1.0 - alpha
+    for x in samples:
+        ema = alpha * x + beta * ema
+    return ema
+
+
+@njit(cache=True)
+def ema_series(samples, length, alpha, out):  # type: ignore[no-untyped-def]
+    """Write the EMA after each sample into `out` and return it.
+
+    The first `length` samples give their running mean, after which
+    ema = alpha * x + (1 - alpha) * ema.
+    """
+    beta = 1.0 - alpha
+    total = 0.0
+    ema = 0.0
+    for i in range(len(samples)):
+        x = samples[i]
+        if i < length:
+            total += x
+            ema = total / (i + 1)
+        else:
+            ema = alpha * x + beta * ema
+        out[i] = ema
+    return out
+
+
+@njit(cache=True)
+def sma_cross_signals(close, fast, slow, out):  # type: ignore[no-untyped-def]
+    """Write SMA crossover signals into `out` (int8) and return it.
+
+    1 marks a bar where SMA(fast) crosses above SMA(slow), -1 a cross below.
+    SMAs are 0 until their window fills and use running-sum differences, so
+    they match ``rolling.sma`` bit for bit. They are not exact: running-sum
+    rounding can flip ties against the Decimal ``ta.sma``.
+    """
+    n = len(close)
+    sums = np.empty(n + 1)
+    sums[0] = 0.0
+    prev_fast = 0.0
+    prev_slow = 0.0
+    for i in range(n):
+        x = close[i]
+        if x != x:
+            x = 0.0
+        sums[i + 1] = sums[i] + x
+        cur_fast = 0.0
+        if 0 < fast <= i + 1:
+            cur_fast = sums[fast] if i + 1 == fast else sums[i + 1] - sums[i + 1 - fast]
+            cur_fast /= fast
+        cur_slow = 0.0
+        if 0 < slow <= i + 1:
+            cur_slow = sums[slow] if i + 1 == slow else sums[i + 1] - sums[i + 1 - slow]
+            cur_slow /= slow
+        signal = 0
+        if i > 0:
+            if cur_fast > cur_slow and prev_fast <= prev_slow:
+                signal = 1
+            elif cur_fast < cur_slow and prev_fast >= prev_slow:
+                signal = -1
+        out[i] = signal
+        prev_fast = cur_fast
+        prev_slow = cur_slow
+    return out
+
+
+def warm_up() -> None:
+    """Compile (or load from the on-disk cache) every kernel in this module.
+
+    Call once at process start so the first backtest does not pay the JIT
+    cost. A no-op without Numba.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    samples = np.ones(4)
+    wilder_fold(samples, 2, 0, 0.0, 0.0)
+    wilder_series(samples, 2, np.empty(4))
+    ema_fold(samples, 0.5, 0.0)
+    ema_series(samples, 2, 0.5, np.empty(4))
+    sma_cross_signals(samples, 1, 2, np.empty(4, dtype=np.int8))
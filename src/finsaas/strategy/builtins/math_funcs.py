@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+import math as _math
 from decimal import Decimal, ROUND_HALF_UP
 
+_D0 = Decimal(0)
+_D1 = Decimal(1)
+_D2 = Decimal(2)
+_SQRT_TOLERANCE = Decimal("1E-20")
+
 
 def abs_val(x: Decimal) -> Decimal:
     """Absolute value. Pine Script: math.abs(x)"""
@@ -23,21 +29,19 @@ def min_val(a: Decimal, b: Decimal) -> Decimal:
 def round_val(x: Decimal, precision: int = 0) -> Decimal:
     """Round to given decimal places. Pine Script: math.round(x, precision)"""
     if precision == 0:
-        return x.quantize(Decimal("1"), rounding=ROUND_HALF_UP)
+        return x.quantize(_D1, rounding=ROUND_HALF_UP)
     quant = Decimal(10) ** -precision
     return x.quantize(quant, rounding=ROUND_HALF_UP)
 
 
 def ceil(x: Decimal) -> Decimal:
     """Ceiling. Pine Script: math.ceil(x)"""
-    import math as _math
-    return Decimal(str(_math.ceil(float(x))))
+    return Decimal(_math.ceil(float(x)))
 
 
 def floor(x: Decimal) -> Decimal:
     """Floor. Pine Script: math.floor(x)"""
-    import math as _math
-    return Decimal(str(_math.floor(float(x))))
+    return Decimal(_math.floor(float(x)))
 
 
 def sign(x: Decimal) -> int:
@@ -57,12 +61,12 @@ def pow_val(base: Decimal, exp: Decimal) -> Decimal:
 def sqrt(x: Decimal) -> Decimal:
     """Square root. Pine Script: math.sqrt(x)"""
     if x <= 0:
-        return Decimal("0")
+        return _D0
     # Newton's method
     guess = x
     while True:
-        new_guess = (guess + x / guess) / Decimal("2")
-        if abs(new_guess - guess) < Decimal("1E-20"):
+        new_guess = (guess + x / guess) / _D2
+        if abs(new_guess - guess) < _SQRT_TOLERANCE:
             break
         guess = new_guess
     return guess
@@ -70,13 +74,11 @@ def sqrt(x: Decimal) -> Decimal:
 
 def log(x: Decimal) -> Decimal:
     """Natural logarithm. Pine Script: math.log(x)"""
-    import math as _math
     if x <= 0:
-        return Decimal("0")
+        return _D0
     return Decimal(str(_math.log(float(x))))
 
 
 def exp(x: Decimal) -> Decimal:
     """Exponential. Pine Script: math.exp(x)"""
-    import math as _math
     return Decimal(str(_math.exp(float(x))))
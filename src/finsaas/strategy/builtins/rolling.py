@@ -0,0 +1,124 @@
+"""Whole-history indicator arrays for precomputed strategy series.
+
+Each function takes float64 arrays covering every bar of a backtest and
+returns an array of the same length whose element i is the float64
+counterpart of what the corresponding ``ta`` function returns on bar i.
+Computing the full series once is O(N) instead of re-walking the window on
+every bar; see ``Strategy.precompute``.
+
+The values are not exact: rounding can flip ties and near-ties against the
+Decimal ``ta`` results, so comparisons such as crossovers may fire on
+different bars. Use the ``ta`` functions where trades must match exactly.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from finsaas.strategy.builtins._njit import kernel_input
+from finsaas.strategy.builtins._ta_kernels import ema_series, sma_cross_signals, wilder_series
+
+
+def _wilder(samples: np.ndarray, length: int) -> np.ndarray:
+    out = np.empty(samples.size, dtype=np.float64)
+    return np.asarray(wilder_series(kernel_input(samples), length, out))
+
+
+def sma(source: np.ndarray, length: int) -> np.ndarray:
+    """Simple moving average from a running sum; 0 until `length` bars exist."""
+    values = np.nan_to_num(source, nan=0.0)
+    out = np.zeros(values.size, dtype=np.float64)
+    if 0 < length <= values.size:
+        sums = np.cumsum(values)
+        out[length - 1] = sums[length - 1]
+        out[length:] = sums[length:] - sums[:-length]
+        out[length - 1 :] /= length
+    return out
+
+
+def ema(source: np.ndarray, length: int) -> np.ndarray:
+    """EMA with alpha = 2 / (length + 1); the running mean over the first `length` bars."""
+    values = np.nan_to_num(source, nan=0.0)
+    out = np.empty(values.size, dtype=np.float64)
+    return np.asarray(ema_series(kernel_input(values), length, 2.0 / (length + 1), out))
+
+
+def stdev(source: np.ndarray, length: int) -> np.ndarray:
+    """Population standard deviation over `length` bars; 0 until the window fills."""
+    values = np.nan_to_num(source, nan=0.0)
+    out = np.zeros(values.size, dtype=np.float64)
+    if 0 < length <= values.size:
+        out[length - 1 :] = sliding_window_view(values, length).std(axis=1)
+    return out
+
+
+def rsi(source: np.ndarray, length: int = 14) -> np.ndarray:
+    """Wilder RSI; 50 until `length` changes are available."""
+    out = np.full(source.size, 50.0)
+    if source.size <= length:
+        return out
+    changes = np.diff(np.nan_to_num(source, nan=0.0))
+    gain = _wilder(np.maximum(changes, 0.0), length)[length - 1 :]
+    loss = _wilder(np.maximum(-changes, 0.0), length)[length - 1 :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        values = 100.0 - 100.0 / (1.0 + gain / loss)
+    out[length:] = np.where(loss == 0, 100.0, values)
+    return out
+
+
+def _spread(series1: np.ndarray, series2: np.ndarray) -> np.ndarray:
+    """series1 - series2 with NaN read as 0; its sign orders the two series."""
+    return np.asarray(np.nan_to_num(series1, nan=0.0) - np.nan_to_num(series2, nan=0.0))
+
+
+def crossover(series1: np.ndarray, series2: np.ndarray) -> np.ndarray:
+    """Boolean mask of bars where series1 crosses above series2."""
+    d = _spread(series1, series2)
+    out = np.zeros(d.size, dtype=np.bool_)
+    out[1:] = (d[1:] > 0) & (d[:-1] <= 0)
+    return out
+
+
+def crossunder(series1: np.ndarray, series2: np.ndarray) -> np.ndarray:
+    """Boolean mask of bars where series1 crosses below series2."""
+    d = _spread(series1, series2)
+    out = np.zeros(d.size, dtype=np.bool_)
+    out[1:] = (d[1:] < 0) & (d[:-1] >= 0)
+    return out
+
+
+def cross(series1: np.ndarray, series2: np.ndarray) -> np.ndarray:
+    """Cross signals of two arrays: 1 = series1 crosses above, -1 = below, else 0.
+
+    One precomputed series in place of a crossover and a crossunder mask;
+    the encoding matches ``sma_cross``.
+    """
+    d = _spread(series1, series2)
+    out = np.zeros(d.size, dtype=np.int8)
+    prev, cur = d[:-1], d[1:]
+    out[1:][(cur > 0) & (prev <= 0)] = 1
+    out[1:][(cur < 0) & (prev >= 0)] = -1
+    return out
+
+
+def sma_cross(source: np.ndarray, fast_length: int, slow_length: int) -> np.ndarray:
+    """SMA crossover signals in one compiled pass: 1 = cross above, -1 = below, else 0.
+
+    Equivalent to crossover/crossunder of two ``sma`` arrays without
+    materializing them. Like ``sma`` it works on float64 running sums, so
+    where the Decimal ``ta.sma`` values tie or nearly tie it can miss or add
+    crosses that ``ta.crossover`` would not; high prices with fine ticks make
+    this frequent.
+    """
+    out = np.empty(source.size, dtype=np.int8)
+    return np.asarray(
+        sma_cross_signals(kernel_input(source), fast_length, slow_length, out)
+    )
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, length: int = 14) -> np.ndarray:
+    """Wilder-smoothed true range; the simple mean of true ranges during warmup."""
+    prev_close = np.concatenate(([np.nan], close[:-1]))
+    ranges = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+    return _wilder(ranges, length)
@@ -10,6 +10,9 @@ from decimal import Decimal
 
 from finsaas.core.types import Side
 
+_D0 = Decimal(0)
+_D100 = Decimal(100)
+
 
 def calc_position_size(
     capital: Decimal,
@@ -28,12 +31,12 @@ def calc_position_size(
     Returns:
         Position size (quantity).
     """
-    risk_amount = capital * risk_pct / Decimal("100")
+    risk_amount = capital * risk_pct / _D100
     if stop_distance and stop_distance > 0:
         return risk_amount / stop_distance
     if price > 0:
         return risk_amount / price
-    return Decimal("0")
+    return _D0
 
 
 def percent_of_equity(equity: Decimal, pct: Decimal, price: Decimal) -> Decimal:
@@ -48,5 +51,5 @@ def percent_of_equity(equity: Decimal, pct: Decimal, price: Decimal) -> Decimal:
         Quantity.
     """
     if price <= 0:
-        return Decimal("0")
-    return (equity * pct / Decimal("100")) / price
+        return _D0
+    return (equity * pct / _D100) / price
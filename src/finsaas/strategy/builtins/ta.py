@@ -1,16 +1,786 @@
 """Technical analysis functions matching Pine Script's ta.* namespace.
 
-All functions use Decimal arithmetic for deterministic results.
 Functions operate on Series objects and return Decimal values.
+Running averages and recurrences use Decimal arithmetic for deterministic
+results, while windowed statistics (stdev, variance, wma, vwma, linreg,
+correlation, mfi and the like) are computed on float64 windows and
+converted back to Decimal. Decimal-heavy recurrences run at a fixed
+reduced precision (_TA_PRECISION digits), which keeps them deterministic
+while making each multiply/divide cheaper than the default 28 digits.
 """
 
 from __future__ import annotations
 
-from decimal import Decimal
+import math
+from bisect import bisect_left, insort
+from collections import deque
+from collections.abc import Callable
+from decimal import Context, Decimal, localcontext
+from functools import lru_cache, wraps
 
-from typing import Optional
+from typing import Any, Optional
 
-from finsaas.core.series import Series, na, nz
+import numpy as np
+
+from finsaas.core.series import Series, _as_float, na, nz
+from finsaas.strategy.builtins._njit import kernel_input
+from finsaas.strategy.builtins._ta_kernels import ema_fold, wilder_fold
+
+_D0 = Decimal(0)
+_D1 = Decimal(1)
+_D2 = Decimal(2)
+_D3 = Decimal(3)
+_D50 = Decimal(50)
+_D100 = Decimal(100)
+_D_NEG100 = Decimal(-100)
+_D_015 = Decimal("0.015")
+
+# Significant digits for Decimal-heavy indicator recurrences; prices rarely
+# need more than 12, and a fixed precision keeps results deterministic.
+_TA_PRECISION = 18
+
+# Wide enough that running sums of bar values (and their squares) are exact
+_EXACT_CONTEXT = Context(prec=100)
+
+
+def _ta_precision[F: Callable[..., Any]](func: F) -> F:
+    """Run `func` under a local Decimal context with _TA_PRECISION digits."""
+
+    @wraps(func)
+    def wrapper(*args: object, **kwargs: object) -> object:
+        with localcontext() as ctx:
+            ctx.prec = _TA_PRECISION
+            return func(*args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+_NO_VALUE = object()
+
+
+def _bar_memo[F: Callable[..., Any]](func: F) -> F:
+    """Reuse `func`'s result when it is called again on the same bar.
+
+    The result is kept in the first Series argument's cache and stays valid
+    while every Series argument has the same commit count and current value.
+    """
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(*args: object, **kwargs: object) -> object:
+        params = []
+        stamp = []
+        for arg in (*args, *kwargs.values()):
+            if isinstance(arg, Series):
+                current = arg.current if arg.has_current else _NO_VALUE
+                stamp.append((arg, arg.bar_count, current))
+            else:
+                params.append(arg)
+        if not stamp:
+            return func(*args, **kwargs)
+        cache = stamp[0][0].cache
+        key = ("memo", name, tuple(params), tuple(kwargs))
+        entry = cache.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        result = func(*args, **kwargs)
+        cache[key] = (stamp, result)
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+@lru_cache(maxsize=256)
+def _dec_int(n: int) -> Decimal:
+    """Cached Decimal for an integer length."""
+    return Decimal(n)
+
+
+@lru_cache(maxsize=256)
+def _ema_coeffs(length: int) -> tuple[Decimal, Decimal]:
+    """EMA smoothing factors (alpha, 1 - alpha) with alpha = 2 / (length + 1)."""
+    alpha = _D2 / (_dec_int(length) + _D1)
+    return alpha, _D1 - alpha
+
+
+def _from_float(value: float) -> Decimal:
+    """Convert a float result back to Decimal (non-finite values become 0)."""
+    if not math.isfinite(value):
+        return _D0
+    return Decimal(repr(value))
+
+
+def _depth(source: Series[Any]) -> int:
+    """Number of values addressable by index on `source` (current bar included)."""
+    return len(source) + source.has_current
+
+
+def _last_two(source: Series[Decimal]) -> tuple[Decimal, Decimal] | None:
+    """Values at indices 0 and 1 with na as 0, or None with fewer than two values."""
+    if len(source) + source.has_current < 2:
+        return None
+    current, previous = source[0], source[1]
+    # Plain Decimals are the common case; only fall back to nz for na values
+    if current.__class__ is not Decimal or current.is_nan():
+        current = nz(current)
+    if previous.__class__ is not Decimal or previous.is_nan():
+        previous = nz(previous)
+    return current, previous
+
+
+def _nz_window(source: Series[Decimal], length: int) -> np.ndarray:
+    """float64 window of `source` (oldest first) with na values replaced by 0."""
+    window = source.window(length)
+    if np.isnan(window).any():
+        return np.asarray(np.nan_to_num(window, nan=0.0), dtype=np.float64)
+    return window
+
+
+class _RollingExtreme:
+    """Monotonic deque tracking the rolling max/min of a series' committed values.
+
+    Entries are (commit ordinal, value) with values strictly decreasing (max) or
+    increasing (min) from the front, so each bar costs O(1) amortized instead of
+    a full window scan. The uncommitted current value is compared at query time.
+    """
+
+    __slots__ = ("_length", "_find_max", "_entries", "_synced")
+
+    def __init__(self, length: int, find_max: bool) -> None:
+        self._length = length
+        self._find_max = find_max
+        self._entries: deque[tuple[int, Decimal]] = deque()
+        self._synced = 0
+
+    def _push(self, ordinal: int, value: Decimal) -> None:
+        entries = self._entries
+        if self._find_max:
+            while entries and entries[-1][1] <= value:
+                entries.pop()
+        else:
+            while entries and entries[-1][1] >= value:
+                entries.pop()
+        entries.append((ordinal, value))
+
+    def _beats(self, value: Decimal, best: Decimal) -> bool:
+        return value >= best if self._find_max else value <= best
+
+    def offset(self, source: Series[Decimal]) -> int:
+        """Bar offset (0 = current) of the extreme over the last `length` bars."""
+        length = self._length
+        n = source.bar_count
+        has_current = source.has_current
+        missing = n - self._synced
+        if missing < 0 or missing > length:
+            self._entries.clear()
+            missing = length
+        missing = min(missing, len(source))
+
+        # Committed value with ordinal n - j lives at source[j + has_current]
+        for j in range(missing - 1, -1, -1):
+            value = source[j + has_current]
+            if not na(value):
+                self._push(n - j, value)
+        self._synced = n
+
+        entries = self._entries
+        while entries and entries[0][0] <= n - length:
+            entries.popleft()
+
+        # The buffer may hold fewer than `length` bars when max_bars_back is small
+        oldest = n - min(length - 1 if has_current else length, len(source)) + 1
+        best: tuple[int, Decimal] | None = None
+        for entry in entries:  # at most two entries fall outside the window
+            if entry[0] >= oldest:
+                best = entry
+                break
+
+        if has_current:
+            current = source.current
+            if not na(current) and (best is None or self._beats(current, best[1])):
+                return 0
+            return 0 if best is None else n - best[0] + 1
+        return 0 if best is None else n - best[0]
+
+
+def _extreme_offset(source: Series[Decimal], length: int, find_max: bool) -> int:
+    """Bar offset (0 = current) of the max/min over the last `length` bars.
+
+    na values are skipped; ties resolve to the most recent bar. State is kept
+    on the series so repeated per-bar calls stream instead of rescanning.
+    """
+    key = ("highest" if find_max else "lowest", length)
+    state = source.cache.get(key)
+    if state is None:
+        state = source.cache[key] = _RollingExtreme(length, find_max)
+    return state.offset(source)
+
+
+class _RollingMedian:
+    """Sorted sliding window of committed values for streaming median queries.
+
+    Each committed bar is inserted with a binary search and the expired bar is
+    removed the same way, so no per-bar sort is needed. The uncommitted current
+    value is merged in at query time by index arithmetic.
+    """
+
+    __slots__ = ("size", "has_current", "fifo", "ordered", "synced")
+
+    def __init__(self, length: int, has_current: bool) -> None:
+        self.size = length - has_current
+        self.has_current = has_current
+        self.fifo: deque[Decimal] = deque()
+        self.ordered: list[Decimal] = []
+        self.synced = -1
+
+    def _push(self, value: Decimal, limit: int) -> None:
+        self.fifo.append(value)
+        insort(self.ordered, value)
+        while len(self.fifo) > limit:
+            expired = self.fifo.popleft()
+            del self.ordered[bisect_left(self.ordered, expired)]
+
+    def sync(self, source: Series[Decimal]) -> None:
+        n = source.bar_count
+        if n == self.synced:
+            return
+        limit = min(self.size, len(source))
+        offset = int(self.has_current)
+        if n == self.synced + 1 and len(source) > 0:
+            self._push(nz(source[offset]), limit)
+        else:
+            self.fifo.clear()
+            self.ordered.clear()
+            for i in range(limit - 1, -1, -1):
+                self._push(nz(source[i + offset]), limit)
+        self.synced = n
+
+    def median(self, current: Decimal | None) -> Decimal:
+        ordered = self.ordered
+        if current is None:
+            m = len(ordered)
+            if m == 0:
+                return _D0
+            if m % 2 == 1:
+                return ordered[m // 2]
+            return (ordered[m // 2 - 1] + ordered[m // 2]) / _D2
+
+        pos = bisect_left(ordered, current)
+
+        def kth(k: int) -> Decimal:
+            if k < pos:
+                return ordered[k]
+            if k == pos:
+                return current
+            return ordered[k - 1]
+
+        m = len(ordered) + 1
+        if m % 2 == 1:
+            return kth(m // 2)
+        return (kth(m // 2 - 1) + kth(m // 2)) / _D2
+
+
+def _committed_window(source: Series[Decimal], length: int) -> np.ndarray:
+    """float64 window of the last `length` committed values (current bar excluded)."""
+    if source.has_current:
+        return source.window(length + 1)[:-1]
+    return source.window(length)
+
+
+def _true_ranges(
+    high_s: Series[Decimal], low_s: Series[Decimal], close_s: Series[Decimal], length: int
+) -> np.ndarray:
+    """True ranges of the last `length` committed bars, oldest first.
+
+    The oldest bar falls back to high - low when its previous close is unavailable.
+    """
+    h = _committed_window(high_s, length)
+    lo = _committed_window(low_s, length)
+    m = min(h.size, lo.size)
+    h = h[h.size - m :]
+    lo = lo[lo.size - m :]
+    c = _committed_window(close_s, m + 1)
+    prev_c = np.full(m, np.nan)
+    k = min(m, c.size - 1)
+    if k > 0:
+        prev_c[m - k :] = c[-1 - k : -1]
+    return np.asarray(np.fmax(np.fmax(h - lo, np.abs(h - prev_c)), np.abs(lo - prev_c)))
+
+
+def _true_range(high: float, low: float, prev_close: float) -> float:
+    """True range of a single bar; NaN prev_close falls back to high - low."""
+    hl = high - low
+    if math.isnan(prev_close):
+        return hl
+    return max(hl, abs(high - prev_close), abs(low - prev_close))
+
+
+class _WilderRMA:
+    """Wilder moving average (RMA) over a stream of committed samples.
+
+    The first `length` samples seed the average with their mean, after which
+    each sample folds in as rma = (rma * (length - 1) + x) / length.
+    """
+
+    __slots__ = ("length", "count", "total", "rma")
+
+    def __init__(self, length: int) -> None:
+        self.length = length
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.rma = 0.0
+
+    def fold(self, sample: float) -> None:
+        self.count += 1
+        if self.count <= self.length:
+            self.total += sample
+            if self.count == self.length:
+                self.rma = self.total / self.length
+        else:
+            self.rma = (self.rma * (self.length - 1) + sample) / self.length
+
+    def fold_many(self, samples: np.ndarray) -> None:
+        """Fold a float64 array of samples, oldest first."""
+        self.count, self.total, self.rma = wilder_fold(
+            kernel_input(samples), self.length, self.count, self.total, float(self.rma)
+        )
+
+    def value(self, current: float | None) -> float:
+        """Average including the (optional) sample of the uncommitted bar.
+
+        Before `length` samples are available the simple mean is returned.
+        """
+        if current is None:
+            if self.count >= self.length:
+                return self.rma
+            return self.total / self.count if self.count else 0.0
+        if self.count >= self.length:
+            return (self.rma * (self.length - 1) + current) / self.length
+        return (self.total + current) / (self.count + 1)
+
+
+class _WilderATR:
+    """Streaming Wilder-smoothed true range over committed bars."""
+
+    __slots__ = ("high", "low", "avg", "synced")
+
+    def __init__(self, high_s: Series[Decimal], low_s: Series[Decimal], length: int) -> None:
+        self.high = high_s
+        self.low = low_s
+        self.avg = _WilderRMA(length)
+        self.synced = 0
+
+    def sync(self, close_s: Series[Decimal]) -> None:
+        """Fold in the bars committed since the last call.
+
+        Missed bars are folded in order while the close before them is still
+        buffered, so the result does not depend on which bars the indicator
+        was called on; otherwise the average is re-seeded from the buffer.
+        """
+        n = close_s.bar_count
+        missed = n - self.synced
+        if missed == 0:
+            return
+        if missed == 1 and self.synced and len(close_s) > 1:
+            hi = _as_float(self.high[self.high.has_current])
+            lo = _as_float(self.low[self.low.has_current])
+            prev_c = _as_float(close_s[close_s.has_current + 1])
+            self.avg.fold(_true_range(hi, lo, prev_c))
+        else:
+            if self.synced and missed >= len(close_s):
+                self.avg.reset()
+            available = min(missed, len(self.high), len(self.low), len(close_s))
+            self.avg.fold_many(_true_ranges(self.high, self.low, close_s, available))
+        self.synced = n
+
+
+class _WilderRSI:
+    """Streaming Wilder-smoothed average gain/loss over committed bars."""
+
+    __slots__ = ("gain", "loss", "synced")
+
+    def __init__(self, length: int) -> None:
+        self.gain = _WilderRMA(length)
+        self.loss = _WilderRMA(length)
+        self.synced = 0
+
+    def _fold(self, change: float) -> None:
+        self.gain.fold(change if change > 0 else 0.0)
+        self.loss.fold(-change if change < 0 else 0.0)
+
+    def sync(self, source: Series[Decimal]) -> None:
+        """Fold in the changes committed since the last call.
+
+        Missed changes are folded in order while the bar before them is still
+        buffered, so the result does not depend on which bars the indicator
+        was called on; otherwise the averages are re-seeded from the buffer.
+        """
+        n = source.bar_count
+        missed = n - self.synced
+        if missed == 0:
+            return
+        if missed == 1 and self.synced and len(source) > 1:
+            offset = int(source.has_current)
+            self._fold(_as_float(nz(source[offset])) - _as_float(nz(source[offset + 1])))
+        else:
+            if self.synced and missed >= len(source):
+                self.gain.reset()
+                self.loss.reset()
+            history = _committed_window(source, min(missed + 1, len(source)))
+            changes = np.diff(np.nan_to_num(history, nan=0.0))
+            self.gain.fold_many(np.maximum(changes, 0.0))
+            self.loss.fold_many(np.maximum(-changes, 0.0))
+        self.synced = n
+
+
+class _BufferedTotals:
+    """Exact totals of per-bar terms over the bars still held in the buffer.
+
+    Each bar's terms are computed once, when it is committed, and subtracted
+    again when the bar leaves the buffer, so the totals depend only on the
+    buffered bars and not on which bars the indicator was called on.
+    Subclasses define the terms and which bars have them.
+    """
+
+    __slots__ = ("fifo", "totals", "synced")
+
+    def __init__(self) -> None:
+        self.fifo: deque[tuple[Decimal, ...]] = deque()
+        self.totals: tuple[Decimal, ...] = ()
+        self.synced = -1
+
+    def _bars(self, source: Series[Decimal]) -> int:
+        """Number of buffered bars, newest first, that contribute terms."""
+        raise NotImplementedError
+
+    def _terms(self, source: Series[Decimal], j: int) -> tuple[Decimal, ...]:
+        """Terms of the committed bar at buffer offset `j`."""
+        raise NotImplementedError
+
+    def _push(self, terms: tuple[Decimal, ...]) -> None:
+        add = _EXACT_CONTEXT.add
+        self.fifo.append(terms)
+        self.totals = tuple(map(add, self.totals, terms)) if self.totals else terms
+
+    def sync(self, source: Series[Decimal]) -> None:
+        """Fold in the bar committed since the last call, rebuilding if out of step."""
+        n = source.bar_count
+        if n == self.synced:
+            return
+        bars = self._bars(source)
+        if n == self.synced + 1:
+            if bars > 0:
+                self._push(self._terms(source, 0))
+            sub = _EXACT_CONTEXT.subtract
+            while len(self.fifo) > bars:
+                self.totals = tuple(map(sub, self.totals, self.fifo.popleft()))
+        else:
+            self.fifo.clear()
+            self.totals = ()
+            for j in range(bars - 1, -1, -1):
+                self._push(self._terms(source, j))
+        self.synced = n
+
+    def total(self, i: int = 0) -> Decimal:
+        return self.totals[i] if self.totals else _D0
+
+
+def _signed_volume(close: Decimal, prev_close: Decimal, volume: Decimal) -> Decimal:
+    """OBV contribution of one bar: +volume on an up close, -volume on a down close."""
+    if close > prev_close:
+        return volume
+    if close < prev_close:
+        return -volume
+    return _D0
+
+
+class _CumulativeOBV(_BufferedTotals):
+    """Running on-balance volume over the buffered committed bars.
+
+    The oldest buffered bar has no previous close and contributes nothing.
+    """
+
+    __slots__ = ("volume",)
+
+    def __init__(self, volume_s: Series[Decimal]) -> None:
+        super().__init__()
+        self.volume = volume_s
+
+    def _bars(self, close_s: Series[Decimal]) -> int:
+        return max(min(len(close_s) - 1, len(self.volume)), 0)
+
+    def _terms(self, close_s: Series[Decimal], j: int) -> tuple[Decimal, ...]:
+        c = j + close_s.has_current
+        return (
+            _signed_volume(
+                nz(close_s[c]), nz(close_s[c + 1]), nz(self.volume[j + self.volume.has_current])
+            ),
+        )
+
+
+class _CumulativeSum(_BufferedTotals):
+    """Running sum of the buffered committed bars."""
+
+    __slots__ = ()
+
+    def _bars(self, source: Series[Decimal]) -> int:
+        return len(source)
+
+    def _terms(self, source: Series[Decimal], j: int) -> tuple[Decimal, ...]:
+        return (nz(source[j + source.has_current]),)
+
+
+class _CumulativeVWAP(_BufferedTotals):
+    """Running typical_price * volume and volume sums over the buffered committed bars."""
+
+    __slots__ = ("high", "low", "volume")
+
+    def __init__(
+        self, high_s: Series[Decimal], low_s: Series[Decimal], volume_s: Series[Decimal]
+    ) -> None:
+        super().__init__()
+        self.high = high_s
+        self.low = low_s
+        self.volume = volume_s
+
+    def _bars(self, close_s: Series[Decimal]) -> int:
+        return min(len(close_s), len(self.high), len(self.low), len(self.volume))
+
+    def _terms(self, close_s: Series[Decimal], j: int) -> tuple[Decimal, ...]:
+        tp = (
+            nz(self.high[j + self.high.has_current])
+            + nz(self.low[j + self.low.has_current])
+            + nz(close_s[j + close_s.has_current])
+        ) / _D3
+        v = nz(self.volume[j + self.volume.has_current])
+        return tp * v, v
+
+
+class _RollingSum:
+    """Running sum and sum of squares of the last `length - 1` committed values.
+
+    Together with the value at index 0 this covers a `length`-bar window, so
+    sma/stdev cost O(1) per bar. Sums use a wide Decimal context so removing a
+    value cancels its addition exactly and the window never drifts.
+    """
+
+    __slots__ = ("span", "fifo", "total", "total_sq", "synced")
+
+    def __init__(self, length: int) -> None:
+        self.span = length - 1
+        self.fifo: deque[Decimal] = deque()
+        self.total = _D0
+        self.total_sq = _D0
+        self.synced = -1
+
+    def _push(self, value: Decimal) -> None:
+        ctx = _EXACT_CONTEXT
+        self.fifo.append(value)
+        self.total = ctx.add(self.total, value)
+        self.total_sq = ctx.add(self.total_sq, ctx.multiply(value, value))
+        if len(self.fifo) > self.span:
+            old = self.fifo.popleft()
+            self.total = ctx.subtract(self.total, old)
+            self.total_sq = ctx.subtract(self.total_sq, ctx.multiply(old, old))
+
+    def sync(self, source: Series[Decimal]) -> None:
+        """Fold in the bar committed since the last call, rebuilding if out of step."""
+        n = source.bar_count
+        if n == self.synced:
+            return
+        offset = int(source.has_current)
+        if n == self.synced + 1 and len(source) > 0:
+            self._push(nz(source[offset]))
+        else:
+            # Seed the window with two C-level reductions instead of per-value pushes
+            count = min(self.span, len(source))
+            values = [nz(source[offset + i]) for i in range(count - 1, -1, -1)]
+            self.fifo = deque(values)
+            with localcontext(_EXACT_CONTEXT):
+                self.total = sum(values, _D0)
+                self.total_sq = sum([v * v for v in values], _D0)
+        self.synced = n
+
+
+def _rolling_sum(source: Series[Decimal], length: int) -> tuple[_RollingSum, Decimal]:
+    """Synced running-sum state for `source` and the value completing its window."""
+    key = ("sum", length)
+    state = source.cache.get(key)
+    if state is None:
+        state = source.cache[key] = _RollingSum(length)
+    state.sync(source)
+    newest = nz(source.current) if source.has_current else nz(source[length - 1])
+    return state, newest
+
+
+def _window_sums(source: Series[Decimal], length: int) -> tuple[Decimal, Decimal]:
+    """Sum and sum of squares of the `length` values at indices 0..length-1.
+
+    Callers must check that `length` values are available.
+    """
+    state, newest = _rolling_sum(source, length)
+    return state.total + newest, state.total_sq + newest * newest
+
+
+def _directional_terms(
+    high_s: Series[Decimal], low_s: Series[Decimal], close_s: Series[Decimal], i: int
+) -> tuple[Decimal, Decimal, Decimal]:
+    """(+DM, -DM, true range) of the bar at index `i` against the bar before it."""
+    h = high_s[i]
+    l = low_s[i]
+    prev_h = high_s[i + 1]
+    prev_l = low_s[i + 1]
+    prev_c = close_s[i + 1] if (i + 1) < _depth(close_s) else close_s[i]
+
+    up_move = h - prev_h
+    down_move = prev_l - l
+
+    plus_dm = up_move if (up_move > down_move and up_move > 0) else _D0
+    minus_dm = down_move if (down_move > up_move and down_move > 0) else _D0
+
+    tr_val = max(h - l, abs(h - nz(prev_c)), abs(l - nz(prev_c)))
+    return plus_dm, minus_dm, tr_val
+
+
+class _DirectionalSums:
+    """Running +DM, -DM and true range sums of the last `length` committed bars.
+
+    Each bar's terms are computed once, when it is committed. Sums use a wide
+    Decimal context so removing a bar cancels its addition exactly.
+    """
+
+    __slots__ = ("high", "low", "length", "fifo", "plus", "minus", "tr", "synced")
+
+    def __init__(self, high_s: Series[Decimal], low_s: Series[Decimal], length: int) -> None:
+        self.high = high_s
+        self.low = low_s
+        self.length = length
+        self.fifo: deque[tuple[Decimal, Decimal, Decimal]] = deque()
+        self.plus = self.minus = self.tr = _D0
+        self.synced = -1
+
+    def _push(self, terms: tuple[Decimal, Decimal, Decimal]) -> None:
+        add = _EXACT_CONTEXT.add
+        self.fifo.append(terms)
+        self.plus = add(self.plus, terms[0])
+        self.minus = add(self.minus, terms[1])
+        self.tr = add(self.tr, terms[2])
+        if len(self.fifo) > self.length:
+            self.plus, self.minus, self.tr = _drop_terms(
+                (self.plus, self.minus, self.tr), self.fifo.popleft()
+            )
+
+    def sync(self, close_s: Series[Decimal]) -> None:
+        """Fold in the bar committed since the last call, rebuilding if out of step.
+
+        Callers must ensure high, low and close hold the same bars.
+        """
+        n = close_s.bar_count
+        if n == self.synced:
+            return
+        offset = int(close_s.has_current)
+        if n == self.synced + 1 and len(close_s) > 1:
+            self._push(_directional_terms(self.high, self.low, close_s, offset))
+        else:
+            self.fifo.clear()
+            self.plus = self.minus = self.tr = _D0
+            for i in range(min(self.length, len(close_s) - 1) - 1, -1, -1):
+                self._push(_directional_terms(self.high, self.low, close_s, offset + i))
+        self.synced = n
+
+
+def _drop_terms(
+    sums: tuple[Decimal, Decimal, Decimal], terms: tuple[Decimal, Decimal, Decimal]
+) -> tuple[Decimal, Decimal, Decimal]:
+    sub = _EXACT_CONTEXT.subtract
+    return sub(sums[0], terms[0]), sub(sums[1], terms[1]), sub(sums[2], terms[2])
+
+
+class _StreamingEMA:
+    """Recursive EMA over committed bars, seeded with the running mean.
+
+    While fewer than `length` + 1 bars exist the EMA is the mean of all bars;
+    afterwards ema = alpha * x + (1 - alpha) * ema[1].
+    """
+
+    __slots__ = ("length", "alpha", "beta", "count", "total", "ema", "synced")
+
+    def __init__(self, length: int) -> None:
+        self.length = length
+        self.alpha, self.beta = _ema_coeffs(length)
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.total = _D0
+        self.ema = _D0
+        self.synced = 0
+
+    def fold(self, value: Decimal) -> None:
+        self.count += 1
+        if self.count <= self.length:
+            self.total += value
+            self.ema = self.total / _dec_int(self.count)
+        else:
+            self.ema = self.alpha * value + self.beta * self.ema
+
+    def value(self, current: Decimal) -> Decimal:
+        """EMA with `current` as the value of the uncommitted bar."""
+        if self.count < self.length:
+            return (self.total + current) / _dec_int(self.count + 1)
+        return self.alpha * current + self.beta * self.ema
+
+    def sync(self, source: Series[Decimal]) -> None:
+        """Fold in the bars committed since the last call.
+
+        Missed bars still in the buffer are folded in order, so the result
+        does not depend on which bars the indicator was called on. If some
+        have already left the buffer the EMA is re-seeded from the buffer.
+        """
+        n = source.bar_count
+        missed = n - self.synced
+        if missed == 0:
+            return
+        if missed > len(source):
+            self.reset()
+            missed = len(source)
+        offset = int(source.has_current)
+        for i in range(missed - 1, -1, -1):
+            self.fold(nz(source[offset + i]))
+        self.synced = n
+
+
+def _mean_std(source: Series[Decimal], length: int) -> tuple[float, float] | None:
+    """Mean and population standard deviation of the last `length` bars.
+
+    Returns None when fewer than `length` bars are available.
+    """
+    if length <= 0 or _depth(source) < length:
+        return None
+    total, total_sq = _window_sums(source, length)
+    n = _dec_int(length)
+    mean = total / n
+    variance = (total_sq - total * mean) / n
+    return float(mean), math.sqrt(max(float(variance), 0.0))
+
+
+@lru_cache(maxsize=128)
+def _wma_weights(length: int) -> tuple[np.ndarray, float]:
+    """WMA weights 1..length (oldest..newest) and their sum."""
+    weights = np.arange(1, length + 1, dtype=np.float64)
+    weights.setflags(write=False)
+    return weights, length * (length + 1) / 2
+
+
+@lru_cache(maxsize=128)
+def _linreg_x(length: int) -> tuple[np.ndarray, float, float]:
+    """Regression abscissa 0..length-1 (oldest..newest) with its sum and sum of squares."""
+    x = np.arange(length, dtype=np.float64)
+    x.setflags(write=False)
+    return x, float(x.sum()), float(np.dot(x, x))
 
 
 def sma(source: Series[Decimal], length: int) -> Decimal:
@@ -18,95 +788,65 @@ def sma(source: Series[Decimal], length: int) -> Decimal:
 
     Pine Script equivalent: ta.sma(source, length)
     """
-    if len(source) < length - 1:  # -1 because current is not committed yet
-        return Decimal("0")
+    # Covers the current bar too, so length - 1 committed bars may suffice
+    if length <= 0 or _depth(source) < length:
+        return _D0
 
-    total = source.current
-    for i in range(1, length):
-        try:
-            val = source[i]
-            total += nz(val)
-        except Exception:
-            return Decimal("0")
-
-    return total / Decimal(str(length))
+    state, newest = _rolling_sum(source, length)
+    return (state.total + newest) / _dec_int(length)
 
 
+@_ta_precision
 def ema(source: Series[Decimal], length: int) -> Decimal:
     """Exponential Moving Average.
 
     Pine Script equivalent: ta.ema(source, length)
     Uses the standard formula: EMA = alpha * source + (1 - alpha) * EMA[1]
-    where alpha = 2 / (length + 1)
+    where alpha = 2 / (length + 1), seeded with the SMA of the first bars.
     """
     if len(source) < 1:
         return source.current
 
-    alpha = Decimal("2") / (Decimal(str(length)) + Decimal("1"))
-
-    # For first bars, use SMA as seed
-    if len(source) < length:
-        return sma(source, min(length, len(source) + 1))
+    key = ("ema", length)
+    state = source.cache.get(key)
+    if state is None:
+        state = source.cache[key] = _StreamingEMA(length)
+    state.sync(source)
 
-    # Get previous EMA value - approximate using SMA of previous values for bootstrap
-    # In a proper implementation, the EMA series would be maintained across bars
-    # Here we compute recursively up to length bars back
-    prev_ema = _ema_recursive(source, length, alpha, 1, min(length * 3, len(source)))
-    return alpha * source.current + (Decimal("1") - alpha) * prev_ema
-
-
-def _ema_recursive(
-    source: Series[Decimal], length: int, alpha: Decimal, offset: int, max_depth: int
-) -> Decimal:
-    """Compute EMA at a given offset, recursing back to get history."""
-    if offset >= max_depth or offset >= len(source):
-        # Base case: use SMA
-        total = Decimal("0")
-        count = 0
-        for i in range(offset, min(offset + length, len(source))):
-            val = source[i]
-            if not na(val):
-                total += val
-                count += 1
-        return total / Decimal(str(max(count, 1)))
-
-    prev = _ema_recursive(source, length, alpha, offset + 1, max_depth)
-    return alpha * nz(source[offset]) + (Decimal("1") - alpha) * prev
+    if not source.has_current:
+        return state.ema
+    return state.value(source.current)
 
 
 def rsi(source: Series[Decimal], length: int = 14) -> Decimal:
     """Relative Strength Index.
 
     Pine Script equivalent: ta.rsi(source, length)
-    Uses RMA (Wilder's smoothing) for averaging gains and losses.
+    Uses RMA (Wilder's smoothing) for averaging gains and losses, seeded with
+    the simple mean of the first `length` changes.
     """
     if len(source) < length:
-        return Decimal("50")  # Neutral until enough data
-
-    gains = Decimal("0")
-    losses = Decimal("0")
-
-    # Calculate initial average gain/loss using SMA
-    for i in range(length):
-        try:
-            current = source[i] if i == 0 else source[i]
-            previous = source[i + 1]
-            change = nz(current) - nz(previous)
-            if change > 0:
-                gains += change
-            else:
-                losses += abs(change)
-        except Exception:
-            continue
-
-    avg_gain = gains / Decimal(str(length))
-    avg_loss = losses / Decimal(str(length))
+        return _D50  # Neutral until enough data
+
+    key = ("rsi", length)
+    state = source.cache.get(key)
+    if state is None:
+        state = source.cache[key] = _WilderRSI(length)
+    state.sync(source)
+
+    if source.has_current and len(source) > 0:
+        change = _as_float(nz(source.current)) - _as_float(nz(source[1]))
+        avg_gain = state.gain.value(change if change > 0 else 0.0)
+        avg_loss = state.loss.value(-change if change < 0 else 0.0)
+    else:
+        avg_gain = state.gain.value(None)
+        avg_loss = state.loss.value(None)
 
     if avg_loss == 0:
-        return Decimal("100")
+        return _D100
 
     rs = avg_gain / avg_loss
-    return Decimal("100") - (Decimal("100") / (Decimal("1") + rs))
+    return _from_float(100.0 - 100.0 / (1.0 + rs))
 
 
 def macd(
@@ -138,17 +878,11 @@ def crossover(series1: Series[Decimal], series2: Series[Decimal]) -> bool:
     Pine Script equivalent: ta.crossover(series1, series2)
     Returns True when series1[0] > series2[0] AND series1[1] <= series2[1]
     """
-    if len(series1) < 1 or len(series2) < 1:
-        return False
-
-    try:
-        curr1 = nz(series1.current)
-        curr2 = nz(series2.current)
-        prev1 = nz(series1[1])
-        prev2 = nz(series2[1])
-        return curr1 > curr2 and prev1 <= prev2
-    except Exception:
+    pair1 = _last_two(series1)
+    pair2 = _last_two(series2)
+    if pair1 is None or pair2 is None:
         return False
+    return pair1[0] > pair2[0] and pair1[1] <= pair2[1]
 
 
 def crossunder(series1: Series[Decimal], series2: Series[Decimal]) -> bool:
@@ -157,17 +891,11 @@ def crossunder(series1: Series[Decimal], series2: Series[Decimal]) -> bool:
     Pine Script equivalent: ta.crossunder(series1, series2)
     Returns True when series1[0] < series2[0] AND series1[1] >= series2[1]
     """
-    if len(series1) < 1 or len(series2) < 1:
-        return False
-
-    try:
-        curr1 = nz(series1.current)
-        curr2 = nz(series2.current)
-        prev1 = nz(series1[1])
-        prev2 = nz(series2[1])
-        return curr1 < curr2 and prev1 >= prev2
-    except Exception:
+    pair1 = _last_two(series1)
+    pair2 = _last_two(series2)
+    if pair1 is None or pair2 is None:
         return False
+    return pair1[0] < pair2[0] and pair1[1] >= pair2[1]
 
 
 def highest(source: Series[Decimal], length: int) -> Decimal:
@@ -175,15 +903,7 @@ def highest(source: Series[Decimal], length: int) -> Decimal:
 
     Pine Script equivalent: ta.highest(source, length)
     """
-    result = source.current
-    for i in range(1, length):
-        try:
-            val = source[i]
-            if not na(val) and val > result:
-                result = val
-        except Exception:
-            break
-    return result
+    return source[_extreme_offset(source, length, find_max=True)]
 
 
 def lowest(source: Series[Decimal], length: int) -> Decimal:
@@ -191,62 +911,19 @@ def lowest(source: Series[Decimal], length: int) -> Decimal:
 
     Pine Script equivalent: ta.lowest(source, length)
     """
-    result = source.current
-    for i in range(1, length):
-        try:
-            val = source[i]
-            if not na(val) and val < result:
-                result = val
-        except Exception:
-            break
-    return result
+    return source[_extreme_offset(source, length, find_max=False)]
 
 
 def stdev(source: Series[Decimal], length: int) -> Decimal:
     """Standard deviation over the last `length` bars.
 
     Pine Script equivalent: ta.stdev(source, length)
+    Population standard deviation (ddof=0).
     """
-    mean = sma(source, length)
-    if mean == 0 and len(source) < length:
-        return Decimal("0")
-
-    sum_sq = Decimal("0")
-    count = 0
-    for i in range(length):
-        try:
-            val = source[i] if i == 0 else source[i]
-            if i == 0:
-                val = source.current
-            else:
-                val = source[i]
-            diff = nz(val) - mean
-            sum_sq += diff * diff
-            count += 1
-        except Exception:
-            break
-
-    if count <= 1:
-        return Decimal("0")
-
-    variance = sum_sq / Decimal(str(count))
-    # Newton's method for square root (Decimal doesn't have sqrt)
-    return _decimal_sqrt(variance)
-
-
-def _decimal_sqrt(value: Decimal) -> Decimal:
-    """Compute square root of a Decimal using Newton's method."""
-    if value <= 0:
-        return Decimal("0")
-
-    # Initial guess
-    x = value
-    while True:
-        new_x = (x + value / x) / Decimal("2")
-        if abs(new_x - x) < Decimal("1E-20"):
-            break
-        x = new_x
-    return x
+    stats = _mean_std(source, length)
+    if stats is None:
+        return _D0
+    return _from_float(stats[1])
 
 
 def atr(
@@ -255,36 +932,24 @@ def atr(
     """Average True Range.
 
     Pine Script equivalent: ta.atr(length)
+    Wilder's smoothing (RMA) of the true range. Until `length` bars are
+    available the simple mean of the available true ranges is returned.
     """
-    if len(close) < 1:
-        return high.current - low.current
-
-    tr_values: list[Decimal] = []
-    for i in range(min(length, len(close))):
-        if i == 0:
-            h = high.current
-            l = low.current
-            try:
-                prev_c = close[1]
-            except Exception:
-                prev_c = close.current
-        else:
-            try:
-                h = high[i]
-                l = low[i]
-                prev_c = close[i + 1] if (i + 1) < len(close) else close[i]
-            except Exception:
-                break
-
-        tr = max(h - l, abs(h - nz(prev_c)), abs(l - nz(prev_c)))
-        tr_values.append(tr)
+    key = ("atr", length, id(high), id(low))
+    state = close.cache.get(key)
+    if state is None or state.high is not high or state.low is not low:
+        state = close.cache[key] = _WilderATR(high, low, length)
+    state.sync(close)
 
-    if not tr_values:
-        return Decimal("0")
+    if not close.has_current:
+        return _from_float(state.avg.value(None))
 
-    return sum(tr_values) / Decimal(str(len(tr_values)))
+    prev_c = _as_float(close[1]) if len(close) > 0 else math.nan
+    current_tr = _true_range(_as_float(high.current), _as_float(low.current), prev_c)
+    return _from_float(state.avg.value(current_tr))
 
 
+@_bar_memo
 def bb(
     source: Series[Decimal], length: int = 20, mult: Decimal = Decimal("2")
 ) -> tuple[Decimal, Decimal, Decimal]:
@@ -293,11 +958,12 @@ def bb(
     Pine Script equivalent: ta.bb(source, length, mult)
     Returns: (upper, middle, lower)
     """
-    middle = sma(source, length)
-    sd = stdev(source, length)
-    upper = middle + mult * sd
-    lower = middle - mult * sd
-    return upper, middle, lower
+    stats = _mean_std(source, length)
+    if stats is None:
+        return _D0, _D0, _D0
+    middle, sd = stats
+    band = float(mult) * sd
+    return _from_float(middle + band), _from_float(middle), _from_float(middle - band)
 
 
 def change(source: Series[Decimal], length: int = 1) -> Decimal:
@@ -305,10 +971,9 @@ def change(source: Series[Decimal], length: int = 1) -> Decimal:
 
     Pine Script equivalent: ta.change(source, length)
     """
-    try:
-        return source.current - source[length]
-    except Exception:
-        return Decimal("0")
+    if length < 0 or _depth(source) <= length:
+        return _D0
+    return source.current - source[length]
 
 
 def rma(source: Series[Decimal], length: int) -> Decimal:
@@ -316,9 +981,20 @@ def rma(source: Series[Decimal], length: int) -> Decimal:
 
     Pine Script equivalent: ta.rma(source, length)
     RMA = (1/length) * source + (1 - 1/length) * RMA[1]
+    The recursion runs over at most the last 3 * length bars, seeded with the
+    mean of the `length` bars before them.
     """
-    alpha = Decimal("1") / Decimal(str(length))
-    return _ema_recursive(source, length, alpha, 0, min(length * 3, max(len(source), 1)))
+    depth = min(length * 3, len(source))
+    size = min(depth + length, len(source))
+    if size == 0:
+        return _D0
+
+    window = source.window(size)
+    seed = window[: size - depth]
+    seed = seed[~np.isnan(seed)]
+    start = float(seed.sum()) / max(seed.size, 1)
+    samples = np.nan_to_num(window[size - depth :], nan=0.0)
+    return _from_float(ema_fold(kernel_input(samples), 1.0 / length, start))
 
 
 def tr(
@@ -330,11 +1006,10 @@ def tr(
     """
     h = high.current
     l = low.current
-    try:
-        prev_c = close[1]
-    except Exception:
+    if len(close) + close.has_current < 2:
         return h - l
 
+    prev_c = close[1]
     return max(h - l, abs(h - prev_c), abs(l - prev_c))
 
 
@@ -354,7 +1029,15 @@ def cross(series1: Series[Decimal], series2: Series[Decimal]) -> bool:
 
     Pine Script equivalent: ta.cross(series1, series2)
     """
-    return crossover(series1, series2) or crossunder(series1, series2)
+    pair1 = _last_two(series1)
+    pair2 = _last_two(series2)
+    if pair1 is None or pair2 is None:
+        return False
+    if pair1[0] > pair2[0]:
+        return pair1[1] <= pair2[1]
+    if pair1[0] < pair2[0]:
+        return pair1[1] >= pair2[1]
+    return False
 
 
 def mom(source: Series[Decimal], length: int = 10) -> Decimal:
@@ -370,18 +1053,18 @@ def roc(source: Series[Decimal], length: int = 10) -> Decimal:
 
     Pine Script equivalent: ta.roc(source, length)
     """
-    try:
-        prev = source[length]
-    except Exception:
-        return Decimal("0")
+    if length < 0 or _depth(source) <= length:
+        return _D0
+    prev = source[length]
     if prev == 0:
-        return Decimal("0")
-    return Decimal("100") * (source.current - prev) / prev
+        return _D0
+    return _D100 * (source.current - prev) / prev
 
 
 # ── Faz 2: Moving Averages ───────────────────────────────────────────
 
 
+@_bar_memo
 def wma(source: Series[Decimal], length: int) -> Decimal:
     """Weighted Moving Average.
 
@@ -389,21 +1072,21 @@ def wma(source: Series[Decimal], length: int) -> Decimal:
     Weight for bar i (0=current) is (length - i).
     """
     if len(source) < length - 1:
-        return Decimal("0")
+        return _D0
 
-    weighted_sum = Decimal("0")
-    weight_sum = Decimal("0")
-    for i in range(length):
-        w = Decimal(str(length - i))
-        try:
-            val = source.current if i == 0 else source[i]
-        except Exception:
-            return Decimal("0")
-        weighted_sum += w * nz(val)
-        weight_sum += w
-    return weighted_sum / weight_sum
+    window = _nz_window(source, length)
+    if window.size < length:
+        return _D0
+    return _wma_tail(window, length)
 
 
+def _wma_tail(window: np.ndarray, length: int) -> Decimal:
+    """WMA of the last `length` values of `window`."""
+    weights, weight_sum = _wma_weights(length)
+    return _from_float(float(np.dot(weights, window[window.size - length :])) / weight_sum)
+
+
+@_bar_memo
 def hma(source: Series[Decimal], length: int) -> Decimal:
     """Hull Moving Average (simplified).
 
@@ -411,33 +1094,28 @@ def hma(source: Series[Decimal], length: int) -> Decimal:
     HMA = 2 * WMA(n/2) - WMA(n)
     """
     half_len = max(length // 2, 1)
-    wma_half = wma(source, half_len)
-    wma_full = wma(source, length)
-    return Decimal("2") * wma_half - wma_full
+    # Both WMAs read the tail of one window
+    window = _nz_window(source, max(length, half_len))
+    wma_half = _wma_tail(window, half_len) if window.size >= half_len else _D0
+    wma_full = _wma_tail(window, length) if window.size >= length else _D0
+    return _D2 * wma_half - wma_full
 
 
+@_bar_memo
 def vwma(source: Series[Decimal], volume: Series[Decimal], length: int) -> Decimal:
     """Volume-Weighted Moving Average.
 
     Pine Script equivalent: ta.vwma(source, length)
     """
-    if len(source) < length - 1 or len(volume) < length - 1:
-        return Decimal("0")
-
-    pv_sum = Decimal("0")
-    v_sum = Decimal("0")
-    for i in range(length):
-        try:
-            p = source.current if i == 0 else source[i]
-            v = volume.current if i == 0 else volume[i]
-        except Exception:
-            return Decimal("0")
-        pv_sum += nz(p) * nz(v)
-        v_sum += nz(v)
+    if _depth(source) < length or _depth(volume) < length:
+        return _D0
 
+    prices = _nz_window(source, length)
+    volumes = _nz_window(volume, length)
+    v_sum = float(volumes.sum())
     if v_sum == 0:
-        return Decimal("0")
-    return pv_sum / v_sum
+        return _D0
+    return _from_float(float(np.dot(prices, volumes)) / v_sum)
 
 
 # ── Faz 3: Stochastic and Pivot Points ───────────────────────────────
@@ -458,8 +1136,8 @@ def stoch(
     lo = lowest(low_s, length)
     diff = hi - lo
     if diff == 0:
-        return Decimal("0")
-    return Decimal("100") * (source.current - lo) / diff
+        return _D0
+    return _D100 * (source.current - lo) / diff
 
 
 def pivothigh(source: Series[Decimal], leftbars: int, rightbars: int) -> Optional[Decimal]:
@@ -471,32 +1149,16 @@ def pivothigh(source: Series[Decimal], leftbars: int, rightbars: int) -> Optiona
     """
     # The candidate bar is at offset `rightbars` from current
     needed = leftbars + rightbars
-    if len(source) < needed:
+    if len(source) < needed or len(source) + source.has_current <= needed:
         return None
 
-    try:
-        candidate = source[rightbars]
-    except Exception:
+    candidate = source[rightbars]
+    if na(candidate):
         return None
 
-    # Check right side: candidate must be >= all bars from [0..rightbars-1]
-    for i in range(rightbars):
-        try:
-            val = source.current if i == 0 else source[i]
-            if nz(val) > candidate:
-                return None
-        except Exception:
-            return None
-
-    # Check left side: candidate must be >= all bars from [rightbars+1..rightbars+leftbars]
-    for i in range(rightbars + 1, rightbars + leftbars + 1):
-        try:
-            val = source[i]
-            if nz(val) > candidate:
-                return None
-        except Exception:
-            return None
-
+    # Candidate must be >= every bar in [0..rightbars+leftbars]
+    if candidate < highest(source, needed + 1):
+        return None
     return candidate
 
 
@@ -507,36 +1169,22 @@ def pivotlow(source: Series[Decimal], leftbars: int, rightbars: int) -> Optional
     Returns the pivot value or None.
     """
     needed = leftbars + rightbars
-    if len(source) < needed:
+    if len(source) < needed or len(source) + source.has_current <= needed:
         return None
 
-    try:
-        candidate = source[rightbars]
-    except Exception:
+    candidate = source[rightbars]
+    if na(candidate):
         return None
 
-    for i in range(rightbars):
-        try:
-            val = source.current if i == 0 else source[i]
-            if nz(val) < candidate:
-                return None
-        except Exception:
-            return None
-
-    for i in range(rightbars + 1, rightbars + leftbars + 1):
-        try:
-            val = source[i]
-            if nz(val) < candidate:
-                return None
-        except Exception:
-            return None
-
+    if candidate > lowest(source, needed + 1):
+        return None
     return candidate
 
 
 # ── Faz 4: DMI/ADX and Linear Regression ─────────────────────────────
 
 
+@_bar_memo
 def dmi(
     high_s: Series[Decimal],
     low_s: Series[Decimal],
@@ -550,50 +1198,53 @@ def dmi(
     Returns: (plus_di, minus_di, adx)
     """
     if len(high_s) < di_length + 1:
-        return Decimal("0"), Decimal("0"), Decimal("0")
-
-    plus_dm_sum = Decimal("0")
-    minus_dm_sum = Decimal("0")
-    tr_sum = Decimal("0")
-
-    for i in range(di_length):
-        try:
-            h = high_s.current if i == 0 else high_s[i]
-            l = low_s.current if i == 0 else low_s[i]
-            prev_h = high_s[i + 1]
-            prev_l = low_s[i + 1]
-            prev_c = close_s[i + 1] if (i + 1) <= len(close_s) else close_s[i]
-        except Exception:
-            continue
-
-        up_move = h - prev_h
-        down_move = prev_l - l
-
-        plus_dm = up_move if (up_move > down_move and up_move > 0) else Decimal("0")
-        minus_dm = down_move if (down_move > up_move and down_move > 0) else Decimal("0")
-
-        tr_val = max(h - l, abs(h - nz(prev_c)), abs(l - nz(prev_c)))
-
-        plus_dm_sum += plus_dm
-        minus_dm_sum += minus_dm
-        tr_sum += tr_val
+        return _D0, _D0, _D0
+
+    has_current = close_s.has_current
+    if (
+        len(high_s) == len(low_s) == len(close_s)
+        and high_s.has_current == low_s.has_current == has_current
+    ):
+        # Committed bars come from running sums; only the current bar is new
+        key = ("dmi", di_length, id(high_s), id(low_s))
+        state = close_s.cache.get(key)
+        if state is None or state.high is not high_s or state.low is not low_s:
+            state = close_s.cache[key] = _DirectionalSums(high_s, low_s, di_length)
+        state.sync(close_s)
+        sums = (state.plus, state.minus, state.tr)
+        if has_current:
+            if len(state.fifo) == di_length:
+                sums = _drop_terms(sums, state.fifo[0])
+            add = _EXACT_CONTEXT.add
+            plus_dm, minus_dm, tr_val = _directional_terms(high_s, low_s, close_s, 0)
+            sums = (add(sums[0], plus_dm), add(sums[1], minus_dm), add(sums[2], tr_val))
+        plus_dm_sum, minus_dm_sum, tr_sum = sums
+    else:
+        plus_dm_sum = minus_dm_sum = tr_sum = _D0
+        bars = min(di_length, _depth(high_s) - 1, _depth(low_s) - 1, _depth(close_s))
+        for i in range(bars):
+            plus_dm, minus_dm, tr_val = _directional_terms(high_s, low_s, close_s, i)
+            plus_dm_sum += plus_dm
+            minus_dm_sum += minus_dm
+            tr_sum += tr_val
 
     if tr_sum == 0:
-        return Decimal("0"), Decimal("0"), Decimal("0")
+        return _D0, _D0, _D0
 
-    plus_di = Decimal("100") * plus_dm_sum / tr_sum
-    minus_di = Decimal("100") * minus_dm_sum / tr_sum
+    plus_di = _D100 * plus_dm_sum / tr_sum
+    minus_di = _D100 * minus_dm_sum / tr_sum
 
     di_sum = plus_di + minus_di
     if di_sum == 0:
-        adx_val = Decimal("0")
+        adx_val = _D0
     else:
-        dx = Decimal("100") * abs(plus_di - minus_di) / di_sum
+        dx = _D100 * abs(plus_di - minus_di) / di_sum
         adx_val = dx  # Simplified: single-period DX as ADX approximation
 
     return plus_di, minus_di, adx_val
 
 
+@_bar_memo
 def linreg(source: Series[Decimal], length: int, offset: int = 0) -> Decimal:
     """Linear Regression Value.
 
@@ -601,67 +1252,53 @@ def linreg(source: Series[Decimal], length: int, offset: int = 0) -> Decimal:
     Least squares fit y = mx + b evaluated at the most recent point minus offset.
     """
     if len(source) < length - 1:
-        return Decimal("0")
+        return _D0
 
-    n = Decimal(str(length))
-    sum_x = Decimal("0")
-    sum_y = Decimal("0")
-    sum_xy = Decimal("0")
-    sum_x2 = Decimal("0")
+    y = _nz_window(source, length)
+    if y.size < length:
+        return _D0
 
-    for i in range(length):
-        x = Decimal(str(length - 1 - i))  # x=0 oldest, x=length-1 newest
-        try:
-            y = source.current if i == 0 else source[i]
-        except Exception:
-            return Decimal("0")
-        y = nz(y)
-        sum_x += x
-        sum_y += y
-        sum_xy += x * y
-        sum_x2 += x * x
-
-    denom = n * sum_x2 - sum_x * sum_x
+    x, sum_x, sum_x2 = _linreg_x(length)
+    sum_y = float(y.sum())
+    denom = length * sum_x2 - sum_x * sum_x
     if denom == 0:
-        return sum_y / n
-
-    m = (n * sum_xy - sum_x * sum_y) / denom
-    b = (sum_y - m * sum_x) / n
+        return _from_float(sum_y / length)
 
-    eval_x = Decimal(str(length - 1 - offset))
-    return m * eval_x + b
+    m = (length * float(np.dot(x, y)) - sum_x * sum_y) / denom
+    b = (sum_y - m * sum_x) / length
+    return _from_float(m * (length - 1 - offset) + b)
 
 
 # ── Faz 5: Tier 2 Oscillators and Volume ─────────────────────────────
 
 
+@_bar_memo
+@_ta_precision
 def cci(source: Series[Decimal], length: int = 20) -> Decimal:
     """Commodity Channel Index.
 
     Pine Script equivalent: ta.cci(source, length)
     CCI = (source - SMA) / (0.015 * mean_deviation)
     """
-    if len(source) < length - 1:
-        return Decimal("0")
+    if _depth(source) < length:
+        return _D0
 
     mean = sma(source, length)
 
     # Mean deviation
-    dev_sum = Decimal("0")
+    dev_sum = _D0
     for i in range(length):
-        try:
-            val = source.current if i == 0 else source[i]
-        except Exception:
-            return Decimal("0")
-        dev_sum += abs(nz(val) - mean)
+        dev_sum += abs(nz(source[i]) - mean)
 
-    mean_dev = dev_sum / Decimal(str(length))
+    mean_dev = dev_sum / _dec_int(length)
     if mean_dev == 0:
-        return Decimal("0")
+        return _D0
 
-    return (source.current - mean) / (Decimal("0.015") * mean_dev)
+    return (source.current - mean) / (_D_015 * mean_dev)
 
 
+@_bar_memo
+@_ta_precision
 def mfi(
     high_s: Series[Decimal],
     low_s: Series[Decimal],
@@ -675,37 +1312,31 @@ def mfi(
     RSI-like but uses typical_price * volume.
     """
     if len(close_s) < length:
-        return Decimal("50")
-
-    pos_flow = Decimal("0")
-    neg_flow = Decimal("0")
-
-    for i in range(length):
-        try:
-            h = high_s.current if i == 0 else high_s[i]
-            l = low_s.current if i == 0 else low_s[i]
-            c = close_s.current if i == 0 else close_s[i]
-            v = volume_s.current if i == 0 else volume_s[i]
-            prev_h = high_s[i + 1]
-            prev_l = low_s[i + 1]
-            prev_c = close_s[i + 1]
-        except Exception:
-            continue
-
-        tp = (h + l + c) / Decimal("3")
-        prev_tp = (prev_h + prev_l + prev_c) / Decimal("3")
-        raw_mf = tp * nz(v)
-
-        if tp > prev_tp:
-            pos_flow += raw_mf
-        else:
-            neg_flow += raw_mf
+        return _D50
+
+    bars = min(
+        length,
+        _depth(high_s) - 1,
+        _depth(low_s) - 1,
+        _depth(close_s) - 1,
+        _depth(volume_s),
+    )
+    if bars <= 0:
+        return _D100
+
+    # Typical prices of the last `bars` bars plus the one before them
+    typical = (
+        high_s.window(bars + 1) + low_s.window(bars + 1) + close_s.window(bars + 1)
+    ) / 3.0
+    raw_mf = typical[1:] * _nz_window(volume_s, bars)
+    up = typical[1:] > typical[:-1]
+    pos_flow = float(raw_mf[up].sum())
+    neg_flow = float(raw_mf[~up].sum())
 
     if neg_flow == 0:
-        return Decimal("100")
+        return _D100
 
-    mf_ratio = pos_flow / neg_flow
-    return Decimal("100") - Decimal("100") / (Decimal("1") + mf_ratio)
+    return _from_float(100.0 - 100.0 / (1.0 + pos_flow / neg_flow))
 
 
 def wpr(
@@ -723,46 +1354,30 @@ def wpr(
     lo = lowest(low_s, length)
     diff = hi - lo
     if diff == 0:
-        return Decimal("0")
-    return Decimal("-100") * (hi - close_s.current) / diff
+        return _D0
+    return _D_NEG100 * (hi - close_s.current) / diff
 
 
 def obv(close_s: Series[Decimal], volume_s: Series[Decimal]) -> Decimal:
     """On-Balance Volume.
 
     Pine Script equivalent: ta.obv
-    Cumulative: if close > close[1] then +volume, else -volume.
+    Cumulative: if close > close[1] then +volume, else -volume. Only bars
+    still held in the series buffer (max_bars_back) are counted.
     """
-    result = Decimal("0")
-    available = min(len(close_s), len(volume_s))
-
-    for i in range(available):
-        try:
-            c = close_s[i]
-            v = nz(volume_s[i])
-            prev_c = close_s[i + 1]
-        except Exception:
-            break
-        if c > prev_c:
-            result += v
-        elif c < prev_c:
-            result -= v
-
-    # Current bar
-    try:
-        c_cur = close_s.current
-        c_prev = close_s[1]
-        v_cur = nz(volume_s.current)
-        if c_cur > c_prev:
-            result += v_cur
-        elif c_cur < c_prev:
-            result -= v_cur
-    except Exception:
-        pass
-
+    key = ("obv", id(volume_s))
+    state = close_s.cache.get(key)
+    if state is None or state.volume is not volume_s:
+        state = close_s.cache[key] = _CumulativeOBV(volume_s)
+    state.sync(close_s)
+
+    result = state.total()
+    if close_s.has_current and len(close_s) > 0 and volume_s:
+        result += _signed_volume(nz(close_s.current), nz(close_s[1]), nz(volume_s.current))
     return result
 
 
+@_ta_precision
 def vwap(
     high_s: Series[Decimal],
     low_s: Series[Decimal],
@@ -772,56 +1387,53 @@ def vwap(
     """Volume-Weighted Average Price.
 
     Pine Script equivalent: ta.vwap
-    cumulative(typical_price * volume) / cumulative(volume)
+    cumulative(typical_price * volume) / cumulative(volume), over the bars
+    still held in the series buffer (max_bars_back).
     """
-    tp_v_sum = Decimal("0")
-    v_sum = Decimal("0")
-
-    # Historical bars
-    for i in range(len(close_s)):
-        try:
-            h = high_s[i]
-            l = low_s[i]
-            c = close_s[i]
-            v = nz(volume_s[i])
-        except Exception:
-            break
-        tp = (h + l + c) / Decimal("3")
-        tp_v_sum += tp * v
-        v_sum += v
-
-    # Current bar
-    try:
-        tp_cur = (high_s.current + low_s.current + close_s.current) / Decimal("3")
+    key = ("vwap", id(high_s), id(low_s), id(volume_s))
+    state = close_s.cache.get(key)
+    if (
+        state is None
+        or state.high is not high_s
+        or state.low is not low_s
+        or state.volume is not volume_s
+    ):
+        state = close_s.cache[key] = _CumulativeVWAP(high_s, low_s, volume_s)
+    state.sync(close_s)
+
+    tp_v_sum = state.total(0)
+    v_sum = state.total(1)
+    if close_s.has_current and high_s and low_s and volume_s:
+        tp_cur = (nz(high_s.current) + nz(low_s.current) + nz(close_s.current)) / _D3
         v_cur = nz(volume_s.current)
         tp_v_sum += tp_cur * v_cur
         v_sum += v_cur
-    except Exception:
-        pass
 
     if v_sum == 0:
-        return Decimal("0")
+        return _D0
     return tp_v_sum / v_sum
 
 
 def cum(source: Series[Decimal]) -> Decimal:
-    """Cumulative sum of all bars.
+    """Cumulative sum of the bars held in the series buffer.
 
     Pine Script equivalent: ta.cum(source)
+    Bars older than max_bars_back have left the buffer and are not counted.
     """
-    total = nz(source.current)
-    # Add committed history (buffer), accessed via index 1, 2, ...
-    for i in range(1, len(source) + 1):
-        try:
-            total += nz(source[i])
-        except Exception:
-            break
-    return total
+    state = source.cache.get(("cum",))
+    if state is None:
+        state = source.cache[("cum",)] = _CumulativeSum()
+    state.sync(source)
+
+    if source.has_current:
+        return state.total() + nz(source.current)
+    return state.total()
 
 
 # ── Faz 6: Supertrend, Keltner, SAR ──────────────────────────────────
 
 
+@_bar_memo
 def kc(
     source: Series[Decimal],
     length: int,
@@ -837,14 +1449,13 @@ def kc(
     Returns: (upper, middle, lower)
     middle = EMA(source, length), upper/lower = middle ± mult * ATR
     """
-    middle = ema(source, length)
     if high_s is not None and low_s is not None and close_s is not None:
         atr_val = atr(high_s, low_s, close_s, atr_length)
     else:
         atr_val = atr(source, source, source, atr_length)
-    upper = middle + mult * atr_val
-    lower = middle - mult * atr_val
-    return upper, middle, lower
+    middle = float(ema(source, length))
+    band = float(mult) * float(atr_val)
+    return _from_float(middle + band), _from_float(middle), _from_float(middle - band)
 
 
 def supertrend(
@@ -860,7 +1471,7 @@ def supertrend(
     Returns: (value, direction) where direction is 1 (up/bullish) or -1 (down/bearish)
     """
     atr_val = atr(high_s, low_s, close_s, atr_period)
-    hl2 = (high_s.current + low_s.current) / Decimal("2")
+    hl2 = (high_s.current + low_s.current) / _D2
 
     upper_band = hl2 + factor * atr_val
     lower_band = hl2 - factor * atr_val
@@ -884,15 +1495,13 @@ def sar(
     Pine Script equivalent: ta.sar(start, inc, max)
     Simplified single-bar computation using available history.
     """
-    if len(high_s) < 2:
+    if len(high_s) < 2 or _depth(low_s) < 2:
         return low_s.current
 
     # Determine initial trend from recent bars
-    try:
-        prev_close_approx = (high_s[1] + low_s[1]) / Decimal("2")
-        curr_close_approx = (high_s.current + low_s.current) / Decimal("2")
-    except Exception:
-        return low_s.current
+    prev_close_approx = (high_s[1] + low_s[1]) / _D2
+    curr_close_approx = (high_s.current + low_s.current) / _D2
+    lookback = min(len(high_s), 20, _depth(high_s), _depth(low_s))
 
     is_long = curr_close_approx >= prev_close_approx
     af = start
@@ -901,12 +1510,9 @@ def sar(
         sar_val = low_s.current
         ep = high_s.current
         # Walk back through history to refine
-        for i in range(1, min(len(high_s), 20)):
-            try:
-                lo = low_s[i]
-                hi = high_s[i]
-            except Exception:
-                break
+        for i in range(1, lookback):
+            lo = low_s[i]
+            hi = high_s[i]
             if lo < sar_val:
                 sar_val = lo
             if hi > ep:
@@ -916,12 +1522,9 @@ def sar(
     else:
         sar_val = high_s.current
         ep = low_s.current
-        for i in range(1, min(len(low_s), 20)):
-            try:
-                hi = high_s[i]
-                lo = low_s[i]
-            except Exception:
-                break
+        for i in range(1, lookback):
+            hi = high_s[i]
+            lo = low_s[i]
             if hi > sar_val:
                 sar_val = hi
             if lo < ep:
@@ -940,13 +1543,11 @@ def rising(source: Series[Decimal], length: int) -> bool:
 
     Pine Script equivalent: ta.rising(source, length)
     """
+    if _depth(source) < length + 1:
+        return False
+
     for i in range(length):
-        try:
-            curr = source.current if i == 0 else source[i]
-            prev = source[i + 1]
-            if nz(curr) <= nz(prev):
-                return False
-        except Exception:
+        if nz(source[i]) <= nz(source[i + 1]):
             return False
     return True
 
@@ -956,13 +1557,11 @@ def falling(source: Series[Decimal], length: int) -> bool:
 
     Pine Script equivalent: ta.falling(source, length)
     """
+    if _depth(source) < length + 1:
+        return False
+
     for i in range(length):
-        try:
-            curr = source.current if i == 0 else source[i]
-            prev = source[i + 1]
-            if nz(curr) >= nz(prev):
-                return False
-        except Exception:
+        if nz(source[i]) >= nz(source[i + 1]):
             return False
     return True
 
@@ -972,8 +1571,10 @@ def variance(source: Series[Decimal], length: int) -> Decimal:
 
     Pine Script equivalent: ta.variance(source, length)
     """
-    sd = stdev(source, length)
-    return sd * sd
+    stats = _mean_std(source, length)
+    if stats is None:
+        return _D0
+    return _from_float(stats[1] * stats[1])
 
 
 def median(source: Series[Decimal], length: int) -> Decimal:
@@ -981,28 +1582,19 @@ def median(source: Series[Decimal], length: int) -> Decimal:
 
     Pine Script equivalent: ta.median(source, length)
     """
-    if len(source) < length - 1:
-        return Decimal("0")
+    if len(source) < length - 1 or length <= 0:
+        return _D0
 
-    vals: list[Decimal] = []
-    for i in range(length):
-        try:
-            val = source.current if i == 0 else source[i]
-            vals.append(nz(val))
-        except Exception:
-            break
-
-    if not vals:
-        return Decimal("0")
-
-    vals.sort()
-    n = len(vals)
-    if n % 2 == 1:
-        return vals[n // 2]
-    else:
-        return (vals[n // 2 - 1] + vals[n // 2]) / Decimal("2")
+    has_current = source.has_current
+    key = ("median", length)
+    state = source.cache.get(key)
+    if state is None or state.has_current != has_current:
+        state = source.cache[key] = _RollingMedian(length, has_current)
+    state.sync(source)
+    return state.median(nz(source.current) if has_current else None)
 
 
+@_bar_memo
 def correlation(
     source1: Series[Decimal], source2: Series[Decimal], length: int
 ) -> Decimal:
@@ -1011,38 +1603,23 @@ def correlation(
     Pine Script equivalent: ta.correlation(source1, source2, length)
     """
     if len(source1) < length - 1 or len(source2) < length - 1:
-        return Decimal("0")
-
-    n = Decimal(str(length))
-    sum_x = Decimal("0")
-    sum_y = Decimal("0")
-    sum_xy = Decimal("0")
-    sum_x2 = Decimal("0")
-    sum_y2 = Decimal("0")
-
-    for i in range(length):
-        try:
-            x = source1.current if i == 0 else source1[i]
-            y = source2.current if i == 0 else source2[i]
-        except Exception:
-            return Decimal("0")
-        x = nz(x)
-        y = nz(y)
-        sum_x += x
-        sum_y += y
-        sum_xy += x * y
-        sum_x2 += x * x
-        sum_y2 += y * y
-
-    num = n * sum_xy - sum_x * sum_y
-    denom_sq = (n * sum_x2 - sum_x * sum_x) * (n * sum_y2 - sum_y * sum_y)
+        return _D0
+
+    x = _nz_window(source1, length)
+    y = _nz_window(source2, length)
+    if x.size < length or y.size < length:
+        return _D0
+
+    sum_x = float(x.sum())
+    sum_y = float(y.sum())
+    num = length * float(np.dot(x, y)) - sum_x * sum_y
+    denom_sq = (length * float(np.dot(x, x)) - sum_x * sum_x) * (
+        length * float(np.dot(y, y)) - sum_y * sum_y
+    )
     if denom_sq <= 0:
-        return Decimal("0")
+        return _D0
 
-    denom = _decimal_sqrt(denom_sq)
-    if denom == 0:
-        return Decimal("0")
-    return num / denom
+    return _from_float(num / math.sqrt(denom_sq))
 
 
 def highestbars(source: Series[Decimal], length: int) -> int:
@@ -1051,17 +1628,7 @@ def highestbars(source: Series[Decimal], length: int) -> int:
     Pine Script equivalent: ta.highestbars(source, length)
     Returns a negative offset (0 = current bar, -1 = one bar ago, etc.)
     """
-    best_val = source.current
-    best_idx = 0
-    for i in range(1, length):
-        try:
-            val = source[i]
-            if not na(val) and val > best_val:
-                best_val = val
-                best_idx = i
-        except Exception:
-            break
-    return -best_idx
+    return -_extreme_offset(source, length, find_max=True)
 
 
 def lowestbars(source: Series[Decimal], length: int) -> int:
@@ -1070,17 +1637,7 @@ def lowestbars(source: Series[Decimal], length: int) -> int:
     Pine Script equivalent: ta.lowestbars(source, length)
     Returns a negative offset.
     """
-    best_val = source.current
-    best_idx = 0
-    for i in range(1, length):
-        try:
-            val = source[i]
-            if not na(val) and val < best_val:
-                best_val = val
-                best_idx = i
-        except Exception:
-            break
-    return -best_idx
+    return -_extreme_offset(source, length, find_max=False)
 
 
 def bbw(
@@ -1093,8 +1650,8 @@ def bbw(
     """
     upper, middle, lower = bb(source, length, mult)
     if middle == 0:
-        return Decimal("0")
-    return (upper - lower) / middle
+        return _D0
+    return _from_float((float(upper) - float(lower)) / float(middle))
 
 
 def kcw(
@@ -1113,8 +1670,8 @@ def kcw(
     """
     upper, middle, lower = kc(source, length, mult, atr_length, high_s, low_s, close_s)
     if middle == 0:
-        return Decimal("0")
-    return (upper - lower) / middle
+        return _D0
+    return _from_float((float(upper) - float(lower)) / float(middle))
 
 
 def barsince(condition: Series[bool]) -> int:
@@ -1122,19 +1679,8 @@ def barsince(condition: Series[bool]) -> int:
 
     Pine Script equivalent: ta.barssince(condition)
     """
-    try:
-        if condition.current:
-            return 0
-    except Exception:
-        pass
-
-    for i in range(1, len(condition) + 1):
-        try:
-            if condition[i]:
-                return i
-        except Exception:
-            break
-    return -1
+    hits = _true_offsets(condition, _depth(condition))
+    return int(hits[0]) if hits.size else -1
 
 
 def valuewhen(
@@ -1145,22 +1691,14 @@ def valuewhen(
     Pine Script equivalent: ta.valuewhen(condition, source, occurrence)
     occurrence=0 means the most recent time condition was true.
     """
-    count = 0
-    # Check current
-    try:
-        if condition.current:
-            if count == occurrence:
-                return source.current
-            count += 1
-    except Exception:
-        pass
-
-    for i in range(1, min(len(condition), len(source)) + 1):
-        try:
-            if condition[i]:
-                if count == occurrence:
-                    return nz(source[i])
-                count += 1
-        except Exception:
-            break
-    return Decimal("0")
+    hits = _true_offsets(condition, min(_depth(condition), _depth(source)))
+    if not 0 <= occurrence < hits.size:
+        return _D0
+    offset = int(hits[occurrence])
+    return source.current if offset == 0 else nz(source[offset])
+
+
+def _true_offsets(condition: Series[bool], depth: int) -> np.ndarray:
+    """Offsets (0 = current bar) within `depth` bars where condition is true, newest first."""
+    flags = condition.window(depth)[::-1]
+    return np.flatnonzero((flags != 0) & ~np.isnan(flags))
@@ -12,13 +12,34 @@ from typing import Any, Generic, Sequence, TypeVar
 T = TypeVar("T")
 
 
+def _to_decimal(value: Any) -> Decimal:
+    """Convert a parameter value to Decimal, keeping a float's shortest repr."""
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    if isinstance(value, int):
+        return Decimal(value)
+    return Decimal(str(value))
+
+
 class ParamDescriptor:
     """Base class for strategy parameter descriptors."""
 
     def __init__(self, default: Any, description: str = "") -> None:
         self.default = default
         self.description = description
-        self.name: str = ""  # Set by metaclass or registry
+        self.name = ""  # Set by metaclass or registry
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, name: str) -> None:
+        self._name = name
+        # Instance dict key of the value, built once instead of on every access
+        self._attr = f"_param_{name}"
 
     def validate(self, value: Any) -> Any:
         """Validate and return the value."""
@@ -30,10 +51,10 @@ class ParamDescriptor:
     def __get__(self, obj: Any, objtype: type | None = None) -> Any:
         if obj is None:
             return self
-        return obj.__dict__.get(f"_param_{self.name}", self.default)
+        return obj.__dict__.get(self._attr, self.default)
 
     def __set__(self, obj: Any, value: Any) -> None:
-        obj.__dict__[f"_param_{self.name}"] = self.validate(value)
+        obj.__dict__[self._attr] = self.validate(value)
 
 
 class IntParam(ParamDescriptor):
@@ -78,13 +99,13 @@ class FloatParam(ParamDescriptor):
         step: float | Decimal | None = None,
         description: str = "",
     ) -> None:
-        super().__init__(Decimal(str(default)), description)
-        self.min_val = Decimal(str(min_val)) if min_val is not None else None
-        self.max_val = Decimal(str(max_val)) if max_val is not None else None
-        self.step = Decimal(str(step)) if step is not None else Decimal("0.1")
+        super().__init__(_to_decimal(default), description)
+        self.min_val = _to_decimal(min_val) if min_val is not None else None
+        self.max_val = _to_decimal(max_val) if max_val is not None else None
+        self.step = _to_decimal(step) if step is not None else Decimal("0.1")
 
     def validate(self, value: Any) -> Decimal:
-        value = Decimal(str(value))
+        value = _to_decimal(value)
         if self.min_val is not None and value < self.min_val:
             raise ValueError(f"{self.name}: {value} < min {self.min_val}")
         if self.max_val is not None and value > self.max_val:
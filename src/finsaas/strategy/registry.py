@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import Any
 
 from finsaas.core.errors import StrategyError
+from finsaas.strategy.parameters import ParamDescriptor
 
 _REGISTRY: dict[str, type] = {}
 
@@ -12,6 +13,13 @@ _REGISTRY: dict[str, type] = {}
 def register_strategy(cls: type) -> type:
     """Register a strategy class in the global registry."""
     name = cls.__name__
+    # Walk the MRO so parameters declared on a base strategy are accepted too
+    cls._param_names = frozenset(  # type: ignore[attr-defined]
+        n
+        for klass in cls.__mro__
+        for n, v in vars(klass).items()
+        if isinstance(v, ParamDescriptor)
+    )
     _REGISTRY[name] = cls
     return cls
 
@@ -33,10 +41,10 @@ def list_strategies() -> list[str]:
 def create_strategy(name: str, **params: Any) -> object:
     """Create an instance of a registered strategy with given parameters."""
     cls = get_strategy(name)
+    unknown = params.keys() - cls._param_names  # type: ignore[attr-defined]
+    if unknown:
+        raise StrategyError(f"Strategy '{name}' has no parameter '{min(unknown)}'")
     instance = cls()
     for key, value in params.items():
-        if hasattr(instance, key):
-            setattr(instance, key, value)
-        else:
-            raise StrategyError(f"Strategy '{name}' has no parameter '{key}'")
+        setattr(instance, key, value)
     return instance
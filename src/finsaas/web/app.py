@@ -11,6 +11,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
+import finsaas.strategy.examples  # noqa: F401  (registers the example strategies)
 from finsaas.web import STATIC_DIR, UPLOAD_DIR
 from finsaas.web.routes import backtest, data, optimize, strategies
 
@@ -24,8 +25,6 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         from finsaas.data.sample_data import generate_sample_csv
 
         sample.write_text(generate_sample_csv())
-    # Import example strategies so they register
-    import finsaas.strategy.examples  # noqa: F401
     yield
 
 
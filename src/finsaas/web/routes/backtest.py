@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from decimal import Decimal
-
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
+from finsaas.core.types import TradeResult
+from finsaas.engine.portfolio import EquityPoint
 from finsaas.web import UPLOAD_DIR
 from finsaas.web.schemas import (
     BacktestRequest,
@@ -18,7 +18,10 @@ router = APIRouter(tags=["backtest"])
 
 
 @router.post("/backtest")
-def run_backtest(req: BacktestRequest) -> BacktestResponse:
+def run_backtest(
+    req: BacktestRequest,
+    max_points: int = Query(default=2000, ge=0, description="Equity curve cap; 0 = all"),
+) -> BacktestResponse:
     from finsaas.api.facade import backtest
     from finsaas.strategy.registry import get_strategy
 
@@ -34,11 +37,7 @@ def run_backtest(req: BacktestRequest) -> BacktestResponse:
         raise HTTPException(status_code=404, detail=str(e))
 
     strategy = cls()
-
-    # Set parameters
-    for key, value in req.parameters.items():
-        if hasattr(strategy, key):
-            setattr(strategy, key, value)
+    strategy.set_parameters(req.parameters)
 
     try:
         result = backtest(
@@ -46,15 +45,17 @@ def run_backtest(req: BacktestRequest) -> BacktestResponse:
             csv_path=str(csv_path),
             symbol=req.symbol,
             timeframe=req.timeframe,
-            initial_capital=Decimal(str(req.initial_capital)),
-            commission=Decimal(str(req.commission)),
-            slippage=Decimal(str(req.slippage)),
+            initial_capital=req.initial_capital,
+            commission=req.commission,
+            slippage=req.slippage,
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    # Values are converted to their schema types here, so model_construct skips
+    # per-item validation; FastAPI then only isinstance-checks the response
     trades = [
-        TradeResponse(
+        TradeResponse.model_construct(
             entry_time=t.entry_time.isoformat(),
             exit_time=t.exit_time.isoformat(),
             side=t.side.value,
@@ -70,7 +71,7 @@ def run_backtest(req: BacktestRequest) -> BacktestResponse:
     ]
 
     equity_curve = [
-        EquityPointResponse(
+        EquityPointResponse.model_construct(
             bar_index=ep.bar_index,
             timestamp=ep.timestamp.isoformat(),
             equity=float(ep.equity),
@@ -78,10 +79,10 @@ def run_backtest(req: BacktestRequest) -> BacktestResponse:
             position_value=float(ep.position_value),
             drawdown=float(ep.drawdown),
         )
-        for ep in result.equity_curve
+        for ep in _downsample_equity(result.equity_curve, result.trades, max_points)
     ]
 
-    return BacktestResponse(
+    return BacktestResponse.model_construct(
         strategy=result.strategy_name,
         run_hash=result.run_hash,
         parameters={k: str(v) for k, v in result.parameters.items()},
@@ -97,3 +98,21 @@ def run_backtest(req: BacktestRequest) -> BacktestResponse:
         trades=trades,
         equity_curve=equity_curve,
     )
+
+
+def _downsample_equity(
+    curve: list[EquityPoint], trades: list[TradeResult], max_points: int
+) -> list[EquityPoint]:
+    """Stride-decimate the equity curve to roughly `max_points` points.
+
+    The last point and the points at trade entry/exit times are always kept so
+    the chart's end value and trade markers stay exact.
+    """
+    n = len(curve)
+    if max_points <= 0 or n <= max_points:
+        return curve
+    stride = -(-n // max_points)
+    keep = {t.entry_time for t in trades} | {t.exit_time for t in trades}
+    return [
+        p for i, p in enumerate(curve) if i % stride == 0 or i == n - 1 or p.timestamp in keep
+    ]
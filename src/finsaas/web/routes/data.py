@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
+import os
+import shutil
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -13,6 +17,9 @@ from finsaas.web.schemas import FileInfo
 
 router = APIRouter(tags=["data"])
 
+# file name -> (mtime_ns, size, bar count); a changed file misses and is recounted
+_bar_count_cache: dict[str, tuple[int, int, int]] = {}
+
 
 @router.post("/data/upload")
 async def upload_csv(file: UploadFile) -> FileInfo:
@@ -20,11 +27,19 @@ async def upload_csv(file: UploadFile) -> FileInfo:
         raise HTTPException(status_code=400, detail="Only CSV files are accepted")
 
     dest = UPLOAD_DIR / file.filename
-    content = await file.read()
-    dest.write_bytes(content)
+    # Copy and count in a worker thread: the upload is streamed to disk in
+    # chunks rather than held in memory, and the event loop stays free
+    size = await asyncio.to_thread(_save_upload, file, dest)
+    bar_count = await asyncio.to_thread(_count_bars, dest)
+    return FileInfo(name=file.filename, size=size, bars=bar_count)
+
 
-    bar_count = _count_bars(dest)
-    return FileInfo(name=file.filename, size=len(content), bars=bar_count)
+def _save_upload(file: UploadFile, dest: Path) -> int:
+    """Copy an uploaded file to `dest` in 1 MiB chunks and return its size."""
+    file.file.seek(0)
+    with open(dest, "wb") as out:
+        shutil.copyfileobj(file.file, out, length=1 << 20)
+        return out.tell()
 
 
 @router.get("/data/files")
@@ -33,46 +48,58 @@ def list_files() -> list[FileInfo]:
         return []
     files: list[FileInfo] = []
     for p in sorted(UPLOAD_DIR.glob("*.csv")):
-        files.append(FileInfo(name=p.name, size=p.stat().st_size, bars=_count_bars(p)))
+        st = p.stat()
+        files.append(FileInfo(name=p.name, size=st.st_size, bars=_cached_bar_count(p, st)))
     return files
 
 
 @router.get("/data/preview/{filename}")
 def preview_csv(filename: str, rows: int = Query(default=10, ge=1, le=100)) -> Dict[str, Any]:
     """Return headers + first N rows + total bar count for a CSV file."""
+    # Prevent path traversal; checked on the string so rejected names never touch the disk
+    if ".." in filename or "/" in filename or "\\" in filename or filename.startswith("."):
+        raise HTTPException(status_code=400, detail="Invalid filename")
+
     path = UPLOAD_DIR / filename
-    if not path.exists() or not path.name.endswith(".csv"):
+    if not path.name.endswith(".csv") or not path.exists():
         raise HTTPException(status_code=404, detail="File not found")
 
-    # Prevent path traversal
-    if ".." in filename or "/" in filename or "\\" in filename:
-        raise HTTPException(status_code=400, detail="Invalid filename")
-
     try:
         with open(path, newline="") as f:
             reader = csv.reader(f)
             headers = next(reader, [])
-            data_rows: List[List[str]] = []
-            total = 0
-            for row in reader:
-                total += 1
-                if len(data_rows) < rows:
-                    data_rows.append(row)
+            data_rows: List[List[str]] = list(islice(reader, rows))
         return {
             "filename": filename,
             "headers": headers,
             "rows": data_rows,
-            "total_bars": total,
+            "total_bars": _cached_bar_count(path, path.stat()),
         }
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+def _cached_bar_count(path: Path, st: os.stat_result) -> int:
+    """Bar count for `path`, recounted only when its mtime or size changed."""
+    cached = _bar_count_cache.get(path.name)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    bars = _count_bars(path)
+    _bar_count_cache[path.name] = (st.st_mtime_ns, st.st_size, bars)
+    return bars
+
+
 def _count_bars(path: Path) -> int:
+    """Number of data rows (lines after the header), counted in binary chunks."""
     try:
-        with open(path, newline="") as f:
-            reader = csv.reader(f)
-            next(reader, None)  # skip header
-            return sum(1 for _ in reader)
+        lines = 0
+        last = b"\n"
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                lines += chunk.count(b"\n")
+                last = chunk[-1:]
+        if last != b"\n":
+            lines += 1  # final line without a trailing newline
+        return max(0, lines - 1)
     except Exception:
         return 0
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 from finsaas.web import UPLOAD_DIR
 from finsaas.web.schemas import OptimizeRequest, OptimizeResponse, TrialResponse
@@ -12,8 +12,8 @@ from finsaas.web.schemas import OptimizeRequest, OptimizeResponse, TrialResponse
 router = APIRouter(tags=["optimize"])
 
 
-@router.post("/optimize")
-def run_optimize(req: OptimizeRequest) -> OptimizeResponse:
+@router.post("/optimize", response_model=OptimizeResponse)
+def run_optimize(req: OptimizeRequest) -> Response:
     from finsaas.api.facade import optimize
     from finsaas.strategy.registry import get_strategy
 
@@ -32,15 +32,20 @@ def run_optimize(req: OptimizeRequest) -> OptimizeResponse:
             csv_path=str(csv_path),
             symbol=req.symbol,
             timeframe=req.timeframe,
-            initial_capital=Decimal(str(req.initial_capital)),
+            initial_capital=req.initial_capital,
             method=req.method,
             objective=req.objective,
+            max_workers=req.workers,
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+    # Values are converted to their schema types here, so model_construct skips
+    # per-item validation. The body is encoded by pydantic-core directly rather
+    # than through FastAPI's jsonable_encoder and stdlib json, which dominates
+    # for large grids.
     trials = [
-        TrialResponse(
+        TrialResponse.model_construct(
             trial_index=t.trial_index,
             parameters={k: _to_json(v) for k, v in t.parameters.items()},
             objective_value=float(t.objective_value),
@@ -49,7 +54,7 @@ def run_optimize(req: OptimizeRequest) -> OptimizeResponse:
         for t in result.all_trials
     ]
 
-    return OptimizeResponse(
+    response = OptimizeResponse.model_construct(
         method=result.method,
         objective=result.objective_name,
         total_trials=result.total_trials,
@@ -57,6 +62,7 @@ def run_optimize(req: OptimizeRequest) -> OptimizeResponse:
         best_value=float(result.best_value),
         trials=trials,
     )
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 def _to_json(val: object) -> object:
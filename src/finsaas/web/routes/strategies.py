@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 from decimal import Decimal
+from functools import cache
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 from finsaas.strategy.parameters import (
     BoolParam,
@@ -24,13 +25,19 @@ def get_strategies() -> list[StrategyInfo]:
     return [StrategyInfo(name=name) for name in list_strategies()]
 
 
-@router.get("/strategies/{name}/params")
-def get_strategy_params(name: str) -> StrategyParamsResponse:
+@router.get("/strategies/{name}/params", response_model=StrategyParamsResponse)
+def get_strategy_params(name: str) -> Response:
     try:
         cls = get_strategy(name)
     except Exception as e:
         raise HTTPException(status_code=404, detail=str(e))
 
+    return Response(content=_params_json(cls), media_type="application/json")
+
+
+@cache
+def _params_json(cls: type) -> bytes:
+    """Serialized parameter metadata; descriptors are fixed once a class is defined."""
     descriptors: dict[str, ParamDescriptor] = getattr(cls, "_param_descriptors", {})
     params: list[ParamInfo] = []
 
@@ -53,7 +60,8 @@ def get_strategy_params(name: str) -> StrategyParamsResponse:
             info.choices = [_to_json(c) for c in desc.choices]
         params.append(info)
 
-    return StrategyParamsResponse(name=name, params=params)
+    response = StrategyParamsResponse(name=cls.__name__, params=params)
+    return response.model_dump_json().encode()
 
 
 def _param_type(desc: ParamDescriptor) -> str:
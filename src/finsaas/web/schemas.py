@@ -1,5 +1,6 @@
 """Pydantic request/response models for the web API."""
 
+from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel
@@ -10,9 +11,9 @@ class BacktestRequest(BaseModel):
     csv_file: str
     symbol: str = "UNKNOWN"
     timeframe: str = "1h"
-    initial_capital: float = 10000.0
-    commission: float = 0.001
-    slippage: float = 0.0005
+    initial_capital: Decimal = Decimal("10000")
+    commission: Decimal = Decimal("0.001")
+    slippage: Decimal = Decimal("0.0005")
     parameters: Dict[str, Any] = {}
 
 
@@ -82,10 +83,11 @@ class OptimizeRequest(BaseModel):
     csv_file: str
     symbol: str = "UNKNOWN"
     timeframe: str = "1h"
-    initial_capital: float = 10000.0
+    initial_capital: Decimal = Decimal("10000")
     method: str = "grid"
     objective: str = "sharpe"
     parameters: Dict[str, Any] = {}
+    workers: int = 1  # grid/genetic worker processes; 0 = all CPU cores
 
 
 class TrialResponse(BaseModel):
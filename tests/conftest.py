@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
@@ -11,17 +12,33 @@ import pytest
 from finsaas.core.series import Series
 from finsaas.core.types import OHLCV, SymbolInfo, Timeframe
 from finsaas.data.feed import CSVFeed, InMemoryFeed
+from finsaas.pine.ast_nodes import Script
+from finsaas.pine.parser import PineParser
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
 SAMPLE_CSV = FIXTURES_DIR / "sample_ohlcv.csv"
+SMA_PINE = FIXTURES_DIR / "sample_pine_scripts" / "sma_crossover.pine"
 
 
-@pytest.fixture
-def sample_bars() -> list[OHLCV]:
-    """Generate sample OHLCV bars for testing."""
-    bars = []
-    base_time = datetime(2023, 1, 1, 0, 0, 0)
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """Compile or load the Numba kernels before any test is timed.
+
+    Compiled kernels go to one project-level directory so CI can cache it
+    between runs; the variable must be set before numba is first imported.
+    """
+    os.environ.setdefault(
+        "NUMBA_CACHE_DIR", str(Path(__file__).resolve().parent.parent / ".numba_cache")
+    )
+    from finsaas.strategy.builtins._ta_kernels import warm_up
+
+    warm_up()
+
+
+@pytest.fixture(scope="session")
+def sample_bars() -> tuple[OHLCV, ...]:
+    """Sample OHLCV bars for testing, built once per session (bars are immutable)."""
     prices = [
         (100, 105, 98, 103, 1000),
         (103, 107, 102, 106, 1200),
@@ -34,21 +51,14 @@ def sample_bars() -> list[OHLCV]:
         (104, 106, 101, 102, 1400),
         (102, 105, 100, 103, 1200),
     ]
-    for i, (o, h, l, c, v) in enumerate(prices):
-        bar = OHLCV(
-            timestamp=datetime(2023, 1, 1, i, 0, 0),
-            open=Decimal(str(o)),
-            high=Decimal(str(h)),
-            low=Decimal(str(l)),
-            close=Decimal(str(c)),
-            volume=Decimal(str(v)),
-        )
-        bars.append(bar)
-    return bars
+    return tuple(
+        OHLCV.from_ints(datetime(2023, 1, 1, i, 0, 0), o, h, l, c, v)
+        for i, (o, h, l, c, v) in enumerate(prices)
+    )
 
 
 @pytest.fixture
-def in_memory_feed(sample_bars: list[OHLCV]) -> InMemoryFeed:
+def in_memory_feed(sample_bars: tuple[OHLCV, ...]) -> InMemoryFeed:
     """Create an in-memory data feed from sample bars."""
     return InMemoryFeed(bars=sample_bars, symbol="TEST", timeframe="1h")
 
@@ -59,6 +69,21 @@ def csv_feed() -> CSVFeed:
     return CSVFeed(filepath=str(SAMPLE_CSV), symbol="TEST", timeframe="1h")
 
 
+@pytest.fixture(scope="session")
+def sample_csv_bars() -> tuple[OHLCV, ...]:
+    """Bars of the sample CSV, read and decoded once per session."""
+    return tuple(CSVFeed(filepath=str(SAMPLE_CSV), symbol="TEST", timeframe="1h"))
+
+
+@pytest.fixture(scope="session")
+def sma_pine_ast() -> Script:
+    """The sample SMA crossover Pine script, parsed once per session.
+
+    Shared between tests; the transpiler only reads it.
+    """
+    return PineParser().parse(SMA_PINE.read_text())
+
+
 @pytest.fixture
 def symbol_info() -> SymbolInfo:
     """Create a sample SymbolInfo."""
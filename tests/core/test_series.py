@@ -32,7 +32,7 @@ class TestSeriesBasic:
     def test_multiple_commits(self):
         s: Series[Decimal] = Series(name="test")
         for i in range(5):
-            s.current = Decimal(str(i * 10))
+            s.current = Decimal(i * 10)
             s.commit()
         assert len(s) == 5
         assert s[0] == Decimal("40")  # Most recent
@@ -64,7 +64,7 @@ class TestSeriesBasic:
     def test_slice_access(self):
         s: Series[Decimal] = Series(name="test")
         for i in range(5):
-            s.current = Decimal(str(i))
+            s.current = Decimal(i)
             s.commit()
         result = s[0:3]
         assert result == [Decimal("4"), Decimal("3"), Decimal("2")]
@@ -92,13 +92,89 @@ class TestSeriesBasic:
         """Buffer should not exceed max_bars_back."""
         s: Series[Decimal] = Series(max_bars_back=3, name="test")
         for i in range(10):
-            s.current = Decimal(str(i))
+            s.current = Decimal(i)
             s.commit()
         assert len(s) == 3
         assert s[0] == Decimal("9")
         assert s[2] == Decimal("7")
 
 
+class TestSeriesWindow:
+    """Float64 window view over the series history."""
+
+    def test_window_includes_current_last(self):
+        s: Series[Decimal] = Series(name="test")
+        for v in ("1", "2", "3"):
+            s.current = Decimal(v)
+            s.commit()
+        s.current = Decimal("4")
+        assert s.window(3).tolist() == [2.0, 3.0, 4.0]
+
+    def test_window_without_current(self):
+        s: Series[Decimal] = Series(name="test")
+        for v in ("1", "2", "3"):
+            s.current = Decimal(v)
+            s.commit()
+        assert s.window(2).tolist() == [2.0, 3.0]
+
+    def test_window_short_history(self):
+        s: Series[Decimal] = Series(name="test")
+        s.current = Decimal("1")
+        s.commit()
+        s.current = Decimal("2")
+        assert s.window(10).tolist() == [1.0, 2.0]
+
+    def test_window_none_is_nan(self):
+        s: Series[Decimal] = Series(name="test")
+        s.commit()
+        s.current = Decimal("5")
+        window = s.window(2)
+        assert window[0] != window[0]  # NaN
+        assert window[1] == 5.0
+
+    def test_window_wraps_ring_buffer(self):
+        s: Series[Decimal] = Series(max_bars_back=3, name="test")
+        for v in range(1, 6):
+            s.current = Decimal(v)
+            s.commit()
+        assert s.window(3).tolist() == [3.0, 4.0, 5.0]
+        s.current = Decimal("6")
+        assert s.window(3).tolist() == [4.0, 5.0, 6.0]
+
+    def test_window_across_ring_growth(self):
+        s: Series[Decimal] = Series(max_bars_back=40, name="test")
+        for v in range(50):
+            s.current = Decimal(v)
+            s.commit()
+            assert s.window(3).tolist()[-1] == float(v)
+        assert s.window(40).tolist() == [float(v) for v in range(10, 50)]
+
+    def test_extend_matches_commits(self):
+        a: Series[Decimal] = Series(max_bars_back=3, name="a")
+        b: Series[Decimal] = Series(max_bars_back=3, name="b")
+        a.current = b.current = Decimal("0")
+        for v in (None, 1, 2, 3, 4):
+            a.current = None if v is None else Decimal(v)
+            a.commit()
+        b.extend([None, Decimal(1), Decimal(2)])
+        b.extend([Decimal(3), Decimal(4)])
+        assert b.bar_count == a.bar_count == 5
+        assert not b.has_current
+        assert b[:3] == a[:3]
+        assert b.window(3).tolist() == a.window(3).tolist() == [2.0, 3.0, 4.0]
+
+    def test_commit_float_matches_commit(self):
+        a: Series[Decimal] = Series(max_bars_back=3, name="a")
+        b: Series[Decimal] = Series(max_bars_back=3, name="b")
+        for v in range(1, 6):
+            a.current = b.current = Decimal(v)
+            a.commit()
+            b.commit_float(float(v))
+        assert b[0] == Decimal("5")
+        assert b.bar_count == a.bar_count
+        assert b.window(3).tolist() == a.window(3).tolist()
+
+
 class TestSeriesErrors:
     """Error handling in Series."""
 
@@ -0,0 +1,19 @@
+"""Tests for core value types."""
+
+from datetime import datetime
+from decimal import Decimal
+
+from finsaas.core.types import OHLCV
+
+
+class TestOHLCV:
+    def test_from_ints(self):
+        bar = OHLCV.from_ints(datetime(2023, 1, 1), 100, 105, 98, 103, 1000)
+        assert bar == OHLCV(
+            datetime(2023, 1, 1), Decimal("100"), Decimal("105"),
+            Decimal("98"), Decimal("103"), Decimal("1000"),
+        )
+
+    def test_from_ints_with_decimals(self):
+        bar = OHLCV.from_ints(datetime(2023, 1, 1), 10050, 10100, 9900, -5, 12, decimals=2)
+        assert [str(v) for v in bar[1:]] == ["100.50", "101.00", "99.00", "-0.05", "0.12"]
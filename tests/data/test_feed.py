@@ -0,0 +1,57 @@
+"""Tests for data feeds."""
+
+import os
+import pickle
+from pathlib import Path
+
+from finsaas.data.feed import CSVFeed, InMemoryFeed, _read_csv_bars
+from finsaas.data.shared import SharedMemoryFeed, shared_feed
+
+FIXTURES = Path(__file__).parent.parent / "fixtures"
+
+
+class TestCSVFeed:
+    def test_parsed_bars_cached_across_feeds(self):
+        csv_path = str(FIXTURES / "sample_ohlcv.csv")
+        _read_csv_bars.cache_clear()
+        first = list(CSVFeed(filepath=csv_path))
+        second = list(CSVFeed(filepath=csv_path))
+        assert first == second
+        assert _read_csv_bars.cache_info().hits == 1
+
+    def test_modified_file_reparsed(self, tmp_path):
+        csv_path = tmp_path / "bars.csv"
+        header = "timestamp,open,high,low,close,volume\n"
+        csv_path.write_text(header + "2023-01-01 00:00:00,1,2,0.5,1.5,10\n")
+        assert len(CSVFeed(filepath=str(csv_path))) == 1
+
+        csv_path.write_text(
+            header
+            + "2023-01-01 00:00:00,1,2,0.5,1.5,10\n"
+            + "2023-01-01 01:00:00,1.5,2,1,1.8,12\n"
+        )
+        st = csv_path.stat()
+        os.utime(csv_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert len(CSVFeed(filepath=str(csv_path))) == 2
+
+
+class TestInMemoryFeed:
+    def test_column_built_once(self, sample_bars):
+        feed = InMemoryFeed(sample_bars)
+        closes = feed.column("close")
+        assert closes.tolist() == [float(bar.close) for bar in sample_bars]
+        assert feed.column("close") is closes
+
+
+class TestSharedMemoryFeed:
+    def test_round_trip_and_column_cache(self, sample_bars):
+        with shared_feed(InMemoryFeed(sample_bars)) as feed:
+            assert isinstance(feed, SharedMemoryFeed)
+            assert list(feed) == list(sample_bars)
+            closes = feed.column("close")
+            assert feed.column("close") is closes
+
+            # Workers receive only the block name; columns are rebuilt there
+            copy = pickle.loads(pickle.dumps(feed))
+            assert copy.column("close").tolist() == closes.tolist()
+            assert copy.column("close") is not closes
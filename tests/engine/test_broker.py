@@ -12,14 +12,20 @@ from finsaas.engine.order import Order
 from finsaas.engine.slippage import ZeroSlippage
 
 
-@pytest.fixture
-def broker() -> SimulatedBroker:
+@pytest.fixture(scope="class")
+def class_broker() -> SimulatedBroker:
     return SimulatedBroker(
         commission_model=ZeroCommission(),
         slippage_model=ZeroSlippage(),
     )
 
 
+@pytest.fixture
+def broker(class_broker: SimulatedBroker) -> SimulatedBroker:
+    class_broker.reset()
+    return class_broker
+
+
 @pytest.fixture
 def sample_bar() -> OHLCV:
     return OHLCV(
@@ -33,34 +39,24 @@ def sample_bar() -> OHLCV:
 
 
 class TestMarketOrders:
-    def test_market_buy_fills_at_open(self, broker: SimulatedBroker, sample_bar: OHLCV):
+    @pytest.mark.parametrize("side,qty", [(Side.LONG, 10), (Side.SHORT, 5)])
+    def test_market_order_fills_at_open(
+        self, broker: SimulatedBroker, sample_bar: OHLCV, side: Side, qty: int
+    ):
         order = Order(
             action=OrderAction.ENTRY,
-            side=Side.LONG,
+            side=side,
             order_type=OrderType.MARKET,
-            quantity=Decimal("10"),
+            quantity=Decimal(qty),
             tag="test",
         )
         broker.submit_order(order)
         fills = broker.process_bar(sample_bar, 0)
 
         assert len(fills) == 1
-        assert fills[0].price == Decimal("100")  # Opens at bar's open
-        assert fills[0].quantity == Decimal("10")
-        assert fills[0].side == Side.LONG
-
-    def test_market_sell_fills_at_open(self, broker: SimulatedBroker, sample_bar: OHLCV):
-        order = Order(
-            action=OrderAction.ENTRY,
-            side=Side.SHORT,
-            order_type=OrderType.MARKET,
-            quantity=Decimal("5"),
-        )
-        broker.submit_order(order)
-        fills = broker.process_bar(sample_bar, 0)
-
-        assert len(fills) == 1
-        assert fills[0].price == Decimal("100")
+        assert fills[0].price == 100  # Opens at bar's open
+        assert fills[0].quantity == qty
+        assert fills[0].side == side
 
     def test_pending_orders_cleared_after_fill(self, broker: SimulatedBroker, sample_bar: OHLCV):
         order = Order(
@@ -90,7 +86,7 @@ class TestLimitOrders:
         fills = broker.process_bar(sample_bar, 0)
 
         assert len(fills) == 1
-        assert fills[0].price == Decimal("96")
+        assert fills[0].price == 96
 
     def test_limit_buy_no_fill_when_price_above(self, broker: SimulatedBroker):
         """Limit buy at 85 should NOT fill when bar low is 95."""
@@ -128,7 +124,7 @@ class TestStopOrders:
 
         assert len(fills) == 1
         # Fill at max(open, stop_price) = max(100, 108) = 108
-        assert fills[0].price == Decimal("108")
+        assert fills[0].price == 108
 
 
 class TestOrderCancellation:
@@ -158,6 +154,23 @@ class TestOrderCancellation:
         assert cancelled == 1
         assert len(broker.pending_orders) == 1
 
+    def test_cancel_by_tag_after_fill(self, broker: SimulatedBroker, sample_bar: OHLCV):
+        market = Order(
+            action=OrderAction.ENTRY, side=Side.LONG,
+            order_type=OrderType.MARKET, quantity=Decimal("1"), tag="a",
+        )
+        limit = Order(
+            action=OrderAction.ENTRY, side=Side.LONG, order_type=OrderType.LIMIT,
+            quantity=Decimal("1"), limit_price=Decimal("50"), tag="a",
+        )
+        broker.submit_order(market)
+        broker.submit_order(limit)
+        broker.process_bar(sample_bar, 0)
+
+        assert broker.pending_orders == [limit]
+        assert broker.cancel_all(tag="a") == 1
+        assert broker.pending_orders == []
+
 
 class TestCommission:
     def test_commission_applied(self, sample_bar: OHLCV):
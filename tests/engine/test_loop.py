@@ -67,8 +67,7 @@ class TestEventLoop:
     def test_positions_closed_at_end(self, symbol_info):
         """All positions should be closed at end of backtest."""
         bars = [
-            OHLCV(datetime(2023, 1, 1, i), Decimal("100"), Decimal("105"),
-                   Decimal("95"), Decimal("100"), Decimal("1000"))
+            OHLCV.from_ints(datetime(2023, 1, 1, i), 100, 105, 95, 100, 1000)
             for i in range(5)
         ]
         feed = InMemoryFeed(bars, symbol="TEST", timeframe="1h")
@@ -111,3 +110,57 @@ class TestEventLoop:
 
         assert len(strategy.observed_closes) == len(sample_bars)
         assert strategy.observed_closes[0] == sample_bars[0].close
+
+    def test_precomputed_series_matches_ta(self, sample_bars, symbol_info):
+        """A precomputed series should hold the per-bar ta value."""
+        from finsaas.strategy.builtins import rolling
+
+        feed = InMemoryFeed(sample_bars, symbol="TEST", timeframe="1h")
+
+        class PrecomputeStrategy(Strategy):
+            def __init__(self):
+                super().__init__()
+                self.pairs: list[tuple[Decimal, Decimal]] = []
+
+            def on_init(self) -> None:
+                self.ma = self.precompute(rolling.sma, "close", length=3, name="ma")
+
+            def on_bar(self, ctx: BarContext) -> None:
+                self.pairs.append((self.ma.current, self.ta.sma(self.close, 3)))
+
+        loop = EventLoop(
+            feed=feed, symbol_info=symbol_info, timeframe=Timeframe.H1,
+            initial_capital=Decimal("10000"),
+            commission_model=ZeroCommission(), slippage_model=ZeroSlippage(),
+        )
+        strategy = PrecomputeStrategy()
+        loop.run(strategy)
+
+        assert len(strategy.pairs) == len(sample_bars)
+        for precomputed, streamed in strategy.pairs:
+            assert float(precomputed) == pytest.approx(float(streamed))
+
+    def test_repeated_precompute_is_shared(self, sample_bars, symbol_info):
+        from finsaas.strategy.builtins import rolling
+
+        feed = InMemoryFeed(sample_bars, symbol="TEST", timeframe="1h")
+
+        class SharedStrategy(Strategy):
+            def on_init(self) -> None:
+                self.fast = self.precompute(rolling.sma, "close", length=3)
+                self.fast_again = self.precompute(rolling.sma, "close", length=3)
+                self.slow = self.precompute(rolling.sma, "close", length=5)
+
+            def on_bar(self, ctx: BarContext) -> None:
+                pass
+
+        loop = EventLoop(
+            feed=feed, symbol_info=symbol_info, timeframe=Timeframe.H1,
+            initial_capital=Decimal("10000"),
+            commission_model=ZeroCommission(), slippage_model=ZeroSlippage(),
+        )
+        strategy = SharedStrategy()
+        loop.run(strategy)
+
+        assert strategy.fast_again is strategy.fast
+        assert strategy.slow is not strategy.fast
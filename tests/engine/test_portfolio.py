@@ -78,12 +78,7 @@ class TestPortfolioBasic:
         assert equity == Decimal("10100")
 
     def test_record_equity(self, portfolio: Portfolio):
-        bar = OHLCV(
-            timestamp=datetime(2023, 1, 1),
-            open=Decimal("100"), high=Decimal("105"),
-            low=Decimal("98"), close=Decimal("103"),
-            volume=Decimal("1000"),
-        )
+        bar = OHLCV.from_ints(datetime(2023, 1, 1), 100, 105, 98, 103, 1000)
         point = portfolio.record_equity(bar, 0)
         assert point.equity == Decimal("10000")
         assert point.drawdown == Decimal("0")
@@ -0,0 +1,70 @@
+"""Regression tests pinning the trades of the shipped example strategies."""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from finsaas.core.types import OHLCV, SymbolInfo, Timeframe
+from finsaas.data.feed import InMemoryFeed
+from finsaas.engine.runner import BacktestConfig, BacktestRunner
+from finsaas.strategy.examples import SMACrossover
+
+START = datetime(2023, 1, 1)
+HOUR = timedelta(hours=1)
+
+
+def _walk(count: int, start: Decimal, tick: Decimal, span: int) -> list[OHLCV]:
+    """Deterministic random walk moving up to `span` ticks per bar."""
+    bars = []
+    price = start
+    state = 7
+    for i in range(count):
+        state = (state * 1103515245 + 12345) % 2**31
+        price += tick * ((state >> 8) % (2 * span + 1) - span)
+        bars.append(OHLCV(START + i * HOUR, price, price, price, price, Decimal(1)))
+    return bars
+
+
+def _trades(strategy: SMACrossover, bars: list[OHLCV]) -> list[tuple[int, int]]:
+    """(entry bar, exit bar) of every closed trade."""
+    config = BacktestConfig(
+        symbol_info=SymbolInfo(ticker="TEST", exchange="TEST"),
+        timeframe=Timeframe.H1,
+        initial_capital=Decimal("1000000"),
+    )
+    feed = InMemoryFeed(bars, symbol="TEST", timeframe="1h")
+    result = BacktestRunner(feed, config).run(strategy)
+    return [
+        ((t.entry_time - START) // HOUR, (t.exit_time - START) // HOUR)
+        for t in result.trades
+    ]
+
+
+# Trades of the original Decimal ta.sma/ta.crossover implementation. A float
+# SMA breaks ties and near-ties differently and loses them.
+FINE_TICK_TRADES = [
+    (3, 13), (15, 17), (21, 24), (38, 40), (43, 46), (52, 55), (65, 74), (81, 84),
+    (89, 91), (101, 102), (112, 117), (120, 122), (130, 136), (139, 147), (149, 154),
+    (155, 165), (172, 181), (198, 204), (217, 221), (231, 239), (240, 241), (242, 243),
+    (248, 255), (263, 267), (272, 274), (280, 290), (294, 299),
+]
+FLAT_TRADES = [
+    (3, 9), (17, 24), (30, 31), (32, 43), (49, 51), (52, 56), (65, 69), (71, 74),
+    (89, 92), (95, 100), (102, 106), (109, 117), (122, 127), (129, 134), (138, 140),
+    (152, 155), (162, 165), (177, 183), (187, 193), (195, 199),
+]
+
+
+class TestSMACrossoverExample:
+    def _run(self, bars: list[OHLCV]) -> list[tuple[int, int]]:
+        strategy = SMACrossover()
+        strategy.fast_length = 3
+        strategy.slow_length = 7
+        return _trades(strategy, bars)
+
+    def test_high_price_fine_tick(self):
+        bars = _walk(300, Decimal("50000.12345678"), Decimal("0.00000001"), 3)
+        assert self._run(bars) == FINE_TICK_TRADES
+
+    def test_flat_prices(self):
+        bars = _walk(200, Decimal("100"), Decimal("0.01"), 1)
+        assert self._run(bars) == FLAT_TRADES
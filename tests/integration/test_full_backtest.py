@@ -7,7 +7,7 @@ import pytest
 
 from finsaas.core.context import BarContext
 from finsaas.core.types import Side, SymbolInfo, Timeframe
-from finsaas.data.feed import CSVFeed
+from finsaas.data.feed import InMemoryFeed
 from finsaas.engine.commission import PercentageCommission
 from finsaas.engine.runner import BacktestConfig, BacktestResult, BacktestRunner
 from finsaas.engine.slippage import PercentageSlippage
@@ -38,23 +38,28 @@ class SMACrossover(Strategy):
             self.close_position("long")
 
 
-class TestFullBacktest:
-    def test_csv_to_backtest(self):
-        """Full pipeline: CSV -> Feed -> Strategy -> Runner -> Result."""
-        csv_path = FIXTURES / "sample_ohlcv.csv"
-        feed = CSVFeed(filepath=str(csv_path), symbol="BTCUSDT", timeframe="1h")
+@pytest.fixture(scope="module")
+def sma_result(sample_csv_bars) -> BacktestResult:
+    """One SMACrossover backtest over the sample CSV, shared by the tests below."""
+    feed = InMemoryFeed(list(sample_csv_bars), symbol="BTCUSDT", timeframe="1h")
+    config = BacktestConfig(
+        symbol_info=SymbolInfo(ticker="BTCUSDT", exchange="Binance"),
+        timeframe=Timeframe.H1,
+        initial_capital=Decimal("10000"),
+        commission_model=PercentageCommission(Decimal("0.001")),
+        slippage_model=PercentageSlippage(Decimal("0.0005")),
+    )
+    return BacktestRunner(feed, config).run(SMACrossover())
 
-        config = BacktestConfig(
-            symbol_info=SymbolInfo(ticker="BTCUSDT", exchange="Binance"),
-            timeframe=Timeframe.H1,
-            initial_capital=Decimal("10000"),
-            commission_model=PercentageCommission(Decimal("0.001")),
-            slippage_model=PercentageSlippage(Decimal("0.0005")),
-        )
 
-        strategy = SMACrossover()
-        runner = BacktestRunner(feed, config)
-        result = runner.run(strategy)
+class TestFullBacktest:
+    def test_csv_to_backtest(self, sma_result):
+        """Full pipeline: CSV -> Feed -> Strategy -> Runner -> Result.
+
+        The session fixture does the CSV decode once; the facade test below
+        still reads the file through CSVFeed.
+        """
+        result = sma_result
 
         # Basic sanity checks
         assert isinstance(result, BacktestResult)
@@ -70,40 +75,22 @@ class TestFullBacktest:
         assert "max_drawdown" in result.metrics
         assert "win_rate" in result.metrics
 
-    def test_text_report_generation(self):
+    def test_text_report_generation(self, sma_result):
         """Verify text report can be generated from results."""
         from finsaas.analytics.report import generate_text_report
 
-        csv_path = FIXTURES / "sample_ohlcv.csv"
-        feed = CSVFeed(filepath=str(csv_path), symbol="BTCUSDT", timeframe="1h")
-        config = BacktestConfig(
-            symbol_info=SymbolInfo(ticker="BTCUSDT"),
-            timeframe=Timeframe.H1,
-            initial_capital=Decimal("10000"),
-        )
-
-        result = BacktestRunner(feed, config).run(SMACrossover())
-        report = generate_text_report(result)
+        report = generate_text_report(sma_result)
 
         assert "BACKTEST REPORT" in report
         assert "SMACrossover" in report
         assert "Final Equity" in report
 
-    def test_json_report_generation(self):
+    def test_json_report_generation(self, sma_result):
         """Verify JSON report can be generated from results."""
         import json
         from finsaas.analytics.report import generate_json_report
 
-        csv_path = FIXTURES / "sample_ohlcv.csv"
-        feed = CSVFeed(filepath=str(csv_path), symbol="BTCUSDT", timeframe="1h")
-        config = BacktestConfig(
-            symbol_info=SymbolInfo(ticker="BTCUSDT"),
-            timeframe=Timeframe.H1,
-            initial_capital=Decimal("10000"),
-        )
-
-        result = BacktestRunner(feed, config).run(SMACrossover())
-        json_str = generate_json_report(result)
+        json_str = generate_json_report(sma_result)
         data = json.loads(json_str)
 
         assert data["strategy"] == "SMACrossover"
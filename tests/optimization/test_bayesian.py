@@ -0,0 +1,73 @@
+"""Tests for Bayesian optimization."""
+
+from decimal import Decimal
+
+from finsaas.core.context import BarContext
+from finsaas.core.types import Side, Timeframe
+from finsaas.data.feed import InMemoryFeed
+from finsaas.engine.runner import BacktestConfig
+from finsaas.optimization.bayesian import BayesianOptimizer
+from finsaas.optimization.objective import SharpeObjective
+from finsaas.optimization.space import ParameterSpace
+from finsaas.strategy.base import Strategy
+from finsaas.strategy.builtins import rolling
+from finsaas.strategy.parameters import IntParam
+
+
+class BayesTestStrategy(Strategy):
+    fast = IntParam(default=3, min_val=2, max_val=5, step=1)
+    slow = IntParam(default=7, min_val=5, max_val=10, step=1)
+
+    def on_init(self):
+        fast_ma = self.precompute(rolling.sma, "close", length=self.fast)
+        slow_ma = self.precompute(rolling.sma, "close", length=self.slow)
+        self.signal = self.precompute(rolling.cross, fast_ma, slow_ma)
+
+    def on_bar(self, ctx: BarContext) -> None:
+        signal = self.signal.current
+        if signal > 0:
+            self.entry("long", Side.LONG)
+        elif signal < 0:
+            self.close_position("long")
+
+
+class TestBayesianOptimizer:
+    def _optimizer(self, sample_bars, symbol_info, **kwargs):
+        feed = InMemoryFeed(sample_bars, symbol="TEST", timeframe="1h")
+        config = BacktestConfig(
+            symbol_info=symbol_info,
+            timeframe=Timeframe.H1,
+            initial_capital=Decimal("10000"),
+        )
+        return BayesianOptimizer(
+            strategy_cls=BayesTestStrategy,
+            feed=feed,
+            config=config,
+            objective=SharpeObjective(),
+            space=ParameterSpace.from_strategy(BayesTestStrategy),
+            **kwargs,
+        )
+
+    def test_bayesian_respects_budget(self, sample_bars, symbol_info):
+        result = self._optimizer(sample_bars, symbol_info, max_evals=12, seed=7).run()
+
+        assert result.method == "bayesian"
+        assert result.total_trials == 12
+        combos = [tuple(t.parameters.items()) for t in result.all_trials]
+        assert len(set(combos)) == len(combos)
+        assert result.best_value == max(t.objective_value for t in result.all_trials)
+
+    def test_bayesian_reproducible_with_seed(self, sample_bars, symbol_info):
+        first = self._optimizer(sample_bars, symbol_info, max_evals=10, seed=3).run()
+        second = self._optimizer(sample_bars, symbol_info, max_evals=10, seed=3).run()
+
+        assert [t.parameters for t in first.all_trials] == [
+            t.parameters for t in second.all_trials
+        ]
+
+    def test_bayesian_budget_capped_by_grid(self, sample_bars, symbol_info):
+        result = self._optimizer(sample_bars, symbol_info, max_evals=500, seed=1).run()
+
+        assert result.total_trials == ParameterSpace.from_strategy(
+            BayesTestStrategy
+        ).total_combinations
@@ -1,5 +1,6 @@
 """Determinism tests - verify backtests produce identical results."""
 
+import pickle
 from decimal import Decimal
 
 import pytest
@@ -33,8 +34,11 @@ class DeterminismTestStrategy(Strategy):
 
 
 class TestDeterminism:
-    def test_backtest_deterministic_10_runs(self, sample_bars, symbol_info):
-        """Run the same backtest 10 times and verify identical results."""
+    @pytest.mark.parametrize(
+        "runs", [2, pytest.param(10, marks=pytest.mark.slow, id="10-slow")]
+    )
+    def test_backtest_deterministic(self, sample_bars, symbol_info, runs):
+        """Repeat the same backtest and verify every run matches the first."""
         feed = InMemoryFeed(sample_bars, symbol="TEST", timeframe="1h")
         config = BacktestConfig(
             symbol_info=symbol_info,
@@ -44,32 +48,22 @@ class TestDeterminism:
             slippage_model=PercentageSlippage(Decimal("0.0005")),
         )
 
-        results = []
-        for _ in range(10):
-            strategy = DeterminismTestStrategy()
-            runner = BacktestRunner(feed, config)
-            result = runner.run(strategy)
-            results.append(result)
-
-        # All results should have the same hash
-        hashes = {r.run_hash for r in results}
-        assert len(hashes) == 1, f"Expected 1 unique hash, got {len(hashes)}"
-
-        # All results should have identical final equity
-        equities = {r.final_equity for r in results}
-        assert len(equities) == 1, f"Expected 1 unique equity, got {len(equities)}"
-
-        # All results should have identical trade counts
-        trade_counts = {len(r.trades) for r in results}
-        assert len(trade_counts) == 1
-
-        # All trade P&L values should match
-        if results[0].trades:
-            for i, trade in enumerate(results[0].trades):
-                for result in results[1:]:
-                    assert trade.pnl == result.trades[i].pnl, (
-                        f"Trade {i} P&L mismatch: {trade.pnl} != {result.trades[i].pnl}"
-                    )
+        first = BacktestRunner(feed, config).run(DeterminismTestStrategy())
+        first_pnl = [t.pnl for t in first.trades]
+        # Pickled bytes cover every field: hash, trades, equity curve, metrics
+        first_state = pickle.dumps(first)
+
+        for _ in range(runs - 1):
+            result = BacktestRunner(feed, config).run(DeterminismTestStrategy())
+
+            assert result.run_hash == first.run_hash
+            assert result.final_equity == first.final_equity
+            # All trade P&L values should match
+            assert [t.pnl for t in result.trades] == first_pnl
+            assert result.equity_curve == first.equity_curve
+            assert result.metrics == first.metrics
+            # Catches any field the checks above do not name
+            assert pickle.dumps(result) == first_state
 
     def test_same_hash_same_result(self, sample_bars, symbol_info):
         """Verify the deterministic hash matches between runs."""
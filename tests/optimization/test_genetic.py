@@ -12,6 +12,7 @@ from finsaas.optimization.genetic import GeneticOptimizer
 from finsaas.optimization.objective import SharpeObjective
 from finsaas.optimization.space import ParameterSpace
 from finsaas.strategy.base import Strategy
+from finsaas.strategy.builtins import rolling
 from finsaas.strategy.parameters import IntParam
 
 
@@ -20,16 +21,16 @@ class GeneticTestStrategy(Strategy):
     slow = IntParam(default=7, min_val=5, max_val=10, step=1)
 
     def on_init(self):
-        self.fast_ma = self.create_series("fast")
-        self.slow_ma = self.create_series("slow")
+        # Both SMAs and their crosses in one pass over the closes per trial
+        self.signal = self.precompute(
+            rolling.sma_cross, "close", fast_length=self.fast, slow_length=self.slow
+        )
 
     def on_bar(self, ctx: BarContext) -> None:
-        self.fast_ma.current = self.ta.sma(self.close, self.fast)
-        self.slow_ma.current = self.ta.sma(self.close, self.slow)
-
-        if self.ta.crossover(self.fast_ma, self.slow_ma):
+        signal = self.signal.current
+        if signal > 0:
             self.entry("long", Side.LONG)
-        elif self.ta.crossunder(self.fast_ma, self.slow_ma):
+        elif signal < 0:
             self.close_position("long")
 
 
@@ -89,3 +90,84 @@ class TestGeneticOptimizer:
 
         assert results[0].best_params == results[1].best_params
         assert results[0].best_value == results[1].best_value
+
+    def test_parallel_matches_sequential(self, sample_bars, symbol_info):
+        feed = InMemoryFeed(sample_bars, symbol="TEST", timeframe="1h")
+        config = BacktestConfig(
+            symbol_info=symbol_info,
+            timeframe=Timeframe.H1,
+            initial_capital=Decimal("10000"),
+        )
+        results = []
+        for workers in (1, 2):
+            optimizer = GeneticOptimizer(
+                strategy_cls=GeneticTestStrategy,
+                feed=feed,
+                config=config,
+                objective=SharpeObjective(),
+                space=ParameterSpace.from_strategy(GeneticTestStrategy),
+                population_size=5,
+                generations=3,
+                seed=42,
+                max_workers=workers,
+            )
+            results.append(optimizer.run())
+
+        sequential, parallel = results
+        assert [(t.trial_index, t.run_hash) for t in parallel.all_trials] == [
+            (t.trial_index, t.run_hash) for t in sequential.all_trials
+        ]
+        assert parallel.best_params == sequential.best_params
+
+    @pytest.mark.parametrize("patience", [0, 2])
+    def test_early_stopping(self, sample_bars, symbol_info, patience):
+        feed = InMemoryFeed(sample_bars, symbol="TEST", timeframe="1h")
+        config = BacktestConfig(
+            symbol_info=symbol_info,
+            timeframe=Timeframe.H1,
+            initial_capital=Decimal("10000"),
+        )
+        optimizer = GeneticOptimizer(
+            strategy_cls=GeneticTestStrategy,
+            feed=feed,
+            config=config,
+            objective=SharpeObjective(),
+            space=ParameterSpace.from_strategy(GeneticTestStrategy),
+            population_size=5,
+            generations=20,
+            seed=42,
+            patience=patience,
+        )
+        result = optimizer.run()
+
+        if patience:
+            assert result.stopped_early
+            assert result.generations_run < 20
+        else:
+            assert not result.stopped_early
+            assert result.generations_run == 20
+
+    def test_each_genotype_backtested_once(self, sample_bars, symbol_info):
+        feed = InMemoryFeed(sample_bars, symbol="TEST", timeframe="1h")
+        config = BacktestConfig(
+            symbol_info=symbol_info,
+            timeframe=Timeframe.H1,
+            initial_capital=Decimal("10000"),
+        )
+        optimizer = GeneticOptimizer(
+            strategy_cls=GeneticTestStrategy,
+            feed=feed,
+            config=config,
+            objective=SharpeObjective(),
+            space=ParameterSpace.from_strategy(GeneticTestStrategy),
+            population_size=10,
+            generations=10,
+            seed=42,
+            patience=0,
+        )
+        result = optimizer.run()
+
+        genotypes = [tuple(sorted(t.parameters.items())) for t in result.all_trials]
+        assert len(genotypes) == len(set(genotypes)) == result.total_trials
+        # 4 fast x 6 slow values
+        assert result.total_trials <= 24
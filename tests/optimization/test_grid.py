@@ -12,6 +12,7 @@ from finsaas.optimization.grid import GridSearchOptimizer
 from finsaas.optimization.objective import SharpeObjective
 from finsaas.optimization.space import ParameterSpace
 from finsaas.strategy.base import Strategy
+from finsaas.strategy.builtins import rolling
 from finsaas.strategy.parameters import IntParam
 
 
@@ -20,16 +21,16 @@ class OptTestStrategy(Strategy):
     slow = IntParam(default=5, min_val=4, max_val=6, step=1)
 
     def on_init(self):
-        self.fast_ma = self.create_series("fast")
-        self.slow_ma = self.create_series("slow")
+        # Both SMAs and their crosses in one pass over the closes per trial
+        self.signal = self.precompute(
+            rolling.sma_cross, "close", fast_length=self.fast, slow_length=self.slow
+        )
 
     def on_bar(self, ctx: BarContext) -> None:
-        self.fast_ma.current = self.ta.sma(self.close, self.fast)
-        self.slow_ma.current = self.ta.sma(self.close, self.slow)
-
-        if self.ta.crossover(self.fast_ma, self.slow_ma):
+        signal = self.signal.current
+        if signal > 0:
             self.entry("long", Side.LONG)
-        elif self.ta.crossunder(self.fast_ma, self.slow_ma):
+        elif signal < 0:
             self.close_position("long")
 
 
@@ -65,9 +66,54 @@ class TestGridSearch:
         assert "fast" in result.best_params
         assert "slow" in result.best_params
 
+    def test_parallel_grid_matches_sequential(self, sample_bars, symbol_info):
+        feed = InMemoryFeed(sample_bars, symbol="TEST", timeframe="1h")
+        config = BacktestConfig(
+            symbol_info=symbol_info,
+            timeframe=Timeframe.H1,
+            initial_capital=Decimal("10000"),
+        )
+        results = []
+        for workers in (1, 2):
+            optimizer = GridSearchOptimizer(
+                strategy_cls=OptTestStrategy,
+                feed=feed,
+                config=config,
+                objective=SharpeObjective(),
+                space=ParameterSpace.from_strategy(OptTestStrategy),
+                max_workers=workers,
+            )
+            results.append(optimizer.run())
+
+        sequential, parallel = results
+        assert [t.run_hash for t in parallel.all_trials] == [
+            t.run_hash for t in sequential.all_trials
+        ]
+        assert parallel.best_params == sequential.best_params
+
     def test_grid_iter(self):
         space = ParameterSpace.from_strategy(OptTestStrategy)
         combos = list(space.grid_iter())
         assert len(combos) == 9
         # First combo should be fast=2, slow=4
         assert combos[0] == {"fast": 2, "slow": 4}
+
+    def test_grid_indices_match_grid_iter(self):
+        space = ParameterSpace.from_strategy(OptTestStrategy)
+        indices = space.grid_indices()
+        assert indices.shape == (9, 2)
+        ranges = space.ranges
+        rows = [{r.name: r.values[i] for r, i in zip(ranges, row)} for row in indices.tolist()]
+        assert rows == list(space.grid_iter())
+
+    def test_space_extracted_once_per_strategy(self):
+        space = ParameterSpace.from_strategy(OptTestStrategy)
+        assert ParameterSpace.from_strategy(OptTestStrategy) is space
+        assert space.dimension_names == ["fast", "slow"]
+
+    def test_grid_cached_by_space(self):
+        first = ParameterSpace.from_strategy(OptTestStrategy).grid()
+        second = ParameterSpace.from_strategy(OptTestStrategy).grid()
+        assert first == list(ParameterSpace.from_strategy(OptTestStrategy).grid_iter())
+        assert second is not first
+        assert all(a is b for a, b in zip(first, second))
@@ -0,0 +1,36 @@
+"""Shared fixtures for the Pine Script tests."""
+
+from collections.abc import Callable
+
+import pytest
+
+from finsaas.pine.parser import PineParser
+from finsaas.pine.transpiler import PineTranspiler
+
+
+@pytest.fixture(scope="session")
+def parser() -> PineParser:
+    """One parser for every test; PineParser keeps no state between parse() calls."""
+    return PineParser()
+
+
+@pytest.fixture(scope="session")
+def transpiler() -> PineTranspiler:
+    """One transpiler for every test; transpile() resets its state on each call."""
+    return PineTranspiler()
+
+
+@pytest.fixture(scope="session")
+def transpile_pine(
+    parser: PineParser, transpiler: PineTranspiler
+) -> Callable[[str], str]:
+    """Parse and transpile Pine source, memoized by the exact source string."""
+    cache: dict[str, str] = {}
+
+    def transpile(source: str) -> str:
+        code = cache.get(source)
+        if code is None:
+            code = cache[source] = transpiler.transpile(parser.parse(source))
+        return code
+
+    return transpile
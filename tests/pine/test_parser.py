@@ -1,7 +1,5 @@
 """Tests for Pine Script parser."""
 
-import pytest
-
 from finsaas.pine.ast_nodes import (
     FunctionCall,
     Identifier,
@@ -15,11 +13,6 @@ from finsaas.pine.ast_nodes import (
 from finsaas.pine.parser import PineParser
 
 
-@pytest.fixture
-def parser() -> PineParser:
-    return PineParser()
-
-
 class TestVersionParsing:
     def test_parse_version(self, parser: PineParser):
         script = parser.parse("//@version=5")
@@ -0,0 +1,84 @@
+"""Tests for whole-history indicator arrays used by precomputed series."""
+
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from finsaas.core.series import Series
+from finsaas.strategy.builtins import rolling, ta
+
+
+def _replay(values: list[float], indicator) -> list[float]:
+    """Run a ta indicator bar by bar over `values` and collect its outputs."""
+    s: Series[Decimal] = Series(name="test")
+    out = []
+    for i, v in enumerate(values):
+        if i:
+            s.commit()
+        s.current = Decimal(str(v))
+        out.append(float(indicator(s)))
+    return out
+
+
+PRICES = [100.0, 102.0, 101.0, 105.0, 103.0, 104.5, 99.0, 98.5, 101.0, 106.0]
+
+
+class TestRolling:
+    def test_sma_matches_ta(self):
+        expected = _replay(PRICES, lambda s: ta.sma(s, 3))
+        assert rolling.sma(np.array(PRICES), 3).tolist() == pytest.approx(expected)
+
+    def test_sma_longer_than_history(self):
+        assert rolling.sma(np.array([1.0, 2.0]), 5).tolist() == [0.0, 0.0]
+
+    def test_ema_matches_ta(self):
+        expected = _replay(PRICES, lambda s: ta.ema(s, 3))
+        assert rolling.ema(np.array(PRICES), 3).tolist() == pytest.approx(expected)
+
+    def test_stdev_matches_ta(self):
+        expected = _replay(PRICES, lambda s: ta.stdev(s, 4))
+        assert rolling.stdev(np.array(PRICES), 4).tolist() == pytest.approx(expected)
+
+    def test_rsi_matches_ta(self):
+        expected = _replay(PRICES, lambda s: ta.rsi(s, 3))
+        assert rolling.rsi(np.array(PRICES), 3).tolist() == pytest.approx(expected)
+
+    def test_atr_wilder_smoothing(self):
+        high = np.array([12.0, 13.0, 14.0, 15.0])
+        low = np.array([10.0, 10.0, 12.0, 11.0])
+        close = np.array([11.0, 12.0, 13.0, 14.0])
+        assert rolling.atr(high, low, close, 2).tolist() == pytest.approx([2.0, 2.5, 2.25, 3.125])
+
+    def test_cross_masks_match_ta(self):
+        fast = [1.0, 2.0, 4.0, 3.0, 1.0, 2.0]
+        slow = [2.0, 2.0, 3.0, 3.0, 2.0, 2.0]
+        a: Series[Decimal] = Series(name="a")
+        b: Series[Decimal] = Series(name="b")
+        up, down = [], []
+        for i, (x, y) in enumerate(zip(fast, slow)):
+            if i:
+                a.commit()
+                b.commit()
+            a.current = Decimal(str(x))
+            b.current = Decimal(str(y))
+            up.append(ta.crossover(a, b))
+            down.append(ta.crossunder(a, b))
+        assert rolling.crossover(np.array(fast), np.array(slow)).tolist() == up
+        assert rolling.crossunder(np.array(fast), np.array(slow)).tolist() == down
+
+    def test_sma_cross_matches_masks(self):
+        fast = rolling.sma(np.array(PRICES), 2)
+        slow = rolling.sma(np.array(PRICES), 4)
+        expected = rolling.crossover(fast, slow).astype(np.int8) - rolling.crossunder(
+            fast, slow
+        ).astype(np.int8)
+        assert rolling.sma_cross(np.array(PRICES), 2, 4).tolist() == expected.tolist()
+
+    def test_cross_matches_masks(self):
+        fast = np.array([np.nan, 1.0, 3.0, 3.0, 1.0, 2.0, 4.0])
+        slow = np.array([np.nan, 2.0, 2.0, 3.0, 3.0, 2.0, 2.0])
+        expected = rolling.crossover(fast, slow).astype(np.int8) - rolling.crossunder(
+            fast, slow
+        ).astype(np.int8)
+        assert rolling.cross(fast, slow).tolist() == expected.tolist()
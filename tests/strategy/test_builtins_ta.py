@@ -1,6 +1,6 @@
 """Tests for technical analysis built-in functions."""
 
-from decimal import Decimal
+from decimal import Context, Decimal
 
 import pytest
 
@@ -56,13 +56,27 @@ from finsaas.strategy.builtins.ta import (
 def _make_series(values, name="test"):
     """Helper: create a Series with committed values, last value as current."""
     s = Series(name=name)
-    for v in values[:-1]:
-        s.current = Decimal(str(v))
-        s.commit()
+    s.extend(Decimal(str(v)) for v in values[:-1])
     s.current = Decimal(str(values[-1]))
     return s
 
 
+def _call_every(every, indicator, bars=100, max_bars_back=30):
+    """Stream a deterministic walk and call `indicator(high, low, close)` on
+    every `every`-th bar and the last one; returns {bar: result}."""
+    high, low, close = (Series(max_bars_back=max_bars_back, name=n) for n in "hlc")
+    results = {}
+    for i in range(bars):
+        if i:
+            for s in (high, low, close):
+                s.commit()
+        c = Decimal(100 + (i * 7) % 11)
+        high.current, low.current, close.current = c + (i % 3), c - (i % 2), c
+        if i % every == 0 or i == bars - 1:
+            results[i] = indicator(high, low, close)
+    return results
+
+
 @pytest.fixture
 def price_series() -> Series[Decimal]:
     """A series with known values for testing indicators."""
@@ -74,9 +88,7 @@ def price_series() -> Series[Decimal]:
         Decimal("45.61"), Decimal("46.28"), Decimal("46.28"), Decimal("46.00"),
         Decimal("46.03"), Decimal("46.41"), Decimal("46.22"), Decimal("45.64"),
     ]
-    for v in values:
-        s.current = v
-        s.commit()
+    s.extend(values)
     return s
 
 
@@ -105,6 +117,17 @@ class TestSMA:
         result = sma(s, 10)
         assert result == Decimal("0")
 
+    def test_sma_rolling_across_bars(self):
+        s: Series[Decimal] = Series(name="test")
+        values = [Decimal(v) for v in ("10", "20", "30", "40", "50", "60")]
+        results = []
+        for i, v in enumerate(values):
+            if i:
+                s.commit()
+            s.current = v
+            results.append(sma(s, 3))
+        assert results[2:] == [Decimal("20"), Decimal("30"), Decimal("40"), Decimal("50")]
+
 
 class TestEMA:
     def test_ema_single_value(self):
@@ -123,6 +146,27 @@ class TestEMA:
         result = ema(s, 10)
         assert abs(result - Decimal("100")) < Decimal("1")
 
+    def test_ema_recursive_after_sma_seed(self):
+        """alpha = 2/3 for length 2; seed is the SMA of the first two bars."""
+        s: Series[Decimal] = Series(name="test")
+        results = []
+        for i, v in enumerate(("10", "20", "40", "10")):
+            if i:
+                s.commit()
+            s.current = Decimal(v)
+            results.append(ema(s, 2))
+        # 15, then 2/3 * 40 + 1/3 * 15 = 95/3, then 2/3 * 10 + 1/3 * 95/3 = 155/9
+        assert results[1] == Decimal("15")
+        assert abs(results[2] - Decimal(95) / Decimal(3)) < Decimal("1e-12")
+        assert abs(results[3] - Decimal(155) / Decimal(9)) < Decimal("1e-12")
+
+    @pytest.mark.parametrize("every", [7, 29])
+    def test_ema_sparse_calls_match_every_bar(self, every):
+        """Bars skipped between calls are folded in, also past max_bars_back."""
+        dense = _call_every(1, lambda high, low, close: ema(close, 5))
+        sparse = _call_every(every, lambda high, low, close: ema(close, 5))
+        assert sparse == {i: dense[i] for i in sparse}
+
 
 class TestRSI:
     def test_rsi_neutral_default(self):
@@ -145,12 +189,38 @@ class TestRSI:
         """RSI should be 100 when all changes are positive."""
         s: Series[Decimal] = Series(name="test")
         for i in range(20):
-            s.current = Decimal(str(100 + i))
+            s.current = Decimal(100 + i)
             s.commit()
         s.current = Decimal("120")
         result = rsi(s, 14)
         assert result == Decimal("100")
 
+    def test_rsi_wilder_smoothing(self):
+        s = _make_series([10, 12, 11, 13, 11])
+        # changes: +2, -1, +2, -2; seed (gain, loss) = (1, 0.5) from the first two,
+        # then Wilder: gain 1.5 -> 0.75, loss 0.25 -> 1.125; RS = 2/3 -> RSI 40
+        assert abs(rsi(s, 2) - Decimal("40")) < Decimal("0.0001")
+
+    def test_rsi_streaming_matches_fresh(self, price_series):
+        values = [Decimal("46.10"), Decimal("45.80"), Decimal("46.40")]
+        for v in values:
+            price_series.current = v
+            streamed = rsi(price_series, 14)
+            price_series.commit()
+        fresh: Series[Decimal] = Series(max_bars_back=100, name="close")
+        for i in range(len(price_series) - 1, 0, -1):
+            fresh.current = price_series[i]
+            fresh.commit()
+        fresh.current = values[-1]
+        assert rsi(fresh, 14) == streamed
+
+    @pytest.mark.parametrize("every", [7, 29])
+    def test_rsi_sparse_calls_match_every_bar(self, every):
+        """Changes skipped between calls are folded in, also past max_bars_back."""
+        dense = _call_every(1, lambda high, low, close: rsi(close, 5))
+        sparse = _call_every(every, lambda high, low, close: rsi(close, 5))
+        assert sparse == {i: dense[i] for i in sparse}
+
 
 class TestCrossover:
     def test_crossover_true(self):
@@ -217,6 +287,26 @@ class TestHighestLowest:
         result = lowest(s, 5)
         assert result == Decimal("3")
 
+    def test_highest_skips_na(self):
+        s: Series[Decimal] = Series(name="test")
+        s.commit()  # na bar
+        for v in [Decimal("4"), Decimal("7")]:
+            s.current = v
+            s.commit()
+        s.current = Decimal("2")
+        assert highest(s, 4) == Decimal("7")
+        assert lowest(s, 4) == Decimal("2")
+
+    def test_rolling_across_bars(self):
+        values = [5, 9, 2, 7, 7, 1, 8, 3, 6, 4, 9, 0]
+        s: Series[Decimal] = Series(name="test")
+        for i, v in enumerate(values):
+            s.current = Decimal(v)
+            window = values[max(0, i - 3) : i + 1]
+            assert highest(s, 4) == Decimal(max(window))
+            assert lowest(s, 4) == Decimal(min(window))
+            s.commit()
+
 
 class TestChange:
     def test_change_basic(self):
@@ -232,12 +322,62 @@ class TestBB:
     def test_bollinger_bands(self):
         s: Series[Decimal] = Series(name="test")
         for i in range(25):
-            s.current = Decimal(str(100 + i % 5))
+            s.current = Decimal(100 + i % 5)
             s.commit()
         s.current = Decimal("102")
         upper, middle, lower = bb(s, 20)
         assert upper > middle > lower
 
+    def test_bollinger_bands_match_sma_and_stdev(self):
+        s = _make_series([2, 4, 4, 4, 5, 5, 7, 9])
+        upper, middle, lower = bb(s, 8, Decimal("2"))
+        assert middle == sma(s, 8) == Decimal("5")
+        assert stdev(s, 8) == Decimal("2")
+        assert upper == Decimal("9")
+        assert lower == Decimal("1")
+
+    def test_bb_memoized_within_bar(self):
+        s = _make_series([2, 4, 4, 4, 5, 5, 7, 9])
+        first = bb(s, 8)
+        assert bb(s, 8) is first
+        s.current = Decimal("1")
+        assert bb(s, 8) != first
+
+
+class TestATR:
+    def test_atr_wilder_smoothing(self):
+        high = _make_series([12, 13, 14, 15])
+        low = _make_series([10, 10, 12, 11])
+        close = _make_series([11, 12, 13, 14])
+        # TR = 2, 3, 2, 4; seed mean(2, 3) = 2.5 -> (2.5 + 2) / 2 -> (2.25 + 4) / 2
+        assert atr(high, low, close, 2) == Decimal("3.125")
+
+    def test_atr_streaming_matches_fresh(self):
+        bars = [(12, 10, 11), (13, 10, 12), (14, 12, 13), (15, 11, 14), (16, 13, 15)]
+        high: Series[Decimal] = Series(name="high")
+        low: Series[Decimal] = Series(name="low")
+        close: Series[Decimal] = Series(name="close")
+        for h, lo, c in bars:
+            high.current, low.current, close.current = Decimal(h), Decimal(lo), Decimal(c)
+            streamed = atr(high, low, close, 3)
+            high.commit()
+            low.commit()
+            close.commit()
+        fresh = atr(
+            _make_series([b[0] for b in bars]),
+            _make_series([b[1] for b in bars]),
+            _make_series([b[2] for b in bars]),
+            3,
+        )
+        assert streamed == fresh
+
+    @pytest.mark.parametrize("every", [7, 29])
+    def test_atr_sparse_calls_match_every_bar(self, every):
+        """Bars skipped between calls are folded in, also past max_bars_back."""
+        dense = _call_every(1, lambda high, low, close: atr(high, low, close, 5))
+        sparse = _call_every(every, lambda high, low, close: atr(high, low, close, 5))
+        assert sparse == {i: dense[i] for i in sparse}
+
 
 # ── Faz 1 Tests ──────────────────────────────────────────────────────
 
@@ -257,6 +397,11 @@ class TestSMMA:
         result = smma(s, 1)
         assert result == Decimal("30")
 
+    def test_rma_recursion(self):
+        # Short history: the recursion starts from 0 over the last 4 bars
+        s = _make_series([10, 20, 30, 40, 50])
+        assert rma(s, 2) == Decimal("40")
+
 
 class TestCross:
     def test_cross_detects_crossover(self):
@@ -474,6 +619,26 @@ class TestDMI:
         result = dmi(high, low, close)
         assert len(result) == 3
 
+    def test_dmi_streaming_matches_fresh(self):
+        highs = [10, 12, 11, 14, 13, 15, 17, 16, 18, 21]
+        lows = [8, 9, 9, 11, 10, 12, 14, 13, 16, 18]
+        closes = [9, 11, 10, 13, 12, 14, 16, 15, 17, 20]
+        high, low, close = Series(name="h"), Series(name="l"), Series(name="c")
+        for i in range(len(closes)):
+            if i:
+                for s in (high, low, close):
+                    s.commit()
+            high.current = Decimal(highs[i])
+            low.current = Decimal(lows[i])
+            close.current = Decimal(closes[i])
+            fresh = dmi(
+                _make_series(highs[: i + 1]),
+                _make_series(lows[: i + 1]),
+                _make_series(closes[: i + 1]),
+                3,
+            )
+            assert dmi(high, low, close, 3) == fresh
+
 
 class TestLinreg:
     def test_linreg_perfect_line(self):
@@ -580,12 +745,37 @@ class TestOBV:
         result = obv(close, vol)
         assert result > Decimal("0")
 
+    def test_obv_counts_each_bar_once(self):
+        close = _make_series([100, 110, 105, 115])
+        vol = _make_series([1000, 2000, 1500, 2500])
+        # +2000 - 1500 + 2500
+        assert obv(close, vol) == Decimal("3000")
+
     def test_obv_all_down(self):
         close = _make_series([120, 110, 100])
         vol = _make_series([1000, 1000, 1000])
         result = obv(close, vol)
         assert result < Decimal("0")
 
+    @pytest.mark.parametrize("every", [1, 10, 100])
+    def test_obv_counts_buffered_bars_whatever_the_call_pattern(self, every):
+        closes = [(i * 7) % 11 for i in range(100)]
+        close: Series[Decimal] = Series(max_bars_back=30, name="close")
+        vol: Series[Decimal] = Series(max_bars_back=30, name="volume")
+        for i, c in enumerate(closes):
+            if i:
+                close.commit()
+                vol.commit()
+            close.current, vol.current = Decimal(c), Decimal(i + 1)
+            if (i + 1) % every == 0:
+                result = obv(close, vol)
+        # Bars 69..98 are buffered; the oldest of them has no previous close
+        expected = sum(
+            (i + 1) * ((closes[i] > closes[i - 1]) - (closes[i] < closes[i - 1]))
+            for i in range(70, 100)
+        )
+        assert result == expected
+
 
 class TestVWAP:
     def test_vwap_basic(self):
@@ -596,6 +786,41 @@ class TestVWAP:
         result = vwap(high, low, close, vol)
         assert result > Decimal("0")
 
+    def test_vwap_streaming(self):
+        high: Series[Decimal] = Series(name="high")
+        low: Series[Decimal] = Series(name="low")
+        close: Series[Decimal] = Series(name="close")
+        vol: Series[Decimal] = Series(name="volume")
+        for h, lo, c, v in [(12, 9, 9, 100), (15, 12, 12, 300), (18, 15, 15, 100)]:
+            high.current, low.current = Decimal(h), Decimal(lo)
+            close.current, vol.current = Decimal(c), Decimal(v)
+            result = vwap(high, low, close, vol)
+            for s in (high, low, close, vol):
+                s.commit()
+        # typical prices 10, 13, 16 -> (1000 + 3900 + 1600) / 500
+        assert result == Decimal("13")
+
+    @pytest.mark.parametrize("every", [1, 10, 100])
+    def test_vwap_covers_buffered_bars_whatever_the_call_pattern(self, every):
+        high: Series[Decimal] = Series(max_bars_back=30, name="high")
+        low: Series[Decimal] = Series(max_bars_back=30, name="low")
+        close: Series[Decimal] = Series(max_bars_back=30, name="close")
+        vol: Series[Decimal] = Series(max_bars_back=30, name="volume")
+        for i in range(100):
+            if i:
+                for s in (high, low, close, vol):
+                    s.commit()
+            c = 100 + (i * 7) % 11
+            high.current, low.current = Decimal(c + 1), Decimal(c - 1)
+            close.current, vol.current = Decimal(c), Decimal(i + 1)
+            if (i + 1) % every == 0:
+                result = vwap(high, low, close, vol)
+        # Typical price equals close; bars 69..99 are the buffer plus the current bar
+        bars = range(69, 100)
+        tp_v = sum((100 + (i * 7) % 11) * (i + 1) for i in bars)
+        # vwap divides at 18 significant digits
+        assert result == Context(prec=18).divide(tp_v, sum(i + 1 for i in bars))
+
     def test_vwap_zero_volume(self):
         high = _make_series([12, 14])
         low = _make_series([10, 11])
@@ -630,6 +855,27 @@ class TestCum:
         result = cum(s)
         assert result == Decimal("25")
 
+    def test_cum_streaming_matches_fresh(self):
+        values = [3, 1, 4, 1, 5, 9, 2, 6]
+        s: Series[Decimal] = Series(name="s")
+        for i, v in enumerate(values):
+            if i:
+                s.commit()
+            s.current = Decimal(v)
+            assert cum(s) == cum(_make_series(values[: i + 1])) == sum(values[: i + 1])
+
+    @pytest.mark.parametrize("every", [1, 8, 120])
+    def test_cum_counts_buffered_bars_whatever_the_call_pattern(self, every):
+        s: Series[Decimal] = Series(max_bars_back=50, name="s")
+        for i in range(120):
+            if i:
+                s.commit()
+            s.current = Decimal(i)
+            if (i + 1) % every == 0:
+                result = cum(s)
+        # The current bar plus the 50 buffered bars
+        assert result == sum(range(69, 120))
+
 
 # ── Faz 6 Tests ──────────────────────────────────────────────────────
 
@@ -761,6 +1007,16 @@ class TestMedian:
         s = _make_series([10])
         assert median(s, 5) == Decimal("0")
 
+    def test_median_rolling_across_bars(self):
+        values = [7, 1, 9, 4, 4, 8, 2, 6, 3, 5]
+        s: Series[Decimal] = Series(name="test")
+        for i, v in enumerate(values):
+            s.current = Decimal(v)
+            if i >= 3:
+                window = sorted(values[i - 3 : i + 1])
+                assert median(s, 4) == (Decimal(window[1]) + Decimal(window[2])) / 2
+            s.commit()
+
 
 class TestCorrelation:
     def test_correlation_perfect_positive(self):
@@ -796,6 +1052,10 @@ class TestHighestBars:
         s = _make_series([5, 10, 3])
         assert highestbars(s, 1) == 0
 
+    def test_highestbars_tie_prefers_most_recent(self):
+        s = _make_series([10, 4, 10, 6])
+        assert highestbars(s, 4) == -1
+
 
 class TestLowestBars:
     def test_lowestbars_basic(self):
@@ -873,7 +1133,7 @@ class TestValuewhen:
         src = Series(name="src")
         for c, v in [(False, 10), (True, 20), (False, 30)]:
             cond.current = c
-            src.current = Decimal(str(v))
+            src.current = Decimal(v)
             cond.commit()
             src.commit()
         cond.current = False
@@ -886,7 +1146,7 @@ class TestValuewhen:
         src = Series(name="src")
         for c, v in [(True, 10), (False, 20), (True, 30), (False, 40)]:
             cond.current = c
-            src.current = Decimal(str(v))
+            src.current = Decimal(v)
             cond.commit()
             src.commit()
         cond.current = False
@@ -12,7 +12,8 @@ from finsaas.engine.loop import EventLoop
 from finsaas.engine.slippage import ZeroSlippage
 from finsaas.strategy.base import Strategy
 from finsaas.strategy.parameters import IntParam, FloatParam, EnumParam, BoolParam
-from finsaas.strategy.registry import get_strategy, list_strategies
+from finsaas.core.errors import StrategyError
+from finsaas.strategy.registry import create_strategy, get_strategy, list_strategies
 
 
 class TestStrategyParameters:
@@ -58,6 +59,18 @@ class TestStrategyParameters:
         s = TestStrat4()
         assert s.threshold == Decimal("0.5")
 
+    def test_float_param_conversions(self):
+        class TestStrat4b(Strategy):
+            threshold = FloatParam(default=0.5)
+
+            def on_bar(self, ctx: BarContext) -> None:
+                pass
+
+        s = TestStrat4b()
+        for value, expected in [(0.1, "0.1"), (2, "2"), (Decimal("0.25"), "0.25"), ("1.5", "1.5")]:
+            s.threshold = value
+            assert str(s.threshold) == expected
+
     def test_enum_param(self):
         class TestStrat5(Strategy):
             mode = EnumParam(default="fast", choices=["fast", "slow", "auto"])
@@ -114,6 +127,32 @@ class TestStrategyRegistry:
         cls = get_strategy("RegisteredStrat")
         assert cls is RegisteredStrat
 
+    def test_create_strategy_sets_params(self):
+        class CreatedStrat(Strategy):
+            length = IntParam(default=14, min_val=1)
+
+            def on_bar(self, ctx: BarContext) -> None:
+                pass
+
+        s = create_strategy("CreatedStrat", length="20")
+        assert s.length == 20
+
+        with pytest.raises(StrategyError, match="no parameter 'lenght'"):
+            create_strategy("CreatedStrat", lenght=20)
+
+    def test_create_strategy_accepts_inherited_params(self):
+        class BaseStrat(Strategy):
+            fast = IntParam(default=3, min_val=1)
+
+            def on_bar(self, ctx: BarContext) -> None:
+                pass
+
+        class ChildStrat(BaseStrat):
+            slow = IntParam(default=5, min_val=1)
+
+        s = create_strategy("ChildStrat", fast=4, slow=9)
+        assert (s.fast, s.slow) == (4, 9)
+
 
 class TestStrategyExecution:
     def test_strategy_with_sma(self, sample_bars, symbol_info):
@@ -145,3 +184,20 @@ class TestStrategyExecution:
 
         # Should complete without errors
         assert len(loop.portfolio.equity_curve) == len(sample_bars)
+
+    def test_bind_exposes_context_series(self, sample_bars, symbol_info):
+        class BoundStrat(Strategy):
+            def on_bar(self, ctx: BarContext) -> None:
+                assert self.close is ctx.close
+                assert self.close.current == ctx.close.current
+
+        feed = InMemoryFeed(sample_bars, symbol="TEST", timeframe="1h")
+        loop = EventLoop(
+            feed=feed, symbol_info=symbol_info, timeframe=Timeframe.H1,
+            initial_capital=Decimal("10000"),
+            commission_model=ZeroCommission(), slippage_model=ZeroSlippage(),
+        )
+        strategy = BoundStrat()
+        loop.run(strategy)
+
+        assert strategy.volume is loop.context.volume